@@ -10,8 +10,16 @@ from typing import Any, ClassVar
 
 from django.contrib import admin
 from django.contrib.admin.options import InlineModelAdmin
+from django.contrib.admin.views.main import ORDER_VAR
+from django.db import transaction
+from django.db.models import F, QuerySet
+from django.forms import BaseFormSet, ModelForm
+from django.http import HttpRequest
 
+from apps.chords.catalog import bump_catalog_version
 from apps.chords.models import Chord, ChordPosition
+from apps.chords.selectors import filter_chords_by_similarity
+from apps.chords.services import ChordService
 
 
 class ChordPositionInline(admin.TabularInline):  # type: ignore[type-arg]
@@ -31,3 +39,59 @@ class ChordAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
     search_fields = ("title", "musical_title")
     ordering = ("order_in_note",)
     inlines: ClassVar[list[type[InlineModelAdmin[Any, Any]]]] = [ChordPositionInline]
+
+    def get_search_results(  # noqa: PLR6301
+        self, request: HttpRequest, queryset: QuerySet[Chord], search_term: str
+    ) -> tuple[QuerySet[Chord], bool]:
+        """Search titles by trigram similarity instead of `ILIKE '%...%'`.
+
+        Typos are tolerated and, on PostgreSQL, the trigram GIN indexes
+        are used instead of a scan of the table. Unless a column is sorted
+        by hand, the most similar chords come first.
+        """
+        if not search_term.strip():
+            return queryset, False
+        chords = filter_chords_by_similarity(queryset, query=search_term.strip())
+        if ORDER_VAR not in request.GET:
+            chords = chords.order_by(F("search_rank").desc(), *queryset.query.order_by)
+        return chords, False
+
+    def save_model(
+        self,
+        request: HttpRequest,
+        obj: Chord,
+        form: ModelForm[Chord],
+        change: bool,
+    ) -> None:
+        """Save a chord and increment its revision on change."""
+        if change:
+            obj.revision = F("revision") + 1
+        super().save_model(request, obj, form, change)
+        if change:
+            obj.refresh_from_db(fields=["revision"])
+
+    def save_related(
+        self,
+        request: HttpRequest,
+        form: ModelForm[Chord],
+        formsets: list[BaseFormSet[Any]],
+        change: bool,
+    ) -> None:
+        """Save inlines, repack positions and move the catalog to a new version."""
+        super().save_related(request, form, formsets, change)
+        ChordService.refresh_packed_positions(chord=form.instance)
+        transaction.on_commit(bump_catalog_version)
+
+    def delete_model(self, request: HttpRequest, obj: Chord) -> None:
+        """Delete a chord, leave a tombstone and move the catalog version."""
+        chord_id = obj.pk
+        super().delete_model(request, obj)
+        ChordService.record_deletions(chord_ids=[chord_id])
+        transaction.on_commit(bump_catalog_version)
+
+    def delete_queryset(self, request: HttpRequest, queryset: QuerySet[Chord]) -> None:
+        """Delete chords, leave tombstones and move the catalog version."""
+        chord_ids = list(queryset.values_list("pk", flat=True))
+        super().delete_queryset(request, queryset)
+        ChordService.record_deletions(chord_ids=chord_ids)
+        transaction.on_commit(bump_catalog_version)
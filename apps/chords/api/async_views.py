@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Async (ASGI-native) read views for the chords app.
+
+DRF views are synchronous, so under ASGI every request to `ChordViewSet`
+is handed over to a worker thread and back. The views below are coroutines
+that use the async ORM and cache APIs instead. They serve the compact JSON
+of the chord list and of one chord, the same document as `ChordViewSet`;
+content negotiation, pagination and sparse fieldsets stay with the DRF
+views. Requests are checked with `IsStaffOrReadOnly`, like the DRF views.
+"""
+
+from typing import Final
+
+from django.http import HttpRequest, HttpResponse, HttpResponseBase, JsonResponse
+from django.views.decorators.http import require_safe
+
+from apps.shared.conditional import (
+    get_http_precondition_response,
+    set_conditional_headers,
+)
+from apps.shared.permissions import IsStaffOrReadOnly
+
+from ..catalog import CatalogCache, aget_catalog_modified, aget_catalog_version
+from ..models import Chord
+from ..selectors import aget_chord_values, get_all_chords
+from .fast_output import (
+    CHORD_OUTPUT_VALUES,
+    abuild_chord_output,
+    dump_chord,
+    dump_chord_list,
+)
+
+JSON_CONTENT_TYPE: Final[str] = "application/json"
+
+_permission = IsStaffOrReadOnly()
+_chord_list_cache: CatalogCache[bytes] = CatalogCache(max_entries=1)
+
+
+@require_safe
+async def chord_list(request: HttpRequest) -> HttpResponseBase:
+    """List all chords.
+
+    The rendered list is cached per process until the catalog version
+    changes, like the list of `ChordViewSet`, and has the same ETag.
+
+    Args:
+        request (HttpRequest): The incoming request
+
+    Returns:
+        HttpResponseBase: The list of chords or 304 Not Modified
+    """
+    if not await _permission.ahas_permission(request):
+        return _forbidden()
+
+    etag = f"chords-{await aget_catalog_version()}"
+    last_modified = await aget_catalog_modified()
+    precondition_response = get_http_precondition_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if precondition_response is not None:
+        return precondition_response
+
+    content = await _chord_list_cache.aget_or_build("list", _build_list)
+    response = HttpResponse(content, content_type=JSON_CONTENT_TYPE)
+    set_conditional_headers(response, etag=etag, last_modified=last_modified)
+    return response
+
+
+@require_safe
+async def chord_detail(request: HttpRequest, pk: int) -> HttpResponseBase:
+    """Get a single chord.
+
+    The chord and its validators are read in one query.
+
+    Args:
+        request (HttpRequest): The incoming request
+        pk (int): The chord primary key
+
+    Returns:
+        HttpResponseBase: The chord, 304 Not Modified or 404 Not Found
+    """
+    if not await _permission.ahas_permission(request):
+        return _forbidden()
+
+    try:
+        row = await aget_chord_values(
+            chord_id=pk, columns=(*CHORD_OUTPUT_VALUES, "revision", "updated_at")
+        )
+    except Chord.DoesNotExist:
+        return JsonResponse({"detail": "Chord not found."}, status=404)
+
+    etag = f"chord-{pk}-{row['revision']}"
+    precondition_response = get_http_precondition_response(
+        request, etag=etag, last_modified=row["updated_at"]
+    )
+    if precondition_response is not None:
+        return precondition_response
+
+    (chord,) = await abuild_chord_output([row])
+    response = HttpResponse(dump_chord(chord), content_type=JSON_CONTENT_TYPE)
+    set_conditional_headers(response, etag=etag, last_modified=row["updated_at"])
+    return response
+
+
+async def _build_list() -> bytes:
+    """Render the whole chord list."""
+    rows = get_all_chords().values(*CHORD_OUTPUT_VALUES)
+    return dump_chord_list(await abuild_chord_output(rows))
+
+
+def _forbidden() -> JsonResponse:
+    """Build the response for a request that is not permitted."""
+    return JsonResponse(
+        {"detail": "You do not have permission to perform this action."},
+        status=403,
+    )
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""View of the autocomplete of chord names."""
+
+from rest_framework.permissions import AllowAny
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..autocomplete import get_autocomplete_index
+from .serializers import ChordAutocompleteQuerySerializer
+
+
+class ChordAutocompleteView(APIView):
+    """Suggestions of chord names for what the user is typing."""
+
+    permission_classes = (AllowAny,)
+
+    def get(self, request: Request) -> Response:  # noqa: PLR6301
+        """Suggest titles and musical titles that start with `?q=`.
+
+        Suggestions come from an in-process index of the current catalog
+        version, so no query is made once the index is built.
+
+        Args:
+            request (Request): The incoming request
+
+        Returns:
+            Response with at most `limit` suggestions and the ids of the
+            chords they name
+        """
+        query = ChordAutocompleteQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        suggestions = get_autocomplete_index().suggest(
+            query.validated_data["q"], query.validated_data["limit"]
+        )
+        return Response({"suggestions": suggestions})
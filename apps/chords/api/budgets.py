@@ -0,0 +1,253 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Performance budgets of the chords API, see `apps.shared.budgets`.
+
+Read endpoints answer from one query (the detail view from two, one of
+them for the validators). Write budgets are the current query counts, so
+any extra query fails the suite. Sizes are measured on compact JSON, and
+responses that grow with the catalog get a per-chord allowance.
+"""
+
+import json
+from typing import Final
+
+from apps.shared.budgets import EndpointBudget, register_budgets
+
+_POSITIONS: Final = [
+    {"string_number": string_number, "fret": fret, "finger": finger}
+    for string_number, fret, finger in (
+        (1, 0, 0),
+        (2, 1, 1),
+        (3, 2, 3),
+        (4, 2, 2),
+        (5, 0, 0),
+        (6, -1, 0),
+    )
+]
+_CHORD: Final = {
+    "title": "Asus2",
+    "musical_title": "A minor",
+    "order_in_note": 99,
+    "start_fret": 1,
+    "has_barre": False,
+    "positions": _POSITIONS,
+}
+_BULK_BODY: Final = "\n".join(
+    json.dumps(line)
+    for line in (
+        {**_CHORD, "order_in_note": 98},
+        {**_CHORD, "order_in_note": 99},
+        {"op": "delete", "title": "Asus2", "order_in_note": 98},
+    )
+)
+
+CHORD_BYTES: Final[int] = 400
+"""Allowed size of one chord in a response, with some headroom."""
+
+SPRITE_FRAME_BYTES: Final[int] = 80
+"""Allowed size of the coordinates of one chord in a sprite manifest."""
+
+CHORD_BUDGETS: Final[tuple[EndpointBudget, ...]] = (
+    EndpointBudget("api-root", "get", max_queries=0, max_bytes=200, staff=True),
+    EndpointBudget(
+        "chord-list", "get", max_queries=1, max_bytes=2, bytes_per_item=CHORD_BYTES
+    ),
+    EndpointBudget(
+        "chord-list",
+        "get",
+        max_queries=1,
+        max_bytes=200 + 50 * CHORD_BYTES,
+        query="page_size=50",
+    ),
+    EndpointBudget(
+        "chord-list",
+        "get",
+        max_queries=1,
+        max_bytes=2,
+        bytes_per_item=60,
+        query="fields=id,title,has_barre",
+    ),
+    EndpointBudget(
+        "chord-list",
+        "post",
+        max_queries=4,
+        max_bytes=CHORD_BYTES,
+        body=json.dumps(_CHORD),
+        staff=True,
+        status=201,
+    ),
+    EndpointBudget(
+        "chord-detail", "get", max_queries=2, max_bytes=CHORD_BYTES, url_kwargs=("pk",)
+    ),
+    EndpointBudget(
+        "chord-async-list",
+        "get",
+        max_queries=1,
+        max_bytes=2,
+        bytes_per_item=CHORD_BYTES,
+    ),
+    EndpointBudget(
+        "chord-async-detail",
+        "get",
+        max_queries=1,
+        max_bytes=CHORD_BYTES,
+        url_kwargs=("pk",),
+    ),
+    EndpointBudget(
+        "chord-detail",
+        "put",
+        max_queries=8,
+        max_bytes=CHORD_BYTES,
+        url_kwargs=("pk",),
+        body=json.dumps(_CHORD),
+        staff=True,
+    ),
+    EndpointBudget(
+        "chord-detail",
+        "patch",
+        max_queries=5,
+        max_bytes=CHORD_BYTES,
+        url_kwargs=("pk",),
+        body=json.dumps({"has_barre": True}),
+        staff=True,
+    ),
+    EndpointBudget(
+        "chord-detail",
+        "delete",
+        max_queries=6,
+        max_bytes=0,
+        url_kwargs=("pk",),
+        staff=True,
+        status=204,
+    ),
+    EndpointBudget(
+        "chord-bulk",
+        "post",
+        max_queries=12,
+        max_bytes=300,
+        body=_BULK_BODY,
+        content_type="application/x-ndjson",
+        staff=True,
+    ),
+    EndpointBudget(
+        "chord-shape",
+        "get",
+        max_queries=1,
+        max_bytes=2,
+        bytes_per_item=CHORD_BYTES,
+        query="q=x02210",
+    ),
+    EndpointBudget(
+        "chord-batch",
+        "get",
+        max_queries=1,
+        max_bytes=3 * CHORD_BYTES,
+        query="ids=3,1,2",
+    ),
+    EndpointBudget(
+        "chord-batch",
+        "get",
+        max_queries=1,
+        max_bytes=2,
+        bytes_per_item=CHORD_BYTES,
+        query="titles=G,Am,C",
+    ),
+    EndpointBudget(
+        "chord-diagram",
+        "get",
+        max_queries=1,
+        max_bytes=4000,
+        url_kwargs=("pk", "diagram_format"),
+    ),
+    EndpointBudget(
+        "chord-sprites",
+        "get",
+        max_queries=1,
+        max_bytes=500,
+        bytes_per_item=SPRITE_FRAME_BYTES,
+    ),
+    EndpointBudget(
+        "chord-sprites",
+        "get",
+        max_queries=1,
+        max_bytes=500,
+        bytes_per_item=SPRITE_FRAME_BYTES,
+        query="title=Am&image_format=webp",
+    ),
+    EndpointBudget(
+        "chord-sprite-sheet",
+        "get",
+        max_queries=0,
+        max_bytes=60_000,
+        url_kwargs=("sprite_key", "format"),
+    ),
+    EndpointBudget(
+        "chord-notes", "get", max_queries=1, max_bytes=2, bytes_per_item=CHORD_BYTES
+    ),
+    EndpointBudget(
+        "chord-notes",
+        "get",
+        max_queries=1,
+        max_bytes=2,
+        bytes_per_item=CHORD_BYTES,
+        query="title=Am",
+    ),
+    EndpointBudget(
+        "chord-identify",
+        "post",
+        max_queries=0,
+        max_bytes=1000,
+        body=json.dumps({"frets": [[-1, 0, 2, 2, 1, 0], [3, 2, 0, 0, 0, 3]]}),
+    ),
+    EndpointBudget(
+        "chord-transpose",
+        "post",
+        max_queries=0,
+        max_bytes=2000,
+        body=json.dumps({"frets": [[-1, 0, 2, 2, 1, 0], [3, 2, 0, 0, 0, 3]] * 2}),
+    ),
+    EndpointBudget(
+        "chord-export",
+        "get",
+        max_queries=2,
+        max_bytes=0,
+        bytes_per_item=CHORD_BYTES,
+        staff=True,
+    ),
+    EndpointBudget(
+        "chord-export",
+        "get",
+        max_queries=2,
+        max_bytes=100,
+        bytes_per_item=100,
+        query="export_format=csv",
+        staff=True,
+    ),
+    # The query builds the index of a catalog version, keystrokes make none
+    EndpointBudget(
+        "chord-autocomplete", "get", max_queries=1, max_bytes=1000, query="q=a"
+    ),
+    # One query on PostgreSQL; the SQLite of the suite reads the titles first
+    EndpointBudget(
+        "chord-search",
+        "get",
+        max_queries=2,
+        max_bytes=2,
+        bytes_per_item=CHORD_BYTES + 20,
+        query="q=Am",
+    ),
+    EndpointBudget(
+        "chord-voicings", "get", max_queries=0, max_bytes=5000, query="name=Am7"
+    ),
+    EndpointBudget(
+        "chord-changes",
+        "get",
+        max_queries=1,
+        max_bytes=100,
+        bytes_per_item=CHORD_BYTES,
+    ),
+)
+
+register_budgets(*CHORD_BUDGETS)
@@ -0,0 +1,318 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Streaming NDJSON bulk changes for the chords app.
+
+Every input line is a JSON object: an upsert (`"op": "upsert"`, the default)
+with the full chord data and an optional `id`, or a delete (`"op": "delete"`)
+with an `id` or a `title` and `order_in_note`. Lines are parsed one by one
+while the request body is read, collected into batches and applied by
+`ChordBulkService`. Every line gets one result line in the output, and the
+output ends with a summary line.
+
+The batches are applied while the response is streamed, after the view has
+returned, so every batch is its own transaction and its errors are reported
+in the output rather than as an error response:
+
+- A batch that fails is rolled back, and each of its lines gets an error.
+- If the body cannot be read, the lines that are not applied yet get an
+  error and the summary status is `aborted`.
+- If the client disconnects, the batches whose results were sent stay
+  committed and the rest of the body is not applied.
+
+A stream without the summary line was cut short; since upserts find their
+chords by id or by title and order, the lines after the last result can be
+sent again.
+"""
+
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from typing import Any, Literal, TypedDict, cast
+
+from django.db import DatabaseError
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+from ..services import (
+    ChordBulkOperationDict,
+    ChordBulkResultDict,
+    ChordBulkService,
+    ChordCreateDict,
+)
+from .serializers import ChordBulkDeleteSerializer, ChordBulkUpsertSerializer
+
+logger = logging.getLogger(__name__)
+
+
+class ChordBulkSummaryDict(TypedDict):
+    """Describe the last line of a bulk change output."""
+
+    status: Literal["complete", "aborted"]
+    lines: int
+    failed: int
+
+
+class ChordBulkLoader:
+    """Applies a stream of NDJSON lines in batches.
+
+    Results are written in the order of the input lines, after the batch
+    of the line is committed. A batch is also committed early when a line
+    refers to a chord that is already changed in the current batch.
+    """
+
+    batch_size_query_param = "batch_size"
+    batch_size = 500
+    max_batch_size = 5000
+
+    def __init__(self, batch_size: int | None = None) -> None:
+        """Create a loader.
+
+        Args:
+            batch_size (int | None): Number of lines per transaction.
+        """
+        if batch_size is not None:
+            self.batch_size = batch_size
+        self._operations: list[ChordBulkOperationDict] = []
+        self._errors: list[ChordBulkResultDict] = []
+        self._keys: set[tuple[Any, ...]] = set()
+        self._lines = 0
+        self._failed = 0
+
+    @classmethod
+    def from_request(cls, request: Request) -> "ChordBulkLoader":
+        """Create a loader with the batch size requested by the client.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            ChordBulkLoader: The loader.
+        """
+        try:
+            batch_size = int(request.query_params[cls.batch_size_query_param])
+        except (KeyError, ValueError):
+            return cls()
+        if batch_size <= 0:
+            return cls()
+        return cls(min(batch_size, cls.max_batch_size))
+
+    def run(self, lines: Iterable[bytes]) -> Iterator[bytes]:
+        """Apply all lines and yield the results as NDJSON.
+
+        Args:
+            lines (Iterable[bytes]): Input lines, read lazily.
+
+        Yields:
+            bytes: One result line per non-empty input line, then the summary.
+        """
+        status: Literal["complete", "aborted"] = "complete"
+        try:
+            yield from self._apply(lines)
+        except Exception:
+            logger.exception("Bulk chord change aborted")
+            status = "aborted"
+            yield from self._discard()
+        yield self._dump({
+            "status": status,
+            "lines": self._lines,
+            "failed": self._failed,
+        })
+
+    def _apply(self, lines: Iterable[bytes]) -> Iterator[bytes]:
+        """Parse the lines and apply them batch by batch.
+
+        Args:
+            lines (Iterable[bytes]): Input lines, read lazily.
+
+        Yields:
+            bytes: One result line per non-empty input line.
+        """
+        for number, raw in enumerate(lines, start=1):
+            if not raw.strip():
+                continue
+            self._lines += 1
+            try:
+                operation = self._parse(number, raw)
+            except ValidationError as e:
+                self._errors.append({
+                    "line": number,
+                    "status": "error",
+                    "errors": e.detail,  # type: ignore[typeddict-item]
+                })
+                continue
+            key = self._get_key(operation)
+            if key in self._keys:
+                yield from self._flush()
+            self._keys.add(key)
+            self._operations.append(operation)
+            if len(self._operations) >= self.batch_size:
+                yield from self._flush()
+        yield from self._flush()
+
+    @staticmethod
+    def _parse(line: int, raw: bytes) -> ChordBulkOperationDict:
+        """Parse and validate one line.
+
+        Args:
+            line (int): Line number.
+            raw (bytes): The line.
+
+        Returns:
+            ChordBulkOperationDict: The operation.
+
+        Raises:
+            ValidationError: If the line is invalid.
+        """
+        try:
+            data = json.loads(raw)
+        except ValueError as e:
+            raise ValidationError({"detail": ["Invalid JSON."]}) from e
+        if not isinstance(data, dict):
+            raise ValidationError({"detail": ["Expected a JSON object."]})
+
+        op = data.pop("op", "upsert")
+        if op == "delete":
+            return ChordBulkLoader._parse_delete(line, data)
+        if op != "upsert":
+            raise ValidationError({"op": [f'Unknown operation "{op}".']})
+        return ChordBulkLoader._parse_upsert(line, data)
+
+    @staticmethod
+    def _parse_delete(line: int, data: dict[str, Any]) -> ChordBulkOperationDict:
+        """Validate a delete line.
+
+        Args:
+            line (int): Line number.
+            data (dict[str, Any]): The decoded line.
+
+        Returns:
+            ChordBulkOperationDict: The delete operation.
+        """
+        serializer = ChordBulkDeleteSerializer(data=data)
+        serializer.is_valid(raise_exception=True)
+        attrs = serializer.validated_data
+        return {
+            "line": line,
+            "op": "delete",
+            "id": attrs.get("id"),
+            "title": attrs.get("title"),
+            "order_in_note": attrs.get("order_in_note"),
+            "chord_fields": None,
+            "positions": None,
+        }
+
+    @staticmethod
+    def _parse_upsert(line: int, data: dict[str, Any]) -> ChordBulkOperationDict:
+        """Validate an upsert line.
+
+        Args:
+            line (int): Line number.
+            data (dict[str, Any]): The decoded line.
+
+        Returns:
+            ChordBulkOperationDict: The upsert operation.
+        """
+        serializer = ChordBulkUpsertSerializer(data=data)
+        serializer.is_valid(raise_exception=True)
+        attrs = dict(serializer.validated_data)
+        chord_id = attrs.pop("id", None)
+        positions = attrs.pop("positions")
+        return {
+            "line": line,
+            "op": "upsert",
+            "id": chord_id,
+            "title": attrs["title"],
+            "order_in_note": attrs["order_in_note"],
+            "chord_fields": cast(ChordCreateDict, attrs),
+            "positions": positions,
+        }
+
+    @staticmethod
+    def _get_key(operation: ChordBulkOperationDict) -> tuple[Any, ...]:
+        """Get the key an operation finds its chord by.
+
+        Args:
+            operation (ChordBulkOperationDict): The operation.
+
+        Returns:
+            tuple: The id or the `(title, order_in_note)` key.
+        """
+        if operation["id"] is not None:
+            return ("id", operation["id"])
+        return ("key", operation["title"], operation["order_in_note"])
+
+    def _flush(self) -> Iterator[bytes]:
+        """Apply the current batch and yield the results of its lines.
+
+        Yields:
+            bytes: Result lines ordered by line number.
+        """
+        results = self._errors
+        if self._operations:
+            try:
+                results += ChordBulkService.apply_batch(operations=self._operations)
+            except DatabaseError as e:
+                results += self._fail_operations(f"Batch failed: {e}")
+            except Exception:
+                logger.exception("Bulk chord batch failed")
+                results += self._fail_operations("Batch failed.")
+        yield from self._write(results)
+
+    def _discard(self) -> Iterator[bytes]:
+        """Report the lines of the current batch as not applied.
+
+        Yields:
+            bytes: Result lines ordered by line number.
+        """
+        results = self._errors + self._fail_operations(
+            "Not applied: the bulk change was aborted."
+        )
+        yield from self._write(results)
+
+    def _fail_operations(self, message: str) -> list[ChordBulkResultDict]:
+        """Build error results for the operations of the current batch.
+
+        Args:
+            message (str): The error message.
+
+        Returns:
+            list[ChordBulkResultDict]: One error per operation.
+        """
+        return [
+            {
+                "line": operation["line"],
+                "status": "error",
+                "errors": {"detail": [message]},
+            }
+            for operation in self._operations
+        ]
+
+    def _write(self, results: list[ChordBulkResultDict]) -> Iterator[bytes]:
+        """Start a new batch and yield the results of the previous one.
+
+        Args:
+            results (list[ChordBulkResultDict]): Results of the batch.
+
+        Yields:
+            bytes: Result lines ordered by line number.
+        """
+        self._operations = []
+        self._errors = []
+        self._keys = set()
+        self._failed += sum(result["status"] == "error" for result in results)
+        for result in sorted(results, key=lambda r: r["line"]):
+            yield self._dump(result)
+
+    @staticmethod
+    def _dump(record: ChordBulkResultDict | ChordBulkSummaryDict) -> bytes:
+        """Encode one output record as an NDJSON line.
+
+        Args:
+            record (ChordBulkResultDict | ChordBulkSummaryDict): The record.
+
+        Returns:
+            bytes: The line.
+        """
+        return json.dumps(record, ensure_ascii=False).encode() + b"\n"
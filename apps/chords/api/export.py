@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Streaming export of the whole chord catalog as NDJSON or CSV.
+
+The catalog is read with `.iterator()` in chunks of `chunk_size` rows and
+every chunk is turned into output and yielded before the next one is read,
+so memory use depends on the chunk size, not on the size of the catalog.
+Positions come from the packed column; chords without packed positions get
+them in one query per chunk.
+
+NDJSON lines are chords in the `ChordOutputSerializer` format. CSV rows
+have the `CSV_COLUMNS`, with the positions packed by `pack_positions`.
+"""
+
+import csv
+import itertools
+from collections.abc import Iterator
+from typing import Final, Literal
+
+from ..packing import pack_positions
+from ..selectors import get_all_chords
+from .fast_output import (
+    CHORD_OUTPUT_VALUES,
+    ChordOutputDict,
+    build_chord_output,
+    dump_chord,
+)
+
+type ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_CHUNK_SIZE: Final[int] = 2000
+"""Number of chords read and written at a time."""
+
+EXPORT_CONTENT_TYPES: Final[dict[ExportFormat, str]] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+"""Content type of every export format."""
+
+CSV_COLUMNS: Final[tuple[str, ...]] = (
+    "id",
+    "title",
+    "musical_title",
+    "order_in_note",
+    "start_fret",
+    "has_barre",
+    "positions",
+)
+"""Header of the CSV export."""
+
+
+class _Echo:
+    """File-like object that returns what is written, for `csv.writer`."""
+
+    def write(self, value: str) -> str:  # noqa: PLR6301
+        """Return the formatted line instead of writing it."""
+        return value
+
+
+def export_chords(
+    export_format: ExportFormat, *, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Export all chords in the `get_all_chords` order.
+
+    Args:
+        export_format (ExportFormat): `ndjson` or `csv`.
+        chunk_size (int): Number of chords read and written at a time.
+
+    Yields:
+        bytes: The export, one chunk of chords at a time; the CSV header
+            comes first.
+    """
+    if export_format == "csv":
+        yield from _export_csv(chunk_size)
+        return
+    for chords in _iter_chunks(chunk_size):
+        yield b"".join(dump_chord(chord) + b"\n" for chord in chords)
+
+
+def _export_csv(chunk_size: int) -> Iterator[bytes]:
+    """Export all chords as CSV, one chunk at a time."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CSV_COLUMNS).encode()
+    for chords in _iter_chunks(chunk_size):
+        lines = (
+            writer.writerow((
+                chord["id"],
+                chord["title"],
+                chord["musical_title"],
+                chord["order_in_note"],
+                chord["start_fret"],
+                "true" if chord["has_barre"] else "false",
+                pack_positions(chord["positions"]),
+            ))
+            for chord in chords
+        )
+        yield "".join(lines).encode()
+
+
+def _iter_chunks(chunk_size: int) -> Iterator[list[ChordOutputDict]]:
+    """Read all chords in chunks, with the positions of every chunk."""
+    rows = get_all_chords().values(*CHORD_OUTPUT_VALUES).iterator(chunk_size=chunk_size)
+    for chunk in itertools.batched(rows, chunk_size):
+        yield build_chord_output(chunk)
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""View of the streaming export of the chord catalog."""
+
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from .export import EXPORT_CONTENT_TYPES, export_chords
+from .serializers import ChordExportQuerySerializer
+
+
+class ChordExportView(APIView):
+    """The whole catalog as one NDJSON or CSV download (admin only)."""
+
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request: Request) -> StreamingHttpResponse:  # noqa: PLR6301
+        """Stream the export, `?export_format=csv` for CSV instead of NDJSON.
+
+        Args:
+            request (Request): The incoming request
+
+        Returns:
+            StreamingHttpResponse with the chords, read and sent in chunks
+        """
+        query = ChordExportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        export_format = query.validated_data["export_format"]
+        return StreamingHttpResponse(
+            export_chords(export_format),
+            content_type=EXPORT_CONTENT_TYPES[export_format],
+            headers={
+                "Content-Disposition": f'attachment; filename="chords.{export_format}"'
+            },
+        )
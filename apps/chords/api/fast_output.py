@@ -0,0 +1,286 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Fast output path for chords based on pydantic-core.
+
+`ChordOutputSerializer` goes through DRF field introspection and a
+`to_representation` call per field of every chord. The functions below take
+plain `.values()` rows instead and dump them with pydantic `TypeAdapter`s,
+producing exactly the bytes `JSONRenderer` renders for the DRF serializer.
+"""
+
+import functools
+import itertools
+from collections.abc import AsyncIterable, Collection, Iterable
+from typing import Any, Final, TypedDict, cast
+
+from pydantic import TypeAdapter
+
+from apps.chords.packing import (
+    PACKED_POSITION_LENGTH,
+    PackedPositionDict,
+    unpack_positions,
+)
+from apps.chords.selectors import (
+    aget_positions_by_chord_ids,
+    get_positions_by_chord_ids,
+)
+
+CHORD_OUTPUT_VALUES: Final[tuple[str, ...]] = (
+    "id",
+    "title",
+    "musical_title",
+    "order_in_note",
+    "start_fret",
+    "has_barre",
+    "packed_positions",
+)
+"""Columns to select with `.values()` for `build_chord_output`."""
+
+
+class ChordOutputDict(TypedDict):
+    """Describe one chord in the `ChordOutputSerializer` format."""
+
+    id: int
+    title: str
+    musical_title: str
+    order_in_note: int
+    start_fret: int
+    has_barre: bool
+    positions: list[PackedPositionDict]
+
+
+class ChordPageDict(TypedDict):
+    """Describe one page of chords in the `ChordKeysetPagination` format."""
+
+    next: str | None
+    results: list[ChordOutputDict]
+
+
+class ChordGroupDict(TypedDict):
+    """Describe the chords of one title (note), in display order."""
+
+    title: str
+    chords: list[ChordOutputDict]
+
+
+_chord_adapter = TypeAdapter(ChordOutputDict)
+_chord_list_adapter = TypeAdapter(list[ChordOutputDict])
+_chord_page_adapter = TypeAdapter(ChordPageDict)
+_chord_groups_adapter = TypeAdapter(list[ChordGroupDict])
+
+# JSONRenderer escapes these two characters, which are valid in JSON but not
+# in JavaScript string literals; pydantic-core writes them as they are.
+_JS_ESCAPES: Final[tuple[tuple[bytes, bytes], ...]] = (
+    ("\u2028".encode(), b"\\u2028"),
+    ("\u2029".encode(), b"\\u2029"),
+)
+
+
+def build_chord_output(
+    rows: Iterable[dict[str, Any]], fields: Collection[str] | None = None
+) -> list[ChordOutputDict]:
+    """Turn `.values()` rows into chords in the output format.
+
+    Positions are unpacked from the packed column. Chords without packed
+    positions get them from the ChordPosition rows in one extra query.
+
+    Args:
+        rows (Iterable[dict[str, Any]]): Rows with the `CHORD_OUTPUT_VALUES`
+            columns, or the `get_chord_columns(fields)` ones.
+        fields (Collection[str] | None): Fields to output, in the output
+            order, None for all of them.
+
+    Returns:
+        list[ChordOutputDict]: Chords in the order of the rows. With
+            `fields`, the dicts only have the requested keys.
+    """
+    if fields is not None:
+        return _build_sparse_chord_output(rows, fields)
+    chords, unpacked_ids = _convert_rows(rows)
+    if unpacked_ids:
+        _fill_positions(chords, get_positions_by_chord_ids(chord_ids=unpacked_ids))
+    return chords
+
+
+async def abuild_chord_output(
+    rows: AsyncIterable[dict[str, Any]] | Iterable[dict[str, Any]],
+) -> list[ChordOutputDict]:
+    """Turn `.values()` rows into chords, the async version.
+
+    Args:
+        rows (AsyncIterable[dict[str, Any]] | Iterable[dict[str, Any]]): Rows
+            with the `CHORD_OUTPUT_VALUES` columns, e.g. a queryset that is
+            iterated asynchronously, or rows already fetched.
+
+    Returns:
+        list[ChordOutputDict]: Chords in the order of the rows.
+    """
+    if isinstance(rows, AsyncIterable):
+        rows = [row async for row in rows]
+    chords, unpacked_ids = _convert_rows(rows)
+    if unpacked_ids:
+        positions = await aget_positions_by_chord_ids(chord_ids=unpacked_ids)
+        _fill_positions(chords, positions)
+    return chords
+
+
+def _convert_rows(
+    rows: Iterable[dict[str, Any]],
+) -> tuple[list[ChordOutputDict], list[int]]:
+    """Convert rows to chords, unpacking the packed positions.
+
+    Returns:
+        tuple[list[ChordOutputDict], list[int]]: The chords and the ids of
+            the chords without packed positions.
+    """
+    chords: list[ChordOutputDict] = []
+    unpacked_ids: list[int] = []
+    for row in rows:
+        packed = row["packed_positions"]
+        if not packed:
+            unpacked_ids.append(row["id"])
+        chords.append({
+            "id": row["id"],
+            "title": row["title"],
+            "musical_title": row["musical_title"],
+            "order_in_note": row["order_in_note"],
+            "start_fret": row["start_fret"],
+            "has_barre": row["has_barre"],
+            "positions": _unpack_positions(packed),
+        })
+    return chords, unpacked_ids
+
+
+def _fill_positions(
+    chords: list[ChordOutputDict], positions: dict[int, list[PackedPositionDict]]
+) -> None:
+    """Set the positions of the chords that have none from the rows."""
+    for chord in chords:
+        if not chord["positions"]:
+            chord["positions"] = positions.get(chord["id"], [])
+
+
+def _build_sparse_chord_output(
+    rows: Iterable[dict[str, Any]], fields: Collection[str]
+) -> list[ChordOutputDict]:
+    """Turn `.values()` rows into chords with only some of the fields.
+
+    Args:
+        rows (Iterable[dict[str, Any]]): Rows with the
+            `get_chord_columns(fields)` columns.
+        fields (Collection[str]): Fields to output, in the output order.
+
+    Returns:
+        list[ChordOutputDict]: Partial chords in the order of the rows.
+    """
+    keys = [field for field in fields if field != "positions"]
+    with_positions = "positions" in fields
+    chords: list[dict[str, Any]] = []
+    unpacked: dict[int, dict[str, Any]] = {}
+    for row in rows:
+        chord = {key: row[key] for key in keys}
+        if with_positions:
+            chord["positions"] = _unpack_positions(row["packed_positions"])
+            if not chord["positions"]:
+                unpacked[row["id"]] = chord
+        chords.append(chord)
+
+    if unpacked:
+        positions = get_positions_by_chord_ids(chord_ids=unpacked)
+        for chord_id, chord in unpacked.items():
+            chord["positions"] = positions.get(chord_id, [])
+    return cast(list[ChordOutputDict], chords)
+
+
+def group_chord_output(chords: Iterable[ChordOutputDict]) -> list[ChordGroupDict]:
+    """Group chords ordered by title into one group per title.
+
+    Args:
+        chords (Iterable[ChordOutputDict]): Chords ordered by title.
+
+    Returns:
+        list[ChordGroupDict]: Groups in the order of the chords.
+    """
+    return [
+        {"title": title, "chords": list(group)}
+        for title, group in itertools.groupby(chords, key=lambda c: c["title"])
+    ]
+
+
+def dump_chord(chord: ChordOutputDict) -> bytes:
+    """Render one chord to JSON.
+
+    Args:
+        chord (ChordOutputDict): Chord built by `build_chord_output`.
+
+    Returns:
+        bytes: The same document `JSONRenderer` renders for the chord.
+    """
+    return _escape_for_javascript(_chord_adapter.dump_json(chord))
+
+
+def dump_chord_list(chords: list[ChordOutputDict]) -> bytes:
+    """Render a list of chords to JSON.
+
+    Args:
+        chords (list[ChordOutputDict]): Chords built by `build_chord_output`.
+
+    Returns:
+        bytes: The same document `JSONRenderer` renders for the list.
+    """
+    return _escape_for_javascript(_chord_list_adapter.dump_json(chords))
+
+
+def dump_chord_page(next_link: str | None, chords: list[ChordOutputDict]) -> bytes:
+    """Render one page of chords to JSON.
+
+    Args:
+        next_link (str | None): URL of the next page.
+        chords (list[ChordOutputDict]): Chords built by `build_chord_output`.
+
+    Returns:
+        bytes: The same document `JSONRenderer` renders for the page.
+    """
+    page: ChordPageDict = {"next": next_link, "results": chords}
+    return _escape_for_javascript(_chord_page_adapter.dump_json(page))
+
+
+def dump_chord_groups(groups: list[ChordGroupDict]) -> bytes:
+    """Render groups of chords to JSON.
+
+    Args:
+        groups (list[ChordGroupDict]): Groups built by `group_chord_output`.
+
+    Returns:
+        bytes: The same document `JSONRenderer` renders for the groups.
+    """
+    return _escape_for_javascript(_chord_groups_adapter.dump_json(groups))
+
+
+def _unpack_positions(packed: str) -> list[PackedPositionDict]:
+    """Unpack chord positions, reusing one dict per distinct position.
+
+    There are only a few hundred distinct packed positions, so decoding
+    each of them once is much cheaper than `unpack_positions` per chord.
+    The dicts are shared and must not be changed.
+    """
+    return [
+        _decode_position(packed[i : i + PACKED_POSITION_LENGTH])
+        for i in range(0, len(packed), PACKED_POSITION_LENGTH)
+    ]
+
+
+@functools.cache
+def _decode_position(code: str) -> PackedPositionDict:
+    """Decode one packed position."""
+    return unpack_positions(code)[0]
+
+
+def _escape_for_javascript(content: bytes) -> bytes:
+    """Escape line separators the same way `JSONRenderer` does."""
+    for character, escaped in _JS_ESCAPES:
+        if character in content:
+            content = content.replace(character, escaped)
+    return content
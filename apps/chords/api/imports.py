@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Streaming reader of chord import files.
+
+An import file is NDJSON, with one chord per line in the
+`ChordCreateUpdateSerializer` input format, or CSV with the
+`apps.chords.api.export.CSV_COLUMNS` and packed positions, so both export
+formats can be imported. The `id` of a chord is ignored, imported chords
+are always new.
+
+Lines are read lazily and validated in batches by one shared
+`ChordCreateUpdateSerializer`, with the rules of the API, including
+`validate_positions`. Invalid lines are reported with their errors and
+left out of the batch.
+"""
+
+import csv
+import itertools
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any, Final, Literal, TypedDict, cast
+
+from rest_framework.exceptions import ValidationError
+
+from ..packing import unpack_positions
+from ..services import ChordCreateDict, ChordImportDict
+from .serializers import ChordCreateUpdateSerializer
+
+type ImportFormat = Literal["ndjson", "csv"]
+
+IMPORT_BATCH_SIZE: Final[int] = 5000
+"""Number of lines validated and written at a time."""
+
+
+class ChordImportErrorDict(TypedDict):
+    """Describe an invalid line of an import file."""
+
+    line: int
+    errors: Any
+
+
+class ChordImportBatchDict(TypedDict):
+    """Describe one batch of an import file."""
+
+    chords: list[ChordImportDict]
+    errors: list[ChordImportErrorDict]
+
+
+def read_import_batches(
+    lines: Iterable[str],
+    import_format: ImportFormat,
+    *,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> Iterator[ChordImportBatchDict]:
+    """Read and validate an import file in batches.
+
+    Args:
+        lines (Iterable[str]): Lines of the file, read lazily. A CSV file
+            must be opened with `newline=""`.
+        import_format (ImportFormat): `ndjson` or `csv`.
+        batch_size (int): Number of lines per batch.
+
+    Yields:
+        ChordImportBatchDict: Valid chords and invalid lines of a batch.
+    """
+    records = _read_csv(lines) if import_format == "csv" else _read_ndjson(lines)
+    serializer = ChordCreateUpdateSerializer()
+    for chunk in itertools.batched(records, batch_size):
+        batch: ChordImportBatchDict = {"chords": [], "errors": []}
+        for line, record in chunk:
+            try:
+                attrs = _validate(serializer, record)
+            except ValidationError as e:
+                batch["errors"].append({"line": line, "errors": e.detail})
+                continue
+            positions = attrs.pop("positions")
+            batch["chords"].append({
+                "chord_fields": cast(ChordCreateDict, attrs),
+                "positions": positions,
+            })
+        yield batch
+
+
+def _validate(serializer: ChordCreateUpdateSerializer, record: Any) -> dict[str, Any]:  # noqa: ANN401
+    """Validate one decoded line, or raise the error found while decoding it."""
+    if isinstance(record, ValidationError):
+        raise record
+    return dict(serializer.run_validation(record))
+
+
+def _read_ndjson(lines: Iterable[str]) -> Iterator[tuple[int, Any]]:
+    """Decode NDJSON lines, an invalid line gives its error instead."""
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line)
+        except ValueError:
+            yield number, ValidationError({"detail": ["Invalid JSON."]})
+
+
+def _read_csv(lines: Iterable[str]) -> Iterator[tuple[int, Any]]:
+    """Decode CSV rows with the export columns, unpacking the positions."""
+    reader = csv.DictReader(lines)
+    for row in reader:
+        try:
+            positions = unpack_positions(row.get("positions") or "")
+        except (ValueError, IndexError):
+            error = {"positions": ["Invalid packed positions."]}
+            yield reader.line_num, ValidationError(error)
+            continue
+        yield reader.line_num, {**row, "positions": positions}
@@ -0,0 +1,227 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Pagination for the chords app."""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+from apps.chords.models import Chord
+
+type ChordCursor = tuple[str, int, int]
+
+
+class ChordKeysetPagination(BasePagination):
+    """Opt-in keyset pagination over `(title, order_in_note, id)`.
+
+    Pagination is enabled only when the `cursor` or the `page_size` query
+    parameter is present, so the plain list keeps its format. Each page is
+    a range scan that starts right after the last row of the previous page,
+    so every page costs the same regardless of its position.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 100
+    max_page_size = 500
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self) -> None:
+        """Create a paginator without a current page."""
+        self.request: Request | None = None
+        self.next_cursor: ChordCursor | None = None
+
+    def is_requested(self, request: Request) -> bool:
+        """Check if the client asked for a paginated response.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            bool: True if any of the pagination query parameters is present.
+        """
+        return (
+            self.cursor_query_param in request.query_params
+            or self.page_size_query_param in request.query_params
+        )
+
+    def paginate_queryset[RowT](
+        self,
+        queryset: QuerySet[Any, RowT] | Sequence[RowT],
+        request: Request,
+        view: APIView | None = None,
+    ) -> list[RowT] | None:
+        """Get one page of chords.
+
+        The queryset may yield model instances or `.values()` rows, as long
+        as the rows have the `title`, `order_in_note` and `id` keys.
+
+        Args:
+            queryset (QuerySet[Any, RowT] | Sequence[RowT]): Chords ordered
+                by the keyset columns.
+            request (Request): The incoming request.
+            view (APIView | None): The view that paginates the queryset.
+
+        Returns:
+            list[RowT] | None: Rows of the page, or None if the client did not
+                ask for pagination.
+
+        Raises:
+            TypeError: If the chords are not a queryset, which keyset
+                pagination needs to filter.
+        """
+        if not self.is_requested(request):
+            return None
+        if not isinstance(queryset, QuerySet):
+            raise TypeError("Keyset pagination needs a queryset")
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            queryset = self.filter_after_cursor(queryset, cursor)
+
+        rows = list(queryset[: page_size + 1])
+        page = rows[:page_size]
+        self.next_cursor = None
+        if len(rows) > page_size:
+            self.next_cursor = self.get_row_cursor(page[-1])
+        return page
+
+    @staticmethod
+    def get_row_cursor(row: object) -> ChordCursor:
+        """Get the keyset values of a row.
+
+        Args:
+            row (object): A `Chord` or a `.values()` row of one.
+
+        Returns:
+            ChordCursor: The keyset values of the row.
+
+        Raises:
+            TypeError: If the row is neither a chord nor a dict.
+        """
+        if isinstance(row, Chord):
+            return row.title, row.order_in_note, row.pk
+        if isinstance(row, dict):
+            return row["title"], row["order_in_note"], row["id"]
+        raise TypeError(row)
+
+    @staticmethod
+    def filter_after_cursor[RowT](
+        queryset: QuerySet[Any, RowT], cursor: ChordCursor
+    ) -> QuerySet[Any, RowT]:
+        """Keep only the rows that come after the cursor.
+
+        The OR of the keyset comparisons alone is not sargable, so the
+        `title__gte` conjunct gives the planner a range to start the
+        `chord_keyset_idx` scan from.
+
+        Args:
+            queryset (QuerySet[Any, RowT]): Chords ordered by the keyset
+                columns.
+            cursor (ChordCursor): Keyset values of the last row of a page.
+
+        Returns:
+            QuerySet[Any, RowT]: Chords after the cursor.
+        """
+        title, order_in_note, chord_id = cursor
+        return queryset.filter(
+            Q(title__gte=title)
+            & (
+                Q(title__gt=title)
+                | Q(title=title, order_in_note__gt=order_in_note)
+                | Q(title=title, order_in_note=order_in_note, id__gt=chord_id)
+            )
+        )
+
+    def get_paginated_response(self, data: Any) -> Response:  # noqa: ANN401
+        """Wrap the page data with the link to the next page.
+
+        Args:
+            data (Any): Serialized chords of the page.
+
+        Returns:
+            Response: The page with the `next` link.
+        """
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_next_link(self) -> str | None:
+        """Build the URL of the next page.
+
+        Returns:
+            str | None: Absolute URL of the next page, or None on the last page.
+        """
+        if self.request is None or self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_cursor)
+        )
+
+    def get_page_size(self, request: Request) -> int:
+        """Get the page size requested by the client.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            int: Page size limited by `max_page_size`.
+        """
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def decode_cursor(self, request: Request) -> ChordCursor | None:
+        """Decode the cursor from the request.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            ChordCursor | None: Keyset values of the last row of the previous
+                page, or None for the first page.
+
+        Raises:
+            NotFound: If the cursor is malformed.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode("ascii"))
+            title, order_in_note, chord_id = json.loads(raw)
+            if not isinstance(title, str):
+                raise TypeError(title)
+            return title, int(order_in_note), int(chord_id)
+        except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+            raise NotFound(self.invalid_cursor_message) from e
+
+    @staticmethod
+    def encode_cursor(cursor: ChordCursor) -> str:
+        """Encode keyset values into an opaque cursor.
+
+        Args:
+            cursor (ChordCursor): Keyset values of the last row of a page.
+
+        Returns:
+            str: URL-safe cursor string.
+        """
+        raw = json.dumps(cursor, ensure_ascii=False, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode("ascii")
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Renderers for the chords app."""
+
+from collections.abc import Mapping
+from typing import Any
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from ..binary import encode_chords
+
+
+class RenderedJSON(bytes):
+    """JSON document that is already rendered, e.g. by `fast_output`."""
+
+
+class ChordJSONRenderer(JSONRenderer):
+    """JSONRenderer that sends pre-rendered JSON documents as they are."""
+
+    def render(
+        self,
+        data: Any,  # noqa: ANN401
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        """Render data to JSON, passing `RenderedJSON` through.
+
+        Args:
+            data (Any): Response data.
+            accepted_media_type (str | None): The negotiated media type.
+            renderer_context (Mapping[str, Any] | None): Context of the view.
+
+        Returns:
+            bytes: The JSON document.
+        """
+        if isinstance(data, RenderedJSON):
+            return bytes(data)
+        return bytes(super().render(data, accepted_media_type, renderer_context))
+
+
+class ChordBinaryRenderer(BaseRenderer):
+    """Renderer of chords in the compact binary format of `binary`.
+
+    Only chord payloads can be rendered: a list, a page or one chord.
+    """
+
+    media_type = "application/vnd.guitar0.chords+binary"
+    format = "bin"
+    charset = None
+    render_style = "binary"
+
+    def render(  # noqa: PLR6301
+        self,
+        data: Any,  # noqa: ANN401
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        """Render chords to the binary format.
+
+        Args:
+            data (Any): Serialized chords, or None for an empty body.
+            accepted_media_type (str | None): The negotiated media type.
+            renderer_context (Mapping[str, Any] | None): Context of the view.
+
+        Returns:
+            bytes: The binary payload.
+        """
+        if data is None:
+            return b""
+        return encode_chords(data)
+
+
+class ChordDiagramRenderer(BaseRenderer):
+    """Renderer of chord diagrams and sprite sheets that are already rendered."""
+
+    charset = None
+    render_style = "binary"
+
+    def render(  # noqa: PLR6301
+        self,
+        data: Any,  # noqa: ANN401
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        """Send the diagram as it is.
+
+        Args:
+            data (Any): The rendered diagram, or None for an empty body.
+            accepted_media_type (str | None): The negotiated media type.
+            renderer_context (Mapping[str, Any] | None): Context of the view.
+
+        Returns:
+            bytes: The diagram.
+        """
+        if data is None:
+            return b""
+        return bytes(data)
+
+
+class ChordSVGRenderer(ChordDiagramRenderer):
+    """Renderer of SVG chord diagrams."""
+
+    media_type = "image/svg+xml"
+    format = "svg"
+
+
+class ChordPNGRenderer(ChordDiagramRenderer):
+    """Renderer of PNG chord diagrams."""
+
+    media_type = "image/png"
+    format = "png"
+
+
+class ChordWebPRenderer(ChordDiagramRenderer):
+    """Renderer of WebP sprite sheets of chord diagrams."""
+
+    media_type = "image/webp"
+    format = "webp"
@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""View of the fuzzy search of chords by title."""
+
+from rest_framework.permissions import AllowAny
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..selectors import search_chords
+from .fast_output import CHORD_OUTPUT_VALUES, build_chord_output
+from .serializers import ChordSearchQuerySerializer
+
+
+class ChordSearchView(APIView):
+    """Chords whose title or musical title looks like the query."""
+
+    permission_classes = (AllowAny,)
+
+    def get(self, request: Request) -> Response:  # noqa: PLR6301
+        """Search chords, e.g. `?q=A mnor`, tolerating typos.
+
+        Args:
+            request (Request): The incoming request
+
+        Returns:
+            Response with at most `limit` chords, the most similar first,
+            each with its `score` from 0 to 1
+        """
+        query = ChordSearchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        limit = query.validated_data["limit"]
+        chords = search_chords(query=query.validated_data["q"])[:limit]
+        rows = list(chords.values(*CHORD_OUTPUT_VALUES, "search_rank"))
+        results = build_chord_output(rows)
+        return Response([
+            {**chord, "score": round(row["search_rank"], 3)}
+            for chord, row in zip(results, rows, strict=True)
+        ])
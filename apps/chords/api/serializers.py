@@ -4,10 +4,34 @@
 
 """Serializers for the chords app."""
 
+from collections.abc import Collection
+from datetime import datetime
+from typing import Any, Final
+
 from rest_framework import serializers
 
-from apps.chords.constants import MAX_STRING_NUMBER
+from apps.chords.constants import (
+    MAX_AUTOCOMPLETE_SUGGESTIONS,
+    MAX_BATCH_CHORDS,
+    MAX_FRET,
+    MAX_IDENTIFY_SHAPES,
+    MAX_SEARCH_RESULTS,
+    MAX_STRING_NUMBER,
+    MAX_TRANSPOSE_CHORDS,
+    MAX_TRANSPOSE_SEMITONES,
+    MAX_VOICING_STRETCH,
+    MAX_VOICINGS,
+    MIN_FRET,
+)
 from apps.chords.models import Chord, ChordPosition
+from apps.chords.packing import unpack_positions
+from apps.chords.shapes import normalize_shape_pattern
+from apps.chords.sync import decode_sync_token
+from apps.chords.theory import parse_chord_name
+from apps.chords.voicings import DEFAULT_MAX_STRETCH
+
+_MAX_TITLE_LENGTH: Final[int] = 50
+"""Maximum length of `Chord.title`."""
 
 
 class ChordPositionSerializer(serializers.ModelSerializer[ChordPosition]):
@@ -18,6 +42,32 @@ class ChordPositionSerializer(serializers.ModelSerializer[ChordPosition]):
         fields = ("string_number", "fret", "finger")
 
 
+class PackedPositionsField(serializers.Field):  # type: ignore[type-arg]
+    """Read-only field that serves chord positions from the packed column.
+
+    Falls back to the ChordPosition rows for chords without packed positions.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Bind the field to the whole chord instance."""
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value: Chord) -> list[Any]:  # noqa: PLR6301
+        """Unpack the positions of the chord.
+
+        Args:
+            value (Chord): The chord instance.
+
+        Returns:
+            list: Positions in the ChordPositionSerializer format.
+        """
+        if value.packed_positions:
+            return list(unpack_positions(value.packed_positions))
+        return list(ChordPositionSerializer(value.positions.all(), many=True).data)
+
+
 class ChordCreateUpdateSerializer(serializers.ModelSerializer[Chord]):
     """Input serializer."""
 
@@ -50,10 +100,69 @@ class ChordCreateUpdateSerializer(serializers.ModelSerializer[Chord]):
 class ChordOutputSerializer(serializers.ModelSerializer[Chord]):
     """Output serializer.
 
-    Used for reading data
+    Used for reading data. The `fields` argument limits the output to
+    some of the fields, in the `Meta.fields` order.
+    """
+
+    positions = PackedPositionsField()
+
+    def __init__(
+        self,
+        *args: Any,  # noqa: ANN401
+        fields: Collection[str] | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Create the serializer, dropping the fields that are not wanted."""
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    class Meta:
+        model = Chord
+        fields = (
+            "id",
+            "title",
+            "musical_title",
+            "order_in_note",
+            "start_fret",
+            "has_barre",
+            "positions",
+        )
+
+
+def parse_chord_fields(value: str) -> tuple[str, ...]:
+    """Parse a comma-separated list of `ChordOutputSerializer` fields.
+
+    Args:
+        value (str): The list, e.g. `id,title,has_barre`.
+
+    Returns:
+        tuple[str, ...]: Known fields in the output order, without repeats.
+
+    Raises:
+        ValidationError: If the list is empty or has unknown fields.
     """
+    requested = {name.strip() for name in value.split(",")} - {""}
+    if not requested:
+        raise serializers.ValidationError({"fields": ["No fields requested."]})
+    known = ChordOutputSerializer.Meta.fields
+    unknown = requested.difference(known)
+    if unknown:
+        raise serializers.ValidationError({
+            "fields": [f"Unknown fields: {', '.join(sorted(unknown))}."]
+        })
+    return tuple(name for name in known if name in requested)
 
-    positions = ChordPositionSerializer(many=True, read_only=True)
+
+class ChordBulkUpsertSerializer(ChordCreateUpdateSerializer):
+    """Input serializer for one upsert line of a bulk change.
+
+    The chord is found by `id` if it is given, otherwise by `title` and
+    `order_in_note`.
+    """
+
+    id = serializers.IntegerField(required=False, min_value=1)
 
     class Meta:
         model = Chord
@@ -66,3 +175,223 @@ class ChordOutputSerializer(serializers.ModelSerializer[Chord]):
             "has_barre",
             "positions",
         )
+
+
+class ChordBulkDeleteSerializer(serializers.Serializer):  # type: ignore[type-arg]
+    """Input serializer for one delete line of a bulk change."""
+
+    id = serializers.IntegerField(required=False, min_value=1)
+    title = serializers.CharField(required=False, max_length=50)
+    order_in_note = serializers.IntegerField(required=False, min_value=0)
+
+    @staticmethod
+    def validate(attrs: dict[str, Any]) -> dict[str, Any]:
+        """Check that the chord can be found."""
+        if "id" not in attrs and ("title" not in attrs or "order_in_note" not in attrs):
+            raise serializers.ValidationError(
+                "Either id or title and order_in_note are required."
+            )
+        return attrs
+
+
+class ChordShapeQuerySerializer(serializers.Serializer):  # type: ignore[type-arg]
+    """Query serializer for the shape search."""
+
+    q = serializers.CharField(trim_whitespace=True)
+
+    @staticmethod
+    def validate_q(value: str) -> str:
+        """Normalize the shape pattern."""
+        try:
+            return normalize_shape_pattern(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e)) from e
+
+
+class ChordSearchQuerySerializer(serializers.Serializer):  # type: ignore[type-arg]
+    """Query serializer for the fuzzy search by title."""
+
+    q = serializers.CharField(max_length=50, trim_whitespace=True)
+    limit = serializers.IntegerField(
+        min_value=1, max_value=MAX_SEARCH_RESULTS, default=20
+    )
+
+
+class ChordAutocompleteQuerySerializer(serializers.Serializer):  # type: ignore[type-arg]
+    """Query serializer for the autocomplete of chord names."""
+
+    q = serializers.CharField(max_length=50, trim_whitespace=True)
+    limit = serializers.IntegerField(
+        min_value=1, max_value=MAX_AUTOCOMPLETE_SUGGESTIONS, default=10
+    )
+
+
+class ChordExportQuerySerializer(serializers.Serializer):  # type: ignore[type-arg]
+    """Query serializer for the catalog export."""
+
+    export_format = serializers.ChoiceField(choices=("ndjson", "csv"), default="ndjson")
+
+
+class ChordNotesQuerySerializer(serializers.Serializer):  # type: ignore[type-arg]
+    """Query serializer for the chords grouped by note."""
+
+    title = serializers.CharField(required=False, max_length=50)
+
+
+class ChordSpritesQuerySerializer(serializers.Serializer):  # type: ignore[type-arg]
+    """Query serializer for the sprite sheets of the chord diagrams.
+
+    The format is not named `format`, which selects the renderer of the
+    manifest itself.
+    """
+
+    title = serializers.CharField(required=False, max_length=50)
+    image_format = serializers.ChoiceField(choices=["png", "webp"], default="png")
+
+
+class ChordBatchQuerySerializer(serializers.Serializer):  # type: ignore[type-arg]
+    """Query serializer for the multi-get.
+
+    Exactly one of `ids` and `titles` is given, as a comma-separated list.
+    Repeated items are dropped, the first occurrence keeps its place.
+    """
+
+    ids = serializers.CharField(required=False)
+    titles = serializers.CharField(required=False)
+
+    @staticmethod
+    def validate_ids(value: str) -> list[int]:
+        """Parse the chord primary keys."""
+        try:
+            chord_ids = [int(item) for item in _split_batch(value)]
+        except ValueError as e:
+            raise serializers.ValidationError("Ids must be integers.") from e
+        if min(chord_ids) < 1:
+            raise serializers.ValidationError("Ids must be positive.")
+        return chord_ids
+
+    @staticmethod
+    def validate_titles(value: str) -> list[str]:
+        """Parse the chord titles."""
+        titles = _split_batch(value)
+        if any(len(title) > _MAX_TITLE_LENGTH for title in titles):
+            raise serializers.ValidationError(
+                f"Titles must be at most {_MAX_TITLE_LENGTH} characters long."
+            )
+        return titles
+
+    @staticmethod
+    def validate(attrs: dict[str, Any]) -> dict[str, Any]:
+        """Check that exactly one lookup is requested."""
+        if ("ids" in attrs) == ("titles" in attrs):
+            raise serializers.ValidationError("Either ids or titles is required.")
+        return attrs
+
+
+def _split_batch(value: str) -> list[str]:
+    """Split a comma-separated list of a multi-get, without repeats.
+
+    Raises:
+        ValidationError: If the list is empty or too long.
+    """
+    items = [
+        item for item in dict.fromkeys(i.strip() for i in value.split(",")) if item
+    ]
+    if not items:
+        raise serializers.ValidationError("The list is empty.")
+    if len(items) > MAX_BATCH_CHORDS:
+        raise serializers.ValidationError(
+            f"At most {MAX_BATCH_CHORDS} items can be requested at once."
+        )
+    return items
+
+
+class ChordIdentifyInputSerializer(serializers.Serializer):  # type: ignore[type-arg]
+    """Input serializer for the batch chord identification.
+
+    Every shape lists six frets from the sixth string to the first.
+    """
+
+    frets = serializers.ListField(
+        child=serializers.ListField(
+            child=serializers.IntegerField(min_value=MIN_FRET, max_value=MAX_FRET),
+            min_length=MAX_STRING_NUMBER,
+            max_length=MAX_STRING_NUMBER,
+        ),
+        min_length=1,
+        max_length=MAX_IDENTIFY_SHAPES,
+    )
+
+
+class ChordTransposeInputSerializer(serializers.Serializer):  # type: ignore[type-arg]
+    """Input serializer for the batch transposition.
+
+    Chords are given either as catalog `ids` or as `frets`, shapes of six
+    frets from the sixth string to the first. Repeats are kept, since a
+    song repeats its chords.
+    """
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=MAX_TRANSPOSE_CHORDS,
+        required=False,
+    )
+    frets = serializers.ListField(
+        child=serializers.ListField(
+            child=serializers.IntegerField(min_value=MIN_FRET, max_value=MAX_FRET),
+            min_length=MAX_STRING_NUMBER,
+            max_length=MAX_STRING_NUMBER,
+        ),
+        min_length=1,
+        max_length=MAX_TRANSPOSE_CHORDS,
+        required=False,
+    )
+    semitones = serializers.IntegerField(
+        min_value=-MAX_TRANSPOSE_SEMITONES, max_value=MAX_TRANSPOSE_SEMITONES, default=0
+    )
+    capo = serializers.IntegerField(min_value=0, max_value=MAX_FRET - 1, default=0)
+
+    @staticmethod
+    def validate(attrs: dict[str, Any]) -> dict[str, Any]:
+        """Check that exactly one list of chords is given."""
+        if ("ids" in attrs) == ("frets" in attrs):
+            raise serializers.ValidationError("Either ids or frets is required.")
+        return attrs
+
+
+class ChordVoicingsQuerySerializer(serializers.Serializer):  # type: ignore[type-arg]
+    """Query serializer for the voicing generator."""
+
+    name = serializers.CharField(max_length=20)
+    max_stretch = serializers.IntegerField(
+        min_value=1, max_value=MAX_VOICING_STRETCH, default=DEFAULT_MAX_STRETCH
+    )
+    max_fret = serializers.IntegerField(
+        min_value=1, max_value=MAX_FRET, default=MAX_FRET
+    )
+    barre = serializers.BooleanField(default=True)
+    limit = serializers.IntegerField(min_value=1, max_value=MAX_VOICINGS, default=10)
+
+    @staticmethod
+    def validate_name(value: str) -> str:
+        """Check that the chord name is known."""
+        try:
+            parse_chord_name(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e)) from e
+        return value
+
+
+class ChordChangesQuerySerializer(serializers.Serializer):  # type: ignore[type-arg]
+    """Query serializer for the delta sync."""
+
+    since = serializers.CharField(required=False)
+
+    @staticmethod
+    def validate_since(value: str) -> datetime:
+        """Decode the sync token."""
+        try:
+            return decode_sync_token(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e)) from e
@@ -0,0 +1,189 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Views of the sprite sheets of chord diagrams.
+
+The manifest lists the sheets of the catalog, or of one note, and the
+rectangle of every chord in them. Sheets are named by their content, so a
+client asks for the manifest, which is validated with the catalog version,
+and keeps the sheets it already has for good.
+
+Layouts are cached per process until the catalog version changes. The
+manifest renders nothing; every sheet is built when it is first requested.
+"""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from django.http import Http404
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.shared.conditional import get_precondition_response, set_conditional_headers
+from apps.shared.permissions import IsStaffOrReadOnly
+
+from ..catalog import CatalogCache, get_catalog_modified, get_catalog_version
+from ..diagrams import DiagramBusyError
+from ..selectors import get_chord_diagram_specs
+from ..sprites import (
+    SpriteFormat,
+    SpriteLayout,
+    get_sprite_path,
+    get_sprite_sheet,
+    layout_sprites,
+)
+from .renderers import ChordJSONRenderer, ChordPNGRenderer, ChordWebPRenderer
+from .serializers import ChordSpritesQuerySerializer
+from .views import DIAGRAM_IMMUTABLE_CACHE_CONTROL
+
+_sprite_layout_cache: CatalogCache[SpriteLayout] = CatalogCache(max_entries=256)
+
+
+class ChordSpritesView(APIView):
+    """Manifest of the sprite sheets of the chord diagrams."""
+
+    permission_classes = (IsStaffOrReadOnly,)
+
+    def get(self, request: Request) -> Response:  # noqa: PLR6301
+        """Get the manifest of the sheets.
+
+        `?title=` limits the manifest to the chords of one note, and
+        `?image_format=webp` asks for WebP sheets instead of PNG ones.
+
+        Args:
+            request (Request): The incoming request
+
+        Returns:
+            Response with the manifest or 304 Not Modified
+        """
+        query = ChordSpritesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        sprite_format = query.validated_data["image_format"]
+
+        etag = f"chord-sprites-{get_catalog_version()}"
+        last_modified = get_catalog_modified()
+        precondition_response = get_precondition_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if precondition_response is not None:
+            return precondition_response
+
+        manifest = get_sprite_layout(
+            sprite_format, query.validated_data.get("title")
+        ).manifest
+        sheets = [
+            {
+                **sheet,
+                "url": reverse(
+                    "chord-sprite-sheet",
+                    kwargs={"sprite_key": sheet["key"], "format": sprite_format},
+                ),
+            }
+            for sheet in manifest["sheets"]
+        ]
+        response = Response({**manifest, "sheets": sheets})
+        set_conditional_headers(response, etag=etag, last_modified=last_modified)
+        return response
+
+
+class ChordSpriteSheetView(APIView):
+    """One sprite sheet, by its content key and format."""
+
+    permission_classes = (IsStaffOrReadOnly,)
+    renderer_classes = (ChordPNGRenderer, ChordWebPRenderer)
+
+    def get(  # noqa: PLR6301
+        self, request: Request, sprite_key: str, format: SpriteFormat
+    ) -> Response:
+        """Get a sheet; a sheet never changes, so it is cached for good.
+
+        Args:
+            request (Request): The incoming request
+            sprite_key (str): Content key of the sheet, from the URL
+            format (SpriteFormat): `png` or `webp`, from the URL
+
+        A sheet of the current catalog that is not on disk yet is built
+        first; sheets of older catalog versions are served while they are
+        on disk.
+
+        Returns:
+            Response with the sheet, 304 Not Modified or 503 if the renderers
+            are busy
+
+        Raises:
+            Http404: If the sheet is neither on disk nor in the catalog
+        """
+        path = get_sprite_path(sprite_key, format)
+        if not path.exists():
+            sheet = get_sprite_layout(format).sheets.get(sprite_key)
+            if sheet is None:
+                raise Http404("Sprite sheet not found.")
+            try:
+                get_sprite_sheet(format, sheet)
+            except DiagramBusyError as e:
+                return Response(
+                    {"detail": str(e)},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    headers={"Retry-After": "1"},
+                )
+        modified = datetime.fromtimestamp(path.stat().st_mtime, tz=UTC)
+
+        response = get_precondition_response(
+            request, etag=sprite_key, last_modified=modified
+        )
+        if response is None:
+            response = Response(path.read_bytes())
+            set_conditional_headers(response, etag=sprite_key, last_modified=modified)
+        response["Cache-Control"] = DIAGRAM_IMMUTABLE_CACHE_CONTROL
+        return response
+
+    def finalize_response(
+        self,
+        request: Request,
+        response: Response,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Response:
+        """Render errors as JSON, not with the image renderers.
+
+        Args:
+            request (Request): The incoming request
+            response (Response): The response of the view
+            *args (Any): Positional arguments of the view
+            **kwargs (Any): Keyword arguments of the view
+
+        Returns:
+            Response: The response ready for rendering
+        """
+        failed = status.is_client_error(response.status_code) or (
+            status.is_server_error(response.status_code)
+        )
+        if failed:
+            request.accepted_renderer = ChordJSONRenderer()
+            request.accepted_media_type = ChordJSONRenderer.media_type
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+def get_sprite_layout(
+    sprite_format: SpriteFormat, title: str | None = None
+) -> SpriteLayout:
+    """Get the sprite layout of the catalog, or of one note, from the cache.
+
+    Sheets never mix notes, so the layout of a note has the same sheets as
+    the layout of the whole catalog.
+
+    Args:
+        sprite_format (SpriteFormat): Format of the sheets.
+        title (str | None): Title (note) of the chords, None for all chords.
+
+    Returns:
+        SpriteLayout: The layout for the current catalog version.
+    """
+    return _sprite_layout_cache.get_or_build(
+        (sprite_format, title),
+        lambda: layout_sprites(sprite_format, get_chord_diagram_specs(title=title)),
+    )
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""View of the batch transposition of chords, e.g. of all chords of a song."""
+
+from typing import Any
+
+from rest_framework.permissions import AllowAny
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import ValidationError
+from rest_framework.views import APIView
+
+from ..selectors import get_chord_frets_by_ids
+from ..transposition import transpose_shapes
+from .serializers import ChordTransposeInputSerializer
+
+
+class ChordTransposeView(APIView):
+    """Transposition of a batch of chords by semitones and with a capo."""
+
+    permission_classes = (AllowAny,)
+
+    def post(self, request: Request) -> Response:  # noqa: PLR6301
+        """Transpose catalog chords or shapes.
+
+        Every result has the frets to play, counted from the capo, the
+        first fret of its diagram and the names the chord sounds as. Chords
+        given by id are read with one query, and every distinct shape is
+        transposed once.
+
+        Args:
+            request (Request): The incoming request with `ids` or `frets`,
+                `semitones` and `capo`
+
+        Returns:
+            Response with the results in the order of the chords
+
+        Raises:
+            ValidationError: If some chords are not found
+        """
+        serializer = ChordTransposeInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        chord_ids: list[int] | None = data.get("ids")
+        if chord_ids is None:
+            shapes = data["frets"]
+        else:
+            frets = get_chord_frets_by_ids(chord_ids=set(chord_ids))
+            missing = sorted(set(chord_ids) - frets.keys())
+            if missing:
+                unknown = ", ".join(map(str, missing))
+                raise ValidationError({"ids": [f"Unknown chords: {unknown}."]})
+            shapes = [frets[chord_id] for chord_id in chord_ids]
+
+        results = transpose_shapes(
+            shapes, semitones=data["semitones"], capo=data["capo"]
+        )
+        output: list[Any] = results
+        if chord_ids is not None:
+            output = [
+                {"id": chord_id, **result}
+                for chord_id, result in zip(chord_ids, results, strict=True)
+            ]
+        return Response({
+            "semitones": data["semitones"],
+            "capo": data["capo"],
+            "results": output,
+        })
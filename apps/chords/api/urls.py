@@ -4,9 +4,17 @@
 
 """Url config for the chords app."""
 
+from django.urls import path, re_path
 from rest_framework.routers import DefaultRouter
 
+from .async_views import chord_detail, chord_list
+from .autocomplete_views import ChordAutocompleteView
+from .export_views import ChordExportView
+from .search_views import ChordSearchView
+from .sprite_views import ChordSpriteSheetView, ChordSpritesView
+from .transposition_views import ChordTransposeView
 from .views import ChordViewSet
+from .voicing_views import ChordVoicingsView
 
 router = DefaultRouter()
 router.register(
@@ -15,4 +23,24 @@ router.register(
     basename="chord",
 )
 
-urlpatterns = router.urls
+urlpatterns = [
+    # Before the router, whose detail route would take these for a pk
+    path("chords/sprites/", ChordSpritesView.as_view(), name="chord-sprites"),
+    re_path(
+        r"^chords/sprites/(?P<sprite_key>[0-9a-f]{32})\.(?P<format>png|webp)/$",
+        ChordSpriteSheetView.as_view(),
+        name="chord-sprite-sheet",
+    ),
+    path("chords/transpose/", ChordTransposeView.as_view(), name="chord-transpose"),
+    path(
+        "chords/autocomplete/",
+        ChordAutocompleteView.as_view(),
+        name="chord-autocomplete",
+    ),
+    path("chords/export/", ChordExportView.as_view(), name="chord-export"),
+    path("chords/search/", ChordSearchView.as_view(), name="chord-search"),
+    path("chords/voicings/", ChordVoicingsView.as_view(), name="chord-voicings"),
+    *router.urls,
+    path("async/chords/", chord_list, name="chord-async-list"),
+    path("async/chords/<int:pk>/", chord_detail, name="chord-async-detail"),
+]
@@ -4,21 +4,95 @@
 
 """Views for the chords app."""
 
-from typing import Any, TypedDict, Unpack, cast
+import functools
+from typing import Any, Final, TypedDict, Unpack, cast
 
 from django.db.models import QuerySet
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.serializers import Serializer
+from rest_framework.serializers import BaseSerializer, Serializer
 
+from apps.shared.conditional import get_precondition_response, set_conditional_headers
 from apps.shared.permissions import IsStaffOrReadOnly
 
+from ..catalog import CatalogCache, get_catalog_modified, get_catalog_version
+from ..diagrams import DiagramBusyError, DiagramFormat, get_diagram
 from ..models import Chord
-from ..selectors import get_all_chords, get_full_chord_by_id
+from ..selectors import (
+    get_all_chords,
+    get_chord_columns,
+    get_chord_diagram_spec,
+    get_chord_validators,
+    get_chords_by_ids,
+    get_chords_by_note,
+    get_chords_by_shape,
+    get_chords_by_titles,
+    get_chords_changed_since,
+    get_deleted_chord_ids_since,
+    get_full_chord_by_id,
+)
 from ..services import ChordCreateDict, ChordService
-from .serializers import ChordCreateUpdateSerializer, ChordOutputSerializer
+from ..sync import SYNC_TOKEN_OVERLAP, encode_sync_token, get_sync_horizon
+from ..theory import identify_chords
+from .bulk import ChordBulkLoader
+from .fast_output import (
+    CHORD_OUTPUT_VALUES,
+    ChordGroupDict,
+    build_chord_output,
+    dump_chord_groups,
+    dump_chord_list,
+    dump_chord_page,
+    group_chord_output,
+)
+from .pagination import ChordKeysetPagination
+from .renderers import (
+    ChordBinaryRenderer,
+    ChordDiagramRenderer,
+    ChordJSONRenderer,
+    ChordPNGRenderer,
+    ChordSVGRenderer,
+    RenderedJSON,
+)
+from .serializers import (
+    ChordBatchQuerySerializer,
+    ChordChangesQuerySerializer,
+    ChordCreateUpdateSerializer,
+    ChordIdentifyInputSerializer,
+    ChordNotesQuerySerializer,
+    ChordOutputSerializer,
+    ChordShapeQuerySerializer,
+    parse_chord_fields,
+)
+
+type ChordListData = (
+    list[dict[str, Any]] | dict[str, Any] | list[ChordGroupDict] | RenderedJSON
+)
+
+_chord_list_cache: CatalogCache[ChordListData] = CatalogCache(max_entries=256)
+
+_BINARY_ACTIONS: Final[frozenset[str]] = frozenset({
+    "list",
+    "retrieve",
+    "shape",
+    "batch",
+})
+"""Actions whose responses are chords and can be rendered as binary."""
+
+_DIAGRAM_ACTIONS: Final[frozenset[str]] = frozenset({"diagram"})
+"""Actions that send chord diagrams, with the diagram renderers only."""
+
+DIAGRAM_IMMUTABLE_CACHE_CONTROL: Final[str] = "public, max-age=31536000, immutable"
+"""Cache-Control of a diagram requested by its content key (`?v=`)."""
+
+_SPARSE_ACTIONS: Final[frozenset[str]] = frozenset({"list", "retrieve", "batch"})
+"""Actions that accept the `fields` query parameter."""
 
 
 class ChordViewSetKwargs(TypedDict):
@@ -28,17 +102,33 @@ class ChordViewSetKwargs(TypedDict):
 
 
 class ChordViewSet(viewsets.ModelViewSet[Chord]):
-    """ViewSet for CRUD operations on Chord model."""
+    """ViewSet for CRUD operations on Chord model.
+
+    The list, the detail and the multi-get views accept `fields`, a comma-separated list
+    of output fields; only their columns are loaded. The binary format has
+    a fixed layout and always has all the fields.
+
+    Attributes:
+        fast_output (bool): Render the list with `fast_output` instead of
+            ChordOutputSerializer when plain JSON is requested. The output
+            is the same, only faster to produce.
+        fields_query_param (str): Query parameter with the output fields.
+    """
 
     permission_classes = (IsStaffOrReadOnly,)
+    pagination_class = ChordKeysetPagination
+    renderer_classes = (ChordJSONRenderer, BrowsableAPIRenderer, ChordBinaryRenderer)
+    fast_output = True
+    fields_query_param = "fields"
 
-    def get_queryset(self) -> QuerySet[Chord]:  # noqa: PLR6301
+    def get_queryset(self) -> QuerySet[Chord]:
         """Get the queryset of all chords.
 
         Returns:
-            QuerySet[Chord]: QuerySet of all chords
+            QuerySet[Chord]: QuerySet of all chords, with only the columns
+                of the requested fields
         """
-        return get_all_chords()
+        return get_all_chords(fields=self._get_fields())
 
     def get_object(self) -> Chord:
         """Get a single chord instance with full related data.
@@ -49,12 +139,94 @@ class ChordViewSet(viewsets.ModelViewSet[Chord]):
         Raises:
             Http404: If chord is not found
         """
-        pk = self.kwargs["pk"]
         try:
-            return get_full_chord_by_id(chord_id=int(pk))
+            return get_full_chord_by_id(
+                chord_id=self._get_chord_id(), fields=self._get_fields()
+            )
         except Chord.DoesNotExist as e:
             raise Http404("Chord not found.") from e
 
+    def get_renderers(self) -> list[BaseRenderer]:
+        """Offer the binary renderer only for actions that return chords.
+
+        Returns:
+            list[BaseRenderer]: Renderers of the current action
+        """
+        if self.action in _DIAGRAM_ACTIONS:
+            return [ChordSVGRenderer(), ChordPNGRenderer()]
+        renderers = super().get_renderers()
+        if self.action in _BINARY_ACTIONS:
+            return renderers
+        return [r for r in renderers if not isinstance(r, ChordBinaryRenderer)]
+
+    def get_format_suffix(self, **kwargs: Any) -> str | None:  # noqa: ANN401
+        """Use the extension of a diagram URL as the format suffix.
+
+        Args:
+            **kwargs (Any): Keyword arguments of the URL
+
+        Returns:
+            str | None: The requested format, if any
+        """
+        diagram_format = kwargs.get("diagram_format")
+        if diagram_format is not None:
+            return str(diagram_format)
+        return super().get_format_suffix(**kwargs)
+
+    def finalize_response(
+        self,
+        request: Request,
+        response: Response,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Response:
+        """Render errors as JSON even if binary output or an image was negotiated.
+
+        Responses of the actions that can be binary vary on `Accept`, so
+        shared caches keep the JSON and the binary versions apart.
+
+        Args:
+            request (Request): The incoming request
+            response (Response): The response of the action
+            *args (Any): Positional arguments of the action
+            **kwargs (Any): Keyword arguments of the action
+
+        Returns:
+            Response: The response ready for rendering
+        """
+        renderer = getattr(request, "accepted_renderer", None)
+        failed = status.is_client_error(response.status_code) or (
+            status.is_server_error(response.status_code)
+        )
+        binary = isinstance(renderer, (ChordBinaryRenderer, ChordDiagramRenderer))
+        # A failed negotiation leaves no renderer, and the forced fallback
+        # would pick an image renderer for the diagram actions
+        if failed and (binary or self.action in _DIAGRAM_ACTIONS):
+            request.accepted_renderer = ChordJSONRenderer()
+            request.accepted_media_type = ChordJSONRenderer.media_type
+        if self.action in _BINARY_ACTIONS:
+            patch_vary_headers(response, ["Accept"])
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def get_serializer(
+        self,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> BaseSerializer[Chord]:
+        """Create the serializer, limited to the requested output fields.
+
+        Args:
+            *args (Any): Positional arguments of the serializer
+            **kwargs (Any): Keyword arguments of the serializer
+
+        Returns:
+            BaseSerializer[Chord]: The serializer instance
+        """
+        fields = self._get_fields()
+        if fields is not None:
+            kwargs["fields"] = fields
+        return super().get_serializer(*args, **kwargs)
+
     def get_serializer_class(self) -> type[Serializer[Any]]:
         """Return serializer class based on action.
 
@@ -65,6 +237,75 @@ class ChordViewSet(viewsets.ModelViewSet[Chord]):
             return ChordCreateUpdateSerializer
         return ChordOutputSerializer
 
+    def list(self, request: Request) -> Response:
+        """List all chords, or one page of them if pagination is requested.
+
+        The serialized list is cached per process until the catalog version
+        changes, so repeated requests do not touch the database. The catalog
+        version is also used as the ETag of the list.
+
+        Args:
+            request: The incoming request
+
+        Returns:
+            Response with the list of chords or 304 Not Modified
+        """
+        etag = self._tag_representation(request, f"chords-{get_catalog_version()}")
+        last_modified = get_catalog_modified()
+        precondition_response = get_precondition_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if precondition_response is not None:
+            return precondition_response
+
+        use_fast_output = self._use_fast_output(request)
+        cache_key = ("list", use_fast_output, self._get_fields())
+        if self.pagination_class().is_requested(request):
+            cache_key = (request.build_absolute_uri(), use_fast_output, None)
+        builder = (
+            self._build_fast_list_data if use_fast_output else self._build_list_data
+        )
+        data = _chord_list_cache.get_or_build(cache_key, builder)
+        response = Response(data)
+        set_conditional_headers(response, etag=etag, last_modified=last_modified)
+        return response
+
+    def retrieve(
+        self,
+        request: Request,
+        **kwargs: Unpack[ChordViewSetKwargs],
+    ) -> Response:
+        """Get a single chord.
+
+        The chord revision is checked first, so a conditional request with
+        a matching ETag is answered without loading the chord.
+
+        Args:
+            request (Request): The incoming request
+            **kwargs (Any): Additional keyword arguments passed by DRF dispatch,
+                including 'pk' used to identify the chord instance.
+
+        Returns:
+            Response with the chord or 304 Not Modified
+        """
+        chord_id = self._get_chord_id()
+        try:
+            revision, updated_at = get_chord_validators(chord_id=chord_id)
+        except Chord.DoesNotExist as e:
+            raise Http404("Chord not found.") from e
+
+        etag = self._tag_representation(request, f"chord-{chord_id}-{revision}")
+        precondition_response = get_precondition_response(
+            request, etag=etag, last_modified=updated_at
+        )
+        if precondition_response is not None:
+            return precondition_response
+
+        serializer = self.get_serializer(self.get_object())
+        response = Response(serializer.data)
+        set_conditional_headers(response, etag=etag, last_modified=updated_at)
+        return response
+
     def create(self, request: Request) -> Response:
         """Create a new chord (admin only).
 
@@ -131,7 +372,7 @@ class ChordViewSet(viewsets.ModelViewSet[Chord]):
     def destroy(
         self, request: Request, **kwargs: Unpack[ChordViewSetKwargs]
     ) -> Response:
-        """Delete a chord (admin only).
+        """Delete a chord by primary key without loading it (admin only).
 
         Args:
             request (Request): The incoming request
@@ -141,10 +382,359 @@ class ChordViewSet(viewsets.ModelViewSet[Chord]):
         Returns:
             Response with 204 No Content or 404 if not found
         """
-        chord = self.get_object()
-        ChordService.delete_chord(chord=chord)
+        if not ChordService.delete_chord(chord_id=self._get_chord_id()):
+            raise Http404("Chord not found.")
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk",
+        permission_classes=[IsAdminUser],
+    )
+    def bulk(self, request: Request) -> StreamingHttpResponse:  # noqa: PLR6301
+        """Upsert and delete chords from a streamed NDJSON body (admin only).
+
+        The body is parsed while it is read and applied in batches of
+        `batch_size` lines (query parameter), each in its own transaction.
+        The batches run while the response streams, so their errors are
+        reported as result lines; see `apps.chords.api.bulk`.
+
+        Args:
+            request (Request): The incoming request with NDJSON lines
+
+        Returns:
+            StreamingHttpResponse with one NDJSON result per input line
+        """
+        loader = ChordBulkLoader.from_request(request)
+        return StreamingHttpResponse(
+            loader.run(request._request),
+            content_type="application/x-ndjson",
+        )
+
+    @action(detail=False, methods=["get"], url_path="shape")
+    def shape(self, request: Request) -> Response:  # noqa: PLR6301
+        """Find chords by their fret shape, e.g. `?q=x02210`.
+
+        The shape lists frets from the sixth string to the first; `?` (or
+        `*`, `.`) matches any fret of a string.
+
+        Args:
+            request (Request): The incoming request
+
+        Returns:
+            Response with the matching chords
+        """
+        query = ChordShapeQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        chords = get_chords_by_shape(pattern=query.validated_data["q"])
+        return Response(ChordOutputSerializer(chords, many=True).data)
+
+    @action(detail=False, methods=["get"], url_path="batch")
+    def batch(self, request: Request) -> Response:
+        """Get several chords at once, e.g. `?ids=1,2,3` or `?titles=Am,C,G`.
+
+        Chords are returned in the order of the request, the chords of one
+        title ordered by `order_in_note`. Unknown ids and titles are
+        skipped. The chords are read in one query, plus one for the
+        positions of chords without packed positions.
+
+        Args:
+            request (Request): The incoming request
+
+        Returns:
+            Response with the list of chords
+        """
+        query = ChordBatchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        chord_ids = query.validated_data.get("ids")
+        if chord_ids is not None:
+            chords = get_chords_by_ids(chord_ids=chord_ids)
+        else:
+            chords = get_chords_by_titles(titles=query.validated_data["titles"])
+
+        fields = self._get_fields()
+        columns = CHORD_OUTPUT_VALUES if fields is None else get_chord_columns(fields)
+        data = build_chord_output(chords.values(*columns), fields)
+        if self._use_fast_output(request):
+            return Response(RenderedJSON(dump_chord_list(data)))
+        return Response(data)
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"diagram\.(?P<diagram_format>svg|png)",
+        url_name="diagram",
+    )
+    def diagram(
+        self,
+        request: Request,
+        diagram_format: DiagramFormat,
+        **kwargs: Unpack[ChordViewSetKwargs],
+    ) -> Response:
+        """Get the diagram of a chord as SVG or PNG.
+
+        Diagrams are rendered once per fingering and kept on disk. The ETag
+        is the content key of the diagram; the response links to the URL
+        with the key (`?v=`), which is cached by clients for good.
+
+        Args:
+            request (Request): The incoming request
+            diagram_format (DiagramFormat): `svg` or `png`, from the URL
+            **kwargs (Any): Additional keyword arguments passed by DRF dispatch,
+                including 'pk' used to identify the chord instance.
+
+        Returns:
+            Response with the diagram, 304 Not Modified or 503 if the
+            renderers are busy
+        """
+        try:
+            spec, updated_at = get_chord_diagram_spec(chord_id=self._get_chord_id())
+        except Chord.DoesNotExist as e:
+            raise Http404("Chord not found.") from e
+
+        key = spec.get_key(diagram_format)
+        cache_control = "no-cache"
+        if request.query_params.get("v") == key:
+            cache_control = DIAGRAM_IMMUTABLE_CACHE_CONTROL
+        precondition_response = get_precondition_response(
+            request, etag=key, last_modified=updated_at
+        )
+        if precondition_response is not None:
+            precondition_response["Cache-Control"] = cache_control
+            return precondition_response
+
+        try:
+            content = get_diagram(diagram_format, spec)
+        except DiagramBusyError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": "1"},
+            )
+
+        response = Response(content)
+        set_conditional_headers(response, etag=key, last_modified=updated_at)
+        response["Cache-Control"] = cache_control
+        response["Content-Location"] = f"{request.path}?v={key}"
+        return response
+
+    @action(detail=False, methods=["get"], url_path="notes")
+    def notes(self, request: Request) -> Response:
+        """Get chords grouped by title (note), ordered by `order_in_note`.
+
+        `?title=` limits the response to the group of one note. Like the
+        list, responses are cached per process and validated with the
+        catalog version.
+
+        Args:
+            request (Request): The incoming request
+
+        Returns:
+            Response with the groups of chords or 304 Not Modified
+        """
+        query = ChordNotesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        title = query.validated_data.get("title")
+
+        etag = f"chord-notes-{get_catalog_version()}"
+        last_modified = get_catalog_modified()
+        precondition_response = get_precondition_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if precondition_response is not None:
+            return precondition_response
+
+        use_fast_output = self._use_fast_output(request)
+        data = _chord_list_cache.get_or_build(
+            ("notes", title, use_fast_output),
+            functools.partial(self._build_notes_data, title, use_fast_output),
+        )
+        response = Response(data)
+        set_conditional_headers(response, etag=etag, last_modified=last_modified)
+        return response
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="identify",
+        permission_classes=[AllowAny],
+    )
+    def identify(self, request: Request) -> Response:  # noqa: PLR6301
+        """Name the chords formed by a batch of shapes.
+
+        Args:
+            request (Request): The incoming request with `frets`, a list of
+                shapes of six frets each, from the sixth string to the first
+
+        Returns:
+            Response with the ranked chord names of every shape
+        """
+        serializer = ChordIdentifyInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        shapes = serializer.validated_data["frets"]
+        results = [
+            {"frets": frets, "matches": matches}
+            for frets, matches in zip(shapes, identify_chords(shapes), strict=True)
+        ]
+        return Response({"results": results})
+
+    @action(detail=False, methods=["get"], url_path="changes")
+    def changes(self, request: Request) -> Response:  # noqa: PLR6301
+        """Get the chords changed and deleted since the previous sync.
+
+        Without `since` all chords are returned. The response `token` is
+        passed as `since` on the next sync. Clients apply `deletes` first,
+        then `upserts`. A token older than the tombstone retention window
+        gets 410 Gone, and the client has to sync again without `since`.
+
+        Args:
+            request (Request): The incoming request
+
+        Returns:
+            Response with `upserts`, `deletes` and the next `token`, or 410
+        """
+        query = ChordChangesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        synced_at = timezone.now()
+        since = query.validated_data.get("since")
+        if since is not None:
+            since -= SYNC_TOKEN_OVERLAP
+            if since < get_sync_horizon(synced_at):
+                return Response(
+                    {"detail": "Sync token expired, sync again without since."},
+                    status=status.HTTP_410_GONE,
+                )
+
+        rows = get_chords_changed_since(since=since).values(*CHORD_OUTPUT_VALUES)
+        deletes = [] if since is None else get_deleted_chord_ids_since(since=since)
+        return Response({
+            "upserts": build_chord_output(rows),
+            "deletes": deletes,
+            "token": encode_sync_token(synced_at),
+        })
+
+    def _get_chord_id(self) -> int:
+        """Get the chord primary key from the URL.
+
+        Returns:
+            int: The chord primary key
+
+        Raises:
+            Http404: If the key is not a number
+        """
+        try:
+            return int(self.kwargs["pk"])
+        except ValueError as e:
+            raise Http404("Chord not found.") from e
+
+    def _get_fields(self) -> tuple[str, ...] | None:
+        """Get the output fields requested by the client.
+
+        Returns:
+            tuple[str, ...] | None: Fields in the output order, or None for
+                all fields
+
+        Raises:
+            ValidationError: If the fields are unknown
+        """
+        value = self.request.query_params.get(self.fields_query_param)
+        renderer = getattr(self.request, "accepted_renderer", None)
+        if (
+            value is None
+            or self.action not in _SPARSE_ACTIONS
+            or isinstance(renderer, ChordBinaryRenderer)
+        ):
+            return None
+        return parse_chord_fields(value)
+
+    def _tag_representation(self, request: Request, etag: str) -> str:
+        """Make the ETag differ between representations of a resource.
+
+        The binary format and every set of output fields get their own tag.
+
+        Args:
+            request (Request): The incoming request
+            etag (str): ETag of the resource
+
+        Returns:
+            str: The ETag of the negotiated representation
+        """
+        renderer = getattr(request, "accepted_renderer", None)
+        if isinstance(renderer, ChordBinaryRenderer):
+            return f"{etag}-{renderer.format}"
+        fields = self._get_fields()
+        if fields is not None:
+            return f"{etag}-{'.'.join(fields)}"
+        return etag
+
+    def _build_list_data(self) -> ChordListData:
+        """Serialize the whole chord list or the requested page.
+
+        Returns:
+            ChordListData: Serialized chords, or a page with the next link
+        """
+        queryset = self.get_queryset()
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            page_serializer = self.get_serializer(page, many=True)
+            return dict(self.get_paginated_response(page_serializer.data).data)
+        serializer = self.get_serializer(queryset, many=True)
+        return list(serializer.data)
+
+    def _use_fast_output(self, request: Request) -> bool:
+        """Check if the list can be rendered with `fast_output`.
+
+        Args:
+            request (Request): The incoming request
+
+        Returns:
+            bool: True if the view allows it and compact JSON was negotiated
+        """
+        renderer = getattr(request, "accepted_renderer", None)
+        if not self.fast_output or not isinstance(renderer, ChordJSONRenderer):
+            return False
+        indent = renderer.get_indent(
+            request.accepted_media_type, self.get_renderer_context()
+        )
+        return indent is None
+
+    def _build_fast_list_data(self) -> RenderedJSON:
+        """Render the whole chord list or the requested page with pydantic.
+
+        Returns:
+            RenderedJSON: The same JSON document as `_build_list_data` gives
+        """
+        fields = self._get_fields()
+        columns = CHORD_OUTPUT_VALUES if fields is None else get_chord_columns(fields)
+        rows = self.get_queryset().values(*columns)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            paginator = cast(ChordKeysetPagination, self.paginator)
+            content = dump_chord_page(
+                paginator.get_next_link(), build_chord_output(page, fields)
+            )
+        else:
+            content = dump_chord_list(build_chord_output(rows, fields))
+        return RenderedJSON(content)
+
+    @staticmethod
+    def _build_notes_data(title: str | None, use_fast_output: bool) -> ChordListData:
+        """Build the groups of chords of all notes or of one note.
+
+        Args:
+            title (str | None): Title of the only note, None for all
+            use_fast_output (bool): Render the groups to JSON right away
+
+        Returns:
+            ChordListData: The groups, rendered if `use_fast_output` is set
+        """
+        rows = get_chords_by_note(title=title).values(*CHORD_OUTPUT_VALUES)
+        groups = group_chord_output(build_chord_output(rows))
+        if use_fast_output:
+            return RenderedJSON(dump_chord_groups(groups))
+        return groups
+
     def _perform_update(self, request: Request, partial: bool = False) -> Response:
         """Perform update operation (full or partial).
 
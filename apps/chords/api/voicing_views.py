@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""View of the generated voicings of a chord."""
+
+from rest_framework.permissions import AllowAny
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..voicings import VoicingConstraints, generate_voicings
+from .serializers import ChordVoicingsQuerySerializer
+
+
+class ChordVoicingsView(APIView):
+    """Playable voicings of a chord, generated from its name."""
+
+    permission_classes = (AllowAny,)
+
+    def get(self, request: Request) -> Response:  # noqa: PLR6301
+        """Generate the voicings of a chord.
+
+        `?name=` is the chord, e.g. `Am7`; `max_stretch`, `max_fret` and
+        `barre` limit the voicings and `limit` their number. The positions
+        of a voicing can be sent as they are to create a chord.
+
+        Args:
+            request (Request): The incoming request
+
+        Returns:
+            Response with the voicings, the lowest on the neck first
+        """
+        query = ChordVoicingsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        data = query.validated_data
+        constraints = VoicingConstraints(
+            max_stretch=data["max_stretch"],
+            max_fret=data["max_fret"],
+            allow_barre=data["barre"],
+        )
+        voicings = generate_voicings(data["name"], constraints)
+        return Response({
+            "name": data["name"],
+            "voicings": voicings[: data["limit"]],
+        })
@@ -13,3 +13,7 @@ class ChordsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.chords"
+
+    def ready(self) -> None:  # noqa: PLR6301
+        """Register the system checks of the app."""
+        from apps.chords import checks  # noqa: F401, PLC0415
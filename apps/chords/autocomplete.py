@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""In-process prefix autocomplete of chord titles and musical titles.
+
+The chord picker asks for suggestions on every keystroke, so they are
+answered from a sorted array kept in every worker process instead of the
+database. The array holds the normalized names, plus every later word of
+a musical title, so `min` finds `A minor`; a prefix is found by binary
+search and the suggestions are the keys that follow it.
+
+The index is built in one query for a catalog version and replaced as a
+whole when the version changes (see `CatalogCache`), so a keystroke costs
+one read of the version from the Django cache and never a query.
+"""
+
+import bisect
+import re
+import unicodedata
+from collections.abc import Iterable
+from typing import Final, Literal, TypedDict
+
+from .catalog import CatalogCache
+from .selectors import get_chord_names
+
+type SuggestionKind = Literal["title", "musical_title"]
+
+_WHITESPACE_RE: Final[re.Pattern[str]] = re.compile(r"\s+")
+"""Runs of whitespace, collapsed to one space."""
+
+_ACCIDENTALS: Final[dict[int, str]] = str.maketrans({"♯": "#", "♭": "b"})
+"""Music signs typed by some keyboards, replaced with the ASCII ones."""
+
+_index_cache: CatalogCache["ChordAutocompleteIndex"] = CatalogCache(max_entries=1)
+
+
+class SuggestionDict(TypedDict):
+    """One autocomplete suggestion with the chords it names."""
+
+    value: str
+    kind: SuggestionKind
+    ids: list[int]
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a chord name or a typed prefix for matching.
+
+    Args:
+        name (str): A title, a musical title or what the user typed.
+
+    Returns:
+        str: The name case-folded, with ASCII accidentals and single
+            spaces, without leading and trailing spaces.
+    """
+    name = unicodedata.normalize("NFKC", name).translate(_ACCIDENTALS)
+    return _WHITESPACE_RE.sub(" ", name).strip().casefold()
+
+
+class ChordAutocompleteIndex:
+    """Sorted array of normalized chord names, read only once built."""
+
+    def __init__(self, rows: Iterable[tuple[int, str, str]]) -> None:
+        """Build the index.
+
+        Args:
+            rows (Iterable[tuple[int, str, str]]): Id, title and musical
+                title of every chord.
+        """
+        ids_by_name: dict[tuple[str, SuggestionKind], list[int]] = {}
+        for chord_id, title, musical_title in rows:
+            ids_by_name.setdefault((title, "title"), []).append(chord_id)
+            ids_by_name.setdefault((musical_title, "musical_title"), []).append(
+                chord_id
+            )
+
+        self._suggestions: list[SuggestionDict] = []
+        entries: list[tuple[str, int, int]] = []
+        for (value, kind), ids in ids_by_name.items():
+            normalized = normalize_name(value)
+            if not normalized:
+                continue
+            number = len(self._suggestions)
+            self._suggestions.append({"value": value, "kind": kind, "ids": ids})
+            # Titles come before musical titles of the same key
+            entries.append((normalized, kind != "title", number))
+            if kind == "musical_title":
+                words = normalized.split(" ")
+                entries.extend(
+                    (" ".join(words[i:]), True, number) for i in range(1, len(words))
+                )
+        entries.sort()
+        self._keys = [key for key, _, _ in entries]
+        self._numbers = [number for _, _, number in entries]
+
+    def __len__(self) -> int:
+        """Get the number of distinct names in the index."""
+        return len(self._suggestions)
+
+    def suggest(self, prefix: str, limit: int) -> list[SuggestionDict]:
+        """Get the names that start with a prefix, or have a word that does.
+
+        Args:
+            prefix (str): What the user typed, normalized here.
+            limit (int): Maximum number of suggestions.
+
+        Returns:
+            list[SuggestionDict]: Suggestions in the order of their keys,
+                so shorter names come before longer ones with the same
+                start. The dicts are shared and must not be changed.
+        """
+        prefix = normalize_name(prefix)
+        if not prefix:
+            return []
+        seen: set[int] = set()
+        suggestions: list[SuggestionDict] = []
+        for i in range(bisect.bisect_left(self._keys, prefix), len(self._keys)):
+            if len(suggestions) >= limit or not self._keys[i].startswith(prefix):
+                break
+            number = self._numbers[i]
+            if number not in seen:
+                seen.add(number)
+                suggestions.append(self._suggestions[number])
+        return suggestions
+
+
+def get_autocomplete_index() -> ChordAutocompleteIndex:
+    """Get the index of the current catalog version, building it if needed.
+
+    Returns:
+        ChordAutocompleteIndex: The index shared by the threads of the
+            process.
+    """
+    return _index_cache.get_or_build(
+        "index", lambda: ChordAutocompleteIndex(get_chord_names())
+    )
@@ -0,0 +1,211 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Compact binary format of chord payloads and its reference decoder.
+
+The format carries the same data as the JSON of `ChordOutputSerializer`
+without the repeated keys. All numbers are little-endian.
+
+Header (8 bytes)::
+
+    magic     4s  b"G0CH"
+    version   B   1
+    kind      B   0 - list, 1 - one chord, 2 - page of a list
+    reserved  H   0
+
+Then, by kind:
+
+- list: `count` (I), then `count` chords;
+- one chord: a single chord;
+- page: `next` (string, empty if there is no next page), `count` (I), then
+  `count` chords.
+
+Chord::
+
+    id             I
+    order_in_note  H
+    start_fret     B
+    flags          B   bit 0 - has_barre
+    title          string
+    musical_title  string
+    positions      B   count, then `count` positions
+
+Position (3 bytes)::
+
+    string_number  B
+    fret           b   -1 for a muted string
+    finger         B
+
+String: length in bytes (H), then UTF-8 bytes.
+"""
+
+import struct
+from collections.abc import Iterable
+from typing import Any, Final
+
+BINARY_MAGIC: Final[bytes] = b"G0CH"
+"""First bytes of every payload."""
+
+BINARY_VERSION: Final[int] = 1
+"""Version of the format, changed on incompatible changes."""
+
+KIND_LIST: Final[int] = 0
+KIND_CHORD: Final[int] = 1
+KIND_PAGE: Final[int] = 2
+
+_HEADER = struct.Struct("<4sBBH")
+_COUNT = struct.Struct("<I")
+_STRING_LENGTH = struct.Struct("<H")
+_CHORD = struct.Struct("<IHBB")
+_POSITION = struct.Struct("<BbB")
+_POSITIONS_COUNT = struct.Struct("<B")
+_HAS_BARRE: Final[int] = 0b1
+
+
+def encode_chords(data: Any) -> bytes:  # noqa: ANN401
+    """Encode serialized chords into the binary format.
+
+    Args:
+        data (Any): A list of chords, one chord or a page (`next` and
+            `results`), as produced by `ChordOutputSerializer`.
+
+    Returns:
+        bytes: The binary payload.
+
+    Raises:
+        ValueError: If the data is not a chord payload.
+    """
+    parts: list[bytes] = []
+    if isinstance(data, list):
+        parts.append(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, KIND_LIST, 0))
+        _encode_list(parts, data)
+    elif isinstance(data, dict) and "results" in data:
+        parts.append(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, KIND_PAGE, 0))
+        _encode_string(parts, data.get("next") or "")
+        _encode_list(parts, data["results"])
+    elif isinstance(data, dict) and "id" in data:
+        parts.append(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, KIND_CHORD, 0))
+        _encode_chord(parts, data)
+    else:
+        raise ValueError("Not a chord payload.")
+    return b"".join(parts)
+
+
+def _encode_list(parts: list[bytes], chords: Iterable[dict[str, Any]]) -> None:
+    """Append a counted list of chords."""
+    chords = list(chords)
+    parts.append(_COUNT.pack(len(chords)))
+    for chord in chords:
+        _encode_chord(parts, chord)
+
+
+def _encode_chord(parts: list[bytes], chord: dict[str, Any]) -> None:
+    """Append one chord."""
+    flags = _HAS_BARRE if chord["has_barre"] else 0
+    parts.append(
+        _CHORD.pack(chord["id"], chord["order_in_note"], chord["start_fret"], flags)
+    )
+    _encode_string(parts, chord["title"])
+    _encode_string(parts, chord["musical_title"])
+    positions = chord["positions"]
+    parts.append(_POSITIONS_COUNT.pack(len(positions)))
+    parts.extend(
+        _POSITION.pack(p["string_number"], p["fret"], p["finger"]) for p in positions
+    )
+
+
+def _encode_string(parts: list[bytes], value: str) -> None:
+    """Append a length-prefixed UTF-8 string."""
+    encoded = value.encode()
+    parts.append(_STRING_LENGTH.pack(len(encoded)))
+    parts.append(encoded)
+
+
+def decode_chords(payload: bytes) -> Any:  # noqa: ANN401
+    """Decode a binary payload (the reference decoder).
+
+    Args:
+        payload (bytes): The binary payload.
+
+    Returns:
+        Any: The same data as the JSON representation: a list of chords,
+            one chord or a page with `next` (None on the last page) and
+            `results`.
+
+    Raises:
+        ValueError: If the payload is malformed or has another version.
+    """
+    reader = _Reader(payload)
+    try:
+        magic, version, kind, _ = reader.unpack(_HEADER)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError("Unsupported chord payload.")
+        result: Any
+        if kind == KIND_LIST:
+            result = reader.read_list()
+        elif kind == KIND_CHORD:
+            result = reader.read_chord()
+        elif kind == KIND_PAGE:
+            next_link = reader.read_string() or None
+            result = {"next": next_link, "results": reader.read_list()}
+        else:
+            raise ValueError(f"Unknown payload kind {kind}.")
+    except (struct.error, UnicodeDecodeError) as e:
+        raise ValueError("Truncated or malformed chord payload.") from e
+    if reader.offset != len(payload):
+        raise ValueError("Unexpected data after the chord payload.")
+    return result
+
+
+class _Reader:
+    """Sequential reader over a binary payload."""
+
+    def __init__(self, payload: bytes) -> None:
+        """Start reading at the beginning of the payload."""
+        self.payload = payload
+        self.offset = 0
+
+    def unpack(self, fmt: struct.Struct) -> tuple[Any, ...]:
+        """Read one struct."""
+        values = fmt.unpack_from(self.payload, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def read_string(self) -> str:
+        """Read a length-prefixed UTF-8 string."""
+        (length,) = self.unpack(_STRING_LENGTH)
+        raw = self.payload[self.offset : self.offset + length]
+        if len(raw) != length:
+            raise struct.error("string is truncated")
+        self.offset += length
+        return raw.decode()
+
+    def read_list(self) -> list[dict[str, Any]]:
+        """Read a counted list of chords."""
+        (count,) = self.unpack(_COUNT)
+        return [self.read_chord() for _ in range(count)]
+
+    def read_chord(self) -> dict[str, Any]:
+        """Read one chord."""
+        chord_id, order_in_note, start_fret, flags = self.unpack(_CHORD)
+        title = self.read_string()
+        musical_title = self.read_string()
+        (count,) = self.unpack(_POSITIONS_COUNT)
+        positions = []
+        for _ in range(count):
+            string_number, fret, finger = self.unpack(_POSITION)
+            positions.append({
+                "string_number": string_number,
+                "fret": fret,
+                "finger": finger,
+            })
+        return {
+            "id": chord_id,
+            "title": title,
+            "musical_title": musical_title,
+            "order_in_note": order_in_note,
+            "start_fret": start_fret,
+            "has_barre": bool(flags & _HAS_BARRE),
+            "positions": positions,
+        }
@@ -0,0 +1,199 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Catalog version tracking for the chords app.
+
+The catalog version is a counter stored in the default Django cache.
+`ChordService` bumps it after each committed write, and per-process caches use
+it as a key to know when they are stale. Workers only see each other's bumps
+when that cache is shared (e.g. Redis); the `chords.W001` deploy check warns
+about the process-local default.
+"""
+
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from datetime import datetime
+from typing import Final
+
+from django.core.cache import cache
+from django.utils import timezone
+
+CATALOG_VERSION_KEY: Final[str] = "chords:catalog-version"
+"""Cache key of the catalog version counter."""
+
+CATALOG_MODIFIED_KEY: Final[str] = "chords:catalog-modified"
+"""Cache key of the time of the last catalog change."""
+
+
+def get_catalog_version() -> int:
+    """Get the current catalog version.
+
+    The counter is seeded with the current time, so a cache flush never
+    brings back a version that was already used before.
+
+    Returns:
+        int: The current catalog version.
+    """
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        # The cache backend does not store anything (e.g. DummyCache).
+        return time.time_ns()
+    return int(version)
+
+
+async def aget_catalog_version() -> int:
+    """Get the current catalog version, the async version.
+
+    Returns:
+        int: The current catalog version.
+    """
+    version = await cache.aget(CATALOG_VERSION_KEY)
+    if version is None:
+        await cache.aadd(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+        version = await cache.aget(CATALOG_VERSION_KEY)
+    if version is None:
+        return time.time_ns()
+    return int(version)
+
+
+def get_catalog_modified() -> datetime:
+    """Get the time of the last catalog change.
+
+    If the time is unknown (e.g. after a cache flush), the current time is
+    stored, so clients revalidate rather than keep stale data.
+
+    Returns:
+        datetime: Time of the last catalog change, with second precision.
+    """
+    modified = cache.get(CATALOG_MODIFIED_KEY)
+    if modified is None:
+        cache.add(CATALOG_MODIFIED_KEY, _now(), timeout=None)
+        modified = cache.get(CATALOG_MODIFIED_KEY)
+    if modified is None:
+        return _now()
+    return modified  # type: ignore[no-any-return]
+
+
+async def aget_catalog_modified() -> datetime:
+    """Get the time of the last catalog change, the async version.
+
+    Returns:
+        datetime: Time of the last catalog change, with second precision.
+    """
+    modified = await cache.aget(CATALOG_MODIFIED_KEY)
+    if modified is None:
+        await cache.aadd(CATALOG_MODIFIED_KEY, _now(), timeout=None)
+        modified = await cache.aget(CATALOG_MODIFIED_KEY)
+    if modified is None:
+        return _now()
+    return modified  # type: ignore[no-any-return]
+
+
+def bump_catalog_version() -> None:
+    """Move the catalog to a new version.
+
+    Must be called after the changes are committed (see
+    `django.db.transaction.on_commit`), otherwise another process may cache
+    the old data under the new version.
+    """
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.add(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+    cache.set(CATALOG_MODIFIED_KEY, _now(), timeout=None)
+
+
+def _now() -> datetime:
+    """Get the current time truncated to HTTP date precision."""
+    return timezone.now().replace(microsecond=0)
+
+
+class CatalogCache[T]:
+    """Per-process cache of values derived from the chord catalog.
+
+    All entries are dropped as soon as the catalog version changes.
+
+    Attributes:
+        max_entries (int): Maximum number of entries kept for one version.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of entries kept for one version.
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._version: int | None = None
+        self._values: dict[Hashable, T] = {}
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], T]) -> T:
+        """Get a cached value or build it for the current catalog version.
+
+        Args:
+            key (Hashable): Key of the value inside one catalog version.
+            builder (Callable[[], T]): Function that builds the value.
+
+        Returns:
+            T: The cached or freshly built value.
+        """
+        version = get_catalog_version()
+        cached = self._lookup(version, key)
+        if cached is not None:
+            return cached[0]
+        value = builder()
+        self._store(version, key, value)
+        return value
+
+    async def aget_or_build(
+        self, key: Hashable, builder: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Get a cached value or build it, the async version.
+
+        Args:
+            key (Hashable): Key of the value inside one catalog version.
+            builder (Callable[[], Awaitable[T]]): Coroutine function that
+                builds the value.
+
+        Returns:
+            T: The cached or freshly built value.
+        """
+        version = await aget_catalog_version()
+        cached = self._lookup(version, key)
+        if cached is not None:
+            return cached[0]
+        value = await builder()
+        self._store(version, key, value)
+        return value
+
+    def _lookup(self, version: int, key: Hashable) -> tuple[T] | None:
+        """Find a value, dropping the values of another catalog version.
+
+        Returns:
+            tuple[T] | None: The value in a tuple, or None if it is missing.
+        """
+        with self._lock:
+            if self._version != version:
+                self._version = version
+                self._values = {}
+            elif key in self._values:
+                return (self._values[key],)
+        return None
+
+    def _store(self, version: int, key: Hashable, value: T) -> None:
+        """Keep a value built for a catalog version, if there is room."""
+        with self._lock:
+            if self._version == version and len(self._values) < self.max_entries:
+                self._values[key] = value
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._version = None
+            self._values = {}
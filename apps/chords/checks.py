@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""System checks for the chords application."""
+
+from collections.abc import Sequence
+from typing import Final
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.core import checks
+
+PROCESS_LOCAL_CACHE_BACKENDS: Final[frozenset[str]] = frozenset({
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+})
+"""Cache backends whose data is not shared between worker processes."""
+
+
+@checks.register(checks.Tags.caches, deploy=True)
+def check_shared_catalog_cache(
+    app_configs: Sequence[AppConfig] | None, **kwargs: object
+) -> list[checks.CheckMessage]:
+    """Warn when the catalog version lives in a process-local cache.
+
+    The catalog version (see `apps.chords.catalog`) is only seen by every
+    worker when the default cache is shared, e.g. Redis or Memcached. With a
+    process-local backend a write handled by one worker does not invalidate
+    the cached lists and ETags of the others.
+
+    Args:
+        app_configs (Sequence[AppConfig] | None): Apps to check, unused.
+        **kwargs (object): Extra arguments passed by the check framework.
+
+    Returns:
+        list[checks.CheckMessage]: A warning if the cache is process-local.
+    """
+    backend = settings.CACHES["default"]["BACKEND"]
+    if backend not in PROCESS_LOCAL_CACHE_BACKENDS:
+        return []
+    return [
+        checks.Warning(
+            f"The default cache backend {backend} is local to one process.",
+            hint=(
+                "Set CACHE_BACKEND to a shared cache (e.g. Redis) when running "
+                "several workers, otherwise they serve stale chord data."
+            ),
+            id="chords.W001",
+        )
+    ]
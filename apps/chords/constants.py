@@ -23,3 +23,30 @@ MIN_FINGER: Final[int] = 0
 
 MAX_FINGER: Final[int] = 4
 """Maximum finger value (1-4 for fingers, 0 for open)."""
+
+MAX_START_FRET: Final[int] = 255
+"""Maximum start fret of a chord, the binary format stores it in one byte."""
+
+MAX_IDENTIFY_SHAPES: Final[int] = 1000
+"""Maximum number of shapes identified in one request."""
+
+MAX_BATCH_CHORDS: Final[int] = 100
+"""Maximum number of ids or titles looked up in one multi-get request."""
+
+MAX_TRANSPOSE_CHORDS: Final[int] = 1000
+"""Maximum number of chords transposed in one request."""
+
+MAX_TRANSPOSE_SEMITONES: Final[int] = 11
+"""Largest transposition in semitones, larger ones repeat an octave."""
+
+MAX_VOICING_STRETCH: Final[int] = 5
+"""Widest stretch between the lowest and highest pressed frets of a voicing."""
+
+MAX_VOICINGS: Final[int] = 50
+"""Maximum number of voicings generated in one request."""
+
+MAX_SEARCH_RESULTS: Final[int] = 50
+"""Maximum number of chords returned by the fuzzy search."""
+
+MAX_AUTOCOMPLETE_SUGGESTIONS: Final[int] = 20
+"""Maximum number of autocomplete suggestions returned for one prefix."""
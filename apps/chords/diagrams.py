@@ -0,0 +1,494 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Chord diagrams rendered on the server, as SVG or PNG.
+
+A diagram depends only on the start fret, the barre flag and the packed
+positions of a chord (`DiagramSpec`), not on its title or id, so chords
+with the same fingering share one rendered file. Both formats are drawn
+from the same list of shapes, so they look the same.
+
+Rendered diagrams are kept on disk under `CHORD_DIAGRAM_ROOT`, named by a
+hash of the format and the spec: a file never changes once written. When a
+chord changes, its new diagram gets a new file; the `prune_chord_diagrams`
+management command deletes the files no chord of the catalog uses anymore.
+Diagrams that are not on disk yet are rendered in a process pool of
+`CHORD_DIAGRAM_WORKERS` processes (in the calling thread if it is 0), with
+a bounded number of renders waiting for a worker.
+"""
+
+import hashlib
+import io
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Final, Literal, NamedTuple
+
+from django.conf import settings
+from PIL import Image, ImageDraw, ImageFont
+
+from .constants import MAX_STRING_NUMBER
+from .packing import unpack_positions
+
+type DiagramFormat = Literal["svg", "png"]
+
+DIAGRAM_VERSION: Final[int] = 1
+"""Version of the drawing, part of the file names; change it with the look."""
+
+DIAGRAM_CONTENT_TYPES: Final[dict[DiagramFormat, str]] = {
+    "svg": "image/svg+xml",
+    "png": "image/png",
+}
+
+MIN_FRET_ROWS: Final[int] = 5
+"""Number of fret rows shown if the chord fits in them."""
+
+QUEUED_RENDERS_PER_WORKER: Final[int] = 4
+"""Cold renders that may wait for every worker before new ones are refused."""
+
+RENDER_WAIT_SECONDS: Final[float] = 5.0
+"""How long a cold render waits for a free place in the queue."""
+
+PNG_SCALE: Final[int] = 2
+"""Pixels of a PNG diagram per pixel of the SVG one."""
+
+DIAGRAM_FILE_MODE: Final[int] = 0o644
+"""Permissions of the written files, so a web server can read them."""
+
+_STRING_GAP: Final[int] = 16
+_FRET_GAP: Final[int] = 22
+_LEFT: Final[int] = 24
+_TOP: Final[int] = 30
+_DOT_RADIUS: Final[int] = 7
+_MARK_RADIUS: Final[int] = 4
+_TEXT_SIZE: Final[int] = 9
+_COLOR: Final[str] = "#000000"
+_INVERSE_COLOR: Final[str] = "#ffffff"
+
+
+class DiagramSpec(NamedTuple):
+    """Everything a chord diagram depends on.
+
+    Attributes:
+        start_fret (int): The fret the diagram starts at.
+        has_barre (bool): Draw a barre over the strings pressed by the
+            first finger on the lowest fret.
+        packed_positions (str): Positions packed by `pack_positions`.
+    """
+
+    start_fret: int
+    has_barre: bool
+    packed_positions: str
+
+    def get_key(self, diagram_format: DiagramFormat) -> str:
+        """Get the content key of the rendered diagram.
+
+        Args:
+            diagram_format (DiagramFormat): Format of the diagram.
+
+        Returns:
+            str: A hex digest that changes with the diagram content.
+        """
+        source = (
+            f"{DIAGRAM_VERSION}|{diagram_format}|{self.start_fret}|"
+            f"{int(self.has_barre)}|{self.packed_positions}"
+        )
+        return hashlib.sha256(source.encode()).hexdigest()[:32]
+
+
+class DiagramBusyError(Exception):
+    """Too many diagrams are waiting to be rendered."""
+
+
+class _Line(NamedTuple):
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+    width: float
+
+
+class _Circle(NamedTuple):
+    x: float
+    y: float
+    radius: float
+    filled: bool
+
+
+class _Bar(NamedTuple):
+    x1: float
+    x2: float
+    y: float
+    radius: float
+
+
+class _Text(NamedTuple):
+    x: float
+    y: float
+    text: str
+    inverse: bool
+
+
+type _Shape = _Line | _Circle | _Bar | _Text
+
+
+def _layout(spec: DiagramSpec) -> tuple[int, int, list[_Shape]]:
+    """Lay out a diagram.
+
+    Strings are vertical lines, the sixth string on the left. Open strings
+    are marked with a circle above the grid and muted ones with a cross.
+
+    Returns:
+        tuple[int, int, list[_Shape]]: Width, height and the shapes.
+    """
+    positions = unpack_positions(spec.packed_positions)
+    start = max(spec.start_fret, 1)
+    pressed = [p for p in positions if p["fret"] > 0]
+    last_fret = max((p["fret"] for p in pressed), default=start)
+    rows = max(MIN_FRET_ROWS, last_fret - start + 1)
+    right = _LEFT + _STRING_GAP * (MAX_STRING_NUMBER - 1)
+    bottom = _TOP + _FRET_GAP * rows
+    width = right + _LEFT
+    height = bottom + _FRET_GAP // 2
+
+    def string_x(string_number: int) -> float:
+        return _LEFT + _STRING_GAP * (MAX_STRING_NUMBER - string_number)
+
+    def fret_y(fret: int) -> float:
+        return _TOP + _FRET_GAP * (fret - start + 0.5)
+
+    shapes: list[_Shape] = [
+        _Line(string_x(s), _TOP, string_x(s), bottom, 1)
+        for s in range(1, MAX_STRING_NUMBER + 1)
+    ]
+    shapes.extend(
+        _Line(_LEFT, _TOP + _FRET_GAP * row, right, _TOP + _FRET_GAP * row, 1)
+        for row in range(rows + 1)
+    )
+    if start == 1:
+        shapes.append(_Line(_LEFT, _TOP - 2, right, _TOP - 2, 4))
+    else:
+        shapes.append(_Text(_LEFT / 2, fret_y(start), str(start), inverse=False))
+
+    mark_y = _TOP - _FRET_GAP / 2
+    for position in positions:
+        x = string_x(position["string_number"])
+        if position["fret"] < 0:
+            shapes.append(_Line(x - 4, mark_y - 4, x + 4, mark_y + 4, 1.5))
+            shapes.append(_Line(x - 4, mark_y + 4, x + 4, mark_y - 4, 1.5))
+        elif position["fret"] == 0:
+            shapes.append(_Circle(x, mark_y, _MARK_RADIUS, filled=False))
+
+    if spec.has_barre and pressed:
+        barre_fret = min(p["fret"] for p in pressed)
+        strings = [
+            p["string_number"]
+            for p in pressed
+            if p["fret"] == barre_fret and p["finger"] in {0, 1}
+        ]
+        shapes.append(
+            _Bar(
+                string_x(max(strings, default=MAX_STRING_NUMBER)),
+                string_x(min(strings, default=1)),
+                fret_y(barre_fret),
+                _DOT_RADIUS,
+            )
+        )
+    for position in pressed:
+        x, y = string_x(position["string_number"]), fret_y(position["fret"])
+        shapes.append(_Circle(x, y, _DOT_RADIUS, filled=True))
+        if position["finger"]:
+            shapes.append(_Text(x, y, str(position["finger"]), inverse=True))
+    return width, height, shapes
+
+
+def _svg_element(shape: _Shape) -> str:
+    """Get the SVG element of a shape."""
+    match shape:
+        case _Line(x1, y1, x2, y2, line_width):
+            return (
+                f'<line x1="{x1:g}" y1="{y1:g}" x2="{x2:g}" y2="{y2:g}" '
+                f'stroke="{_COLOR}" stroke-width="{line_width:g}"/>'
+            )
+        case _Circle(x, y, radius, filled):
+            paint = f'fill="{_COLOR}"' if filled else f'fill="none" stroke="{_COLOR}"'
+            return f'<circle cx="{x:g}" cy="{y:g}" r="{radius:g}" {paint}/>'
+        case _Bar(x1, x2, y, radius):
+            return (
+                f'<rect x="{x1 - radius:g}" y="{y - radius:g}" '
+                f'width="{x2 - x1 + 2 * radius:g}" height="{2 * radius:g}" '
+                f'rx="{radius:g}" fill="{_COLOR}"/>'
+            )
+        case _Text(x, y, text, inverse):
+            color = _INVERSE_COLOR if inverse else _COLOR
+            return f'<text x="{x:g}" y="{y:g}" fill="{color}">{text}</text>'
+
+
+def render_svg(spec: DiagramSpec) -> bytes:
+    """Render a diagram as SVG.
+
+    Args:
+        spec (DiagramSpec): The diagram.
+
+    Returns:
+        bytes: The SVG document.
+    """
+    width, height, shapes = _layout(spec)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{height}" viewBox="0 0 {width} {height}" '
+        f'font-family="sans-serif" font-size="{_TEXT_SIZE}" '
+        f'text-anchor="middle" dominant-baseline="central">',
+        *(_svg_element(shape) for shape in shapes),
+        "</svg>",
+    ]
+    return "".join(parts).encode()
+
+
+def _draw_shape(
+    draw: ImageDraw.ImageDraw,
+    shape: _Shape,
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
+) -> None:
+    """Draw a shape on a PNG image at `PNG_SCALE`."""
+    scale = PNG_SCALE
+    match shape:
+        case _Line(x1, y1, x2, y2, line_width):
+            draw.line(
+                [(x1 * scale, y1 * scale), (x2 * scale, y2 * scale)],
+                fill=_COLOR,
+                width=round(line_width * scale),
+            )
+        case _Circle(x, y, radius, filled):
+            box = [
+                ((x - radius) * scale, (y - radius) * scale),
+                ((x + radius) * scale, (y + radius) * scale),
+            ]
+            if filled:
+                draw.ellipse(box, fill=_COLOR)
+            else:
+                draw.ellipse(box, outline=_COLOR, width=scale)
+        case _Bar(x1, x2, y, radius):
+            draw.rounded_rectangle(
+                [
+                    ((x1 - radius) * scale, (y - radius) * scale),
+                    ((x2 + radius) * scale, (y + radius) * scale),
+                ],
+                radius=radius * scale,
+                fill=_COLOR,
+            )
+        case _Text(x, y, text, inverse):
+            draw.text(
+                (x * scale, y * scale),
+                text,
+                fill=_INVERSE_COLOR if inverse else _COLOR,
+                font=font,
+                anchor="mm",
+            )
+
+
+def render_png(spec: DiagramSpec) -> bytes:
+    """Render a diagram as PNG with a transparent background.
+
+    Args:
+        spec (DiagramSpec): The diagram.
+
+    Returns:
+        bytes: The PNG image, at twice the size of the SVG one.
+    """
+    width, height, shapes = _layout(spec)
+    image = Image.new("RGBA", (width * PNG_SCALE, height * PNG_SCALE), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=_TEXT_SIZE * PNG_SCALE)
+    for shape in shapes:
+        _draw_shape(draw, shape, font)
+    output = io.BytesIO()
+    image.save(output, format="PNG", optimize=True)
+    return output.getvalue()
+
+
+def get_png_size(spec: DiagramSpec) -> tuple[int, int]:
+    """Get the size of a PNG diagram without rendering it.
+
+    Args:
+        spec (DiagramSpec): The diagram.
+
+    Returns:
+        tuple[int, int]: Width and height in pixels.
+    """
+    width, height, _ = _layout(spec)
+    return width * PNG_SCALE, height * PNG_SCALE
+
+
+def render_diagram(diagram_format: DiagramFormat, spec: DiagramSpec) -> bytes:
+    """Render a diagram in a format; runs in the worker processes.
+
+    Args:
+        diagram_format (DiagramFormat): Format of the diagram.
+        spec (DiagramSpec): The diagram.
+
+    Returns:
+        bytes: The rendered diagram.
+    """
+    if diagram_format == "png":
+        return render_png(spec)
+    return render_svg(spec)
+
+
+def get_diagram(diagram_format: DiagramFormat, spec: DiagramSpec) -> bytes:
+    """Get a rendered diagram from the disk cache, rendering it if needed.
+
+    Args:
+        diagram_format (DiagramFormat): Format of the diagram.
+        spec (DiagramSpec): The diagram.
+
+    Returns:
+        bytes: The rendered diagram.
+
+    Raises:
+        DiagramBusyError: If the render queue stays full for
+            `RENDER_WAIT_SECONDS`.
+    """
+    content = get_cached_diagram(diagram_format, spec)
+    if content is not None:
+        return content
+
+    content = run_in_render_pool(render_diagram, diagram_format, spec)
+    write_atomically(get_diagram_path(diagram_format, spec), content)
+    return content
+
+
+def get_cached_diagram(
+    diagram_format: DiagramFormat, spec: DiagramSpec
+) -> bytes | None:
+    """Get a rendered diagram from the disk cache without rendering it.
+
+    Args:
+        diagram_format (DiagramFormat): Format of the diagram.
+        spec (DiagramSpec): The diagram.
+
+    Returns:
+        bytes | None: The rendered diagram, or None if it is not on disk.
+    """
+    try:
+        return get_diagram_path(diagram_format, spec).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def get_diagram_path(diagram_format: DiagramFormat, spec: DiagramSpec) -> Path:
+    """Get the path of a rendered diagram on disk.
+
+    Args:
+        diagram_format (DiagramFormat): Format of the diagram.
+        spec (DiagramSpec): The diagram.
+
+    Returns:
+        Path: The path, the file may not exist.
+    """
+    key = spec.get_key(diagram_format)
+    return Path(settings.CHORD_DIAGRAM_ROOT) / key[:2] / f"{key}.{diagram_format}"
+
+
+def write_atomically(path: Path, content: bytes) -> None:
+    """Write a file so that readers never see it half written.
+
+    Args:
+        path (Path): Path of the file; missing directories are created.
+        content (bytes): Content of the file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as file:
+        file.write(content)
+    # The temporary file is created readable by its owner only
+    os.chmod(file.name, DIAGRAM_FILE_MODE)
+    os.replace(file.name, path)
+
+
+def prune_diagrams(specs: Iterable[DiagramSpec]) -> int:
+    """Delete the rendered diagrams of every other spec from the disk.
+
+    Args:
+        specs (Iterable[DiagramSpec]): The diagrams to keep.
+
+    Returns:
+        int: The number of deleted files.
+    """
+    keep = {
+        get_diagram_path(diagram_format, spec)
+        for spec in specs
+        for diagram_format in DIAGRAM_CONTENT_TYPES
+    }
+    root = Path(settings.CHORD_DIAGRAM_ROOT)
+    deleted = 0
+    for diagram_format in DIAGRAM_CONTENT_TYPES:
+        for path in root.glob(f"??/*.{diagram_format}"):
+            if path not in keep:
+                path.unlink(missing_ok=True)
+                deleted += 1
+    return deleted
+
+
+_pool_lock = threading.Lock()
+_pool: tuple[int, Executor, threading.BoundedSemaphore] | None = None
+
+
+def run_in_render_pool[*Ts](func: Callable[[*Ts], bytes], *args: *Ts) -> bytes:
+    """Run a render function in the worker pool, or inline without workers.
+
+    Args:
+        func (Callable[[*Ts], bytes]): A module level function, so that it
+            can be sent to the workers.
+        *args (*Ts): Picklable arguments of the function.
+
+    Returns:
+        bytes: The result of the function.
+
+    Raises:
+        DiagramBusyError: If the render queue stays full for
+            `RENDER_WAIT_SECONDS`.
+    """
+    workers = int(settings.CHORD_DIAGRAM_WORKERS)
+    if workers <= 0:
+        return func(*args)
+
+    executor, queue = _get_pool(workers)
+    if not queue.acquire(timeout=RENDER_WAIT_SECONDS):
+        raise DiagramBusyError("Too many diagrams are being rendered.")
+    try:
+        return executor.submit(func, *args).result()
+    finally:
+        queue.release()
+
+
+def _get_pool(workers: int) -> tuple[Executor, threading.BoundedSemaphore]:
+    """Get the process pool of a size, starting it on first use.
+
+    Workers are spawned, not forked, so they do not inherit the threads
+    and connections of the server process.
+    """
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        if _pool is None or _pool[0] != workers:
+            if _pool is not None:
+                _pool[1].shutdown(wait=False)
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            queue = threading.BoundedSemaphore(workers * QUEUED_RENDERS_PER_WORKER)
+            _pool = (workers, executor, queue)
+        return _pool[1], _pool[2]
+
+
+def shutdown_diagram_pool() -> None:
+    """Stop the worker processes; the next cold render starts new ones."""
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        if _pool is not None:
+            _pool[1].shutdown()
+            _pool = None
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Export the chord catalog as NDJSON or CSV."""
+
+import argparse
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from apps.chords.api.export import EXPORT_CHUNK_SIZE, export_chords
+
+
+class Command(BaseCommand):
+    """Write the catalog to a file or to stdout, one chunk at a time."""
+
+    help = "Export all chords as NDJSON or CSV without loading them in memory."
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:  # noqa: PLR6301
+        """Add the command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): Parser of the command.
+        """
+        parser.add_argument(
+            "--format",
+            choices=("ndjson", "csv"),
+            default="ndjson",
+            dest="export_format",
+            help="Output format (default: ndjson).",
+        )
+        parser.add_argument(
+            "--output",
+            "-o",
+            type=Path,
+            help="File to write, stdout if not given.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help=f"Chords read at a time (default: {EXPORT_CHUNK_SIZE}).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401
+        """Run the export.
+
+        Args:
+            *args (Any): Positional arguments, unused.
+            **options (Any): Parsed command line options.
+        """
+        chunks = export_chords(
+            options["export_format"], chunk_size=max(options["chunk_size"], 1)
+        )
+        output: Path | None = options["output"]
+        if output is None:
+            for chunk in chunks:
+                self.stdout.write(chunk.decode(), ending="")
+            return
+
+        size = 0
+        with output.open("wb") as file:
+            for chunk in chunks:
+                file.write(chunk)
+                size += len(chunk)
+        self.stderr.write(f"Exported {size} bytes to {output}.")
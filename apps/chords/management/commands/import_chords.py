@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Import chords from an NDJSON or CSV file."""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, TextIO
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.chords.api.imports import (
+    IMPORT_BATCH_SIZE,
+    ImportFormat,
+    read_import_batches,
+)
+from apps.chords.services import ChordImportService
+
+
+class Command(BaseCommand):
+    """Create the chords of a file in batches and report the throughput."""
+
+    help = (
+        "Import new chords from an NDJSON or CSV file (the export formats), "
+        "with COPY on PostgreSQL and bulk_create elsewhere."
+    )
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:  # noqa: PLR6301
+        """Add the command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): Parser of the command.
+        """
+        parser.add_argument("path", help="File to import, - for stdin.")
+        parser.add_argument(
+            "--format",
+            choices=("ndjson", "csv"),
+            dest="import_format",
+            help="Input format (default: from the extension, else ndjson).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help=f"Lines written at a time (default: {IMPORT_BATCH_SIZE}).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401
+        """Run the import.
+
+        Args:
+            *args (Any): Positional arguments, unused.
+            **options (Any): Parsed command line options.
+
+        Raises:
+            CommandError: If the file cannot be opened.
+        """
+        path: str = options["path"]
+        import_format: ImportFormat = options["import_format"] or (
+            "csv" if path.lower().endswith(".csv") else "ndjson"
+        )
+        batch_size = max(options["batch_size"], 1)
+        if path == "-":
+            self._import(sys.stdin, import_format, batch_size)
+            return
+        try:
+            file = Path(path).open(encoding="utf-8", newline="")  # noqa: SIM115
+        except OSError as e:
+            raise CommandError(f"Cannot open {path}: {e.strerror}.") from e
+        with file:
+            self._import(file, import_format, batch_size)
+
+    def _import(
+        self, file: TextIO, import_format: ImportFormat, batch_size: int
+    ) -> None:
+        """Import the chords of an open file.
+
+        Args:
+            file (TextIO): The file.
+            import_format (ImportFormat): `ndjson` or `csv`.
+            batch_size (int): Lines per batch and transaction.
+        """
+        started = time.perf_counter()
+        imported = rejected = 0
+        for batch in read_import_batches(file, import_format, batch_size=batch_size):
+            imported += ChordImportService.import_chords(chords=batch["chords"])
+            for error in batch["errors"]:
+                self.stderr.write(
+                    f"Line {error['line']}: {json.dumps(error['errors'])}"
+                )
+            rejected += len(batch["errors"])
+        elapsed = time.perf_counter() - started
+
+        method = "COPY" if connection.vendor == "postgresql" else "bulk_create"
+        rate = imported / elapsed if elapsed > 0 else 0.0
+        self.stdout.write(
+            f"Imported {imported} chords in {elapsed:.2f} s "
+            f"({rate:.0f} chords/s, {method}), rejected {rejected} lines."
+        )
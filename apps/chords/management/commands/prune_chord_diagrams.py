@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Delete the diagrams and sprite sheets that the catalog no longer uses."""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from apps.chords.diagrams import prune_diagrams
+from apps.chords.selectors import get_chord_diagram_specs
+from apps.chords.sprites import SPRITE_FORMATS, layout_sprites, prune_sprite_sheets
+
+
+class Command(BaseCommand):
+    """Prune the files of changed and deleted chords."""
+
+    help = "Delete diagrams and sprite sheets the chord catalog no longer uses."
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401
+        """Run the prune.
+
+        Args:
+            *args (Any): Positional arguments, unused.
+            **options (Any): Parsed command line options, unused.
+        """
+        chords = get_chord_diagram_specs()
+        diagrams = prune_diagrams(spec for _, _, spec in chords)
+        sheets = prune_sprite_sheets(
+            key
+            for sprite_format in SPRITE_FORMATS
+            for key in layout_sprites(sprite_format, chords).sheets
+        )
+        self.stdout.write(f"Deleted {diagrams} diagrams and {sheets} sprite sheets.")
@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Delete the chord tombstones that no sync token can reach anymore."""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.chords.services import ChordService
+from apps.chords.sync import get_sync_horizon
+
+
+class Command(BaseCommand):
+    """Prune the tombstones older than the sync retention window."""
+
+    help = "Delete chord tombstones older than the delta sync retention window."
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401
+        """Run the prune.
+
+        Args:
+            *args (Any): Positional arguments, unused.
+            **options (Any): Parsed command line options, unused.
+        """
+        deleted = ChordService.prune_tombstones(before=get_sync_horizon(timezone.now()))
+        self.stdout.write(f"Deleted {deleted} tombstones.")
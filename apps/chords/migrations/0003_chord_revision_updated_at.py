@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 5.2.8 on 2026-10-18 03:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chords", "0002_alter_chordposition_finger_alter_chordposition_fret"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chord",
+            name="revision",
+            field=models.PositiveIntegerField(
+                default=1, editable=False, verbose_name="Ревизия"
+            ),
+        ),
+        migrations.AddField(
+            model_name="chord",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, verbose_name="Дата изменения"),
+        ),
+    ]
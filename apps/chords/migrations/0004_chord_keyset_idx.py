@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 5.2.8 on 2026-10-18 04:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chords", "0003_chord_revision_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chord",
+            index=models.Index(
+                fields=["title", "order_in_note", "id"], name="chord_keyset_idx"
+            ),
+        ),
+    ]
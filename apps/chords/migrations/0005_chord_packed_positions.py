@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 5.2.8 on 2026-10-18 04:04
+
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+FRET_CODES = "x0123456789abc"
+
+
+def pack_existing_positions(
+    apps: StateApps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    Chord = apps.get_model("chords", "Chord")
+    ChordPosition = apps.get_model("chords", "ChordPosition")
+
+    packed: dict[int, str] = {}
+    positions = ChordPosition.objects.order_by("chord_id", "string_number")
+    for position in positions.iterator():
+        packed[position.chord_id] = packed.get(position.chord_id, "") + (
+            f"{position.string_number}{FRET_CODES[position.fret + 1]}"
+            f"{position.finger}"
+        )
+
+    chords = [
+        Chord(pk=chord_id, packed_positions=value) for chord_id, value in packed.items()
+    ]
+    Chord.objects.bulk_update(chords, ["packed_positions"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chords", "0004_chord_keyset_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chord",
+            name="packed_positions",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=18,
+                verbose_name="Позиции (упакованные)",
+            ),
+        ),
+        migrations.RunPython(pack_existing_positions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 5.2.8 on 2026-10-18 04:18
+
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def fill_shapes(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    Chord = apps.get_model("chords", "Chord")
+
+    chords = []
+    for chord in Chord.objects.exclude(packed_positions="").iterator():
+        packed = chord.packed_positions
+        frets = {int(packed[i]): packed[i + 1] for i in range(0, len(packed), 3)}
+        if all(string in frets for string in range(1, 7)):
+            chord.shape = "".join(frets[string] for string in range(6, 0, -1))
+            chords.append(chord)
+    Chord.objects.bulk_update(chords, ["shape"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chords", "0005_chord_packed_positions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chord",
+            name="shape",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                editable=False,
+                max_length=6,
+                verbose_name="Аппликатура",
+            ),
+        ),
+        migrations.RunPython(fill_shapes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 5.2.8 on 2026-10-18 04:21
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chords", "0006_chord_shape"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChordTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("chord_id", models.BigIntegerField(verbose_name="ID аккорда")),
+                (
+                    "deleted_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="Дата удаления",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="chord",
+            index=models.Index(fields=["updated_at", "id"], name="chord_updated_idx"),
+        ),
+    ]
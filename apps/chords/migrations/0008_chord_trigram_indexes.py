@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 5.2.8 on 2026-10-18 06:40
+
+from django.db import migrations
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+TRIGRAM_INDEXES = {
+    "chord_title_trgm_idx": "title",
+    "chord_musical_title_trgm_idx": "musical_title",
+}
+
+
+def create_trigram_indexes(
+    apps: StateApps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    # pg_trgm and the GIN indexes exist on PostgreSQL only, other databases
+    # search in Python
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    table = schema_editor.quote_name(apps.get_model("chords", "Chord")._meta.db_table)
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(name)} "
+            f"ON {table} USING gin ({schema_editor.quote_name(column)} gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(
+    apps: StateApps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    # The extension is left in place, other objects of the database may use it
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(name)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chords", "0007_chord_tombstone"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 5.2.8 on 2026-10-18 05:58
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chords", "0008_chord_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="chord",
+            name="start_fret",
+            field=models.PositiveSmallIntegerField(
+                default=1,
+                validators=[django.core.validators.MaxValueValidator(255)],
+                verbose_name="С какого лада начинается",
+            ),
+        ),
+    ]
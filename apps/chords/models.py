@@ -8,15 +8,18 @@ from typing import ClassVar
 
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.utils import timezone
 
 from apps.chords.constants import (
     MAX_FINGER,
     MAX_FRET,
+    MAX_START_FRET,
     MAX_STRING_NUMBER,
     MIN_FINGER,
     MIN_FRET,
     MIN_STRING_NUMBER,
 )
+from apps.chords.packing import PACKED_POSITIONS_MAX_LENGTH
 
 
 class Chord(models.Model):
@@ -28,13 +31,48 @@ class Chord(models.Model):
         order_in_note (int): Order of display for variations of the same chord.
         start_fret (int): The fret number where the chord diagram starts.
         has_barre (bool): Indicates if the chord requires a barre technique.
+        packed_positions (str): Denormalized copy of the positions, see
+            `apps.chords.packing`.
+        shape (str): Indexed fret shape like `x02210`, see `apps.chords.shapes`.
+        revision (int): Incremented on every change, used for the chord ETag.
+        updated_at (datetime): Time of the last change.
     """
 
     title = models.CharField("Название", max_length=50)
     musical_title = models.CharField("Музыкальное название", max_length=50)
     order_in_note = models.PositiveSmallIntegerField("Порядок отображения", default=1)
-    start_fret = models.PositiveSmallIntegerField("С какого лада начинается", default=1)
+    start_fret = models.PositiveSmallIntegerField(
+        "С какого лада начинается",
+        default=1,
+        validators=[MaxValueValidator(MAX_START_FRET)],
+    )
     has_barre = models.BooleanField("Есть барре?", default=False)
+    packed_positions = models.CharField(
+        "Позиции (упакованные)",
+        max_length=PACKED_POSITIONS_MAX_LENGTH,
+        blank=True,
+        default="",
+        editable=False,
+    )
+    shape = models.CharField(
+        "Аппликатура",
+        max_length=MAX_STRING_NUMBER,
+        blank=True,
+        default="",
+        editable=False,
+        db_index=True,
+    )
+    revision = models.PositiveIntegerField("Ревизия", default=1, editable=False)
+    updated_at = models.DateTimeField("Дата изменения", auto_now=True)
+
+    class Meta:
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(
+                fields=["title", "order_in_note", "id"],
+                name="chord_keyset_idx",
+            ),
+            models.Index(fields=["updated_at", "id"], name="chord_updated_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.title if not self.has_barre else f"{self.title} bare"
@@ -85,3 +123,20 @@ class ChordPosition(models.Model):
 
     def __str__(self) -> str:
         return f"String #{self.string_number}: fret {self.fret}, finger {self.finger}"
+
+
+class ChordTombstone(models.Model):
+    """Record of a deleted chord, used by the delta sync.
+
+    Attributes:
+        chord_id (int): Primary key of the deleted chord.
+        deleted_at (datetime): Time of the deletion.
+    """
+
+    chord_id = models.BigIntegerField("ID аккорда")
+    deleted_at = models.DateTimeField(
+        "Дата удаления", default=timezone.now, db_index=True
+    )
+
+    def __str__(self) -> str:
+        return f"Chord #{self.chord_id} deleted at {self.deleted_at}"
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Compact text representation of chord positions.
+
+Every position is packed into three characters: the string number, the fret
+code and the finger, e.g. `"100" "211" "323"` for strings 1-3. Frets use one
+character each: `x` for a muted string, then `0`-`9` and `a`-`c` for frets
+0-12. Positions are stored ordered by string number, the same order as
+`ChordPosition.Meta.ordering`.
+"""
+
+from collections.abc import Iterable
+from typing import Final, TypedDict
+
+from .constants import MAX_FRET, MAX_STRING_NUMBER, MIN_FRET
+
+FRET_CODES: Final[str] = "x0123456789abc"
+"""Fret codes, the code at index `i` stands for fret `i + MIN_FRET`."""
+
+PACKED_POSITION_LENGTH: Final[int] = 3
+"""Number of characters used by one position."""
+
+PACKED_POSITIONS_MAX_LENGTH: Final[int] = PACKED_POSITION_LENGTH * MAX_STRING_NUMBER
+"""Maximum length of packed positions of one chord."""
+
+
+class PackedPositionDict(TypedDict):
+    """Describe one unpacked chord position."""
+
+    string_number: int
+    fret: int
+    finger: int
+
+
+def encode_fret(fret: int) -> str:
+    """Encode a fret value into one character.
+
+    Args:
+        fret (int): Fret number, -1 for a muted string, 0 for an open one.
+
+    Returns:
+        str: The fret code.
+
+    Raises:
+        ValueError: If the fret is out of the supported range.
+    """
+    if not MIN_FRET <= fret <= MAX_FRET:
+        raise ValueError(f"Fret {fret} is out of range")
+    return FRET_CODES[fret - MIN_FRET]
+
+
+def decode_fret(code: str) -> int:
+    """Decode a fret character.
+
+    Args:
+        code (str): The fret code.
+
+    Returns:
+        int: Fret number, -1 for a muted string, 0 for an open one.
+
+    Raises:
+        ValueError: If the code is unknown.
+    """
+    index = FRET_CODES.find(code)
+    if len(code) != 1 or index < 0:
+        raise ValueError(f"Unknown fret code {code!r}")
+    return index + MIN_FRET
+
+
+def pack_positions(positions: Iterable[PackedPositionDict]) -> str:
+    """Pack chord positions into a string.
+
+    Args:
+        positions (Iterable[PackedPositionDict]): Positions in any order.
+
+    Returns:
+        str: Packed positions ordered by string number.
+    """
+    return "".join(
+        f"{position['string_number']}{encode_fret(position['fret'])}"
+        f"{position['finger']}"
+        for position in sorted(positions, key=lambda p: p["string_number"])
+    )
+
+
+def unpack_positions(packed: str) -> list[PackedPositionDict]:
+    """Unpack chord positions from a string.
+
+    Args:
+        packed (str): Positions packed by `pack_positions`.
+
+    Returns:
+        list[PackedPositionDict]: Positions ordered by string number.
+    """
+    return [
+        {
+            "string_number": int(packed[i]),
+            "fret": decode_fret(packed[i + 1]),
+            "finger": int(packed[i + 2]),
+        }
+        for i in range(0, len(packed), PACKED_POSITION_LENGTH)
+    ]
@@ -4,16 +4,57 @@
 
 """Selectors for the chords app."""
 
-from django.db.models import QuerySet
+from collections.abc import Collection, Iterable, Sequence
+from datetime import datetime
+from typing import Any, Final
 
-from .models import Chord
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connections
+from django.db.models import Case, F, FloatField, Q, QuerySet, Value, When
+from django.db.models.functions import Greatest
 
+from .diagrams import DiagramSpec
+from .models import Chord, ChordPosition, ChordTombstone
+from .packing import PackedPositionDict, pack_positions
+from .shapes import (
+    SHAPE_WILDCARD,
+    expand_shape_pattern,
+    frets_from_shape,
+    shape_pattern_to_regex,
+)
+from .trigrams import TRIGRAM_SIMILARITY_THRESHOLD, get_trigrams, trigram_similarity
 
-def get_full_chord_by_id(*, chord_id: int) -> Chord:
+CHORD_KEYSET_COLUMNS: Final[tuple[str, ...]] = ("id", "title", "order_in_note")
+"""Columns every chord row needs for ordering, pagination and fallbacks."""
+
+_CHORD_FIELD_COLUMNS: Final[dict[str, str]] = {"positions": "packed_positions"}
+"""Model columns of output fields whose names differ from the field names."""
+
+
+def get_chord_columns(fields: Collection[str]) -> tuple[str, ...]:
+    """Get the Chord columns needed to output some fields.
+
+    Args:
+        fields (Collection[str]): Names of `ChordOutputSerializer` fields.
+
+    Returns:
+        tuple[str, ...]: Column names, starting with `CHORD_KEYSET_COLUMNS`.
+    """
+    columns = (_CHORD_FIELD_COLUMNS.get(field, field) for field in fields)
+    return tuple(dict.fromkeys((*CHORD_KEYSET_COLUMNS, *columns)))
+
+
+def get_full_chord_by_id(
+    *, chord_id: int, fields: Collection[str] | None = None
+) -> Chord:
     """Get a single Chord object by ID.
 
+    Positions are served from the packed column, so no join is needed.
+
     Args:
         chord_id (int): The primary key of the Chord.
+        fields (Collection[str] | None): Output fields to load the columns
+            of, None for all columns.
 
     Returns:
         Chord: The optimized Chord instance.
@@ -21,18 +62,377 @@ def get_full_chord_by_id(*, chord_id: int) -> Chord:
     Raises:
         Chord.DoesNotExist: If the chord with the given ID is not found.
     """
-    return Chord.objects.select_related().prefetch_related("positions").get(id=chord_id)
+    chords = Chord.objects.all()
+    if fields is not None:
+        chords = chords.only(*get_chord_columns(fields))
+    return chords.get(id=chord_id)
+
+
+def get_chord_validators(*, chord_id: int) -> tuple[int, datetime]:
+    """Get the revision and the last change time of a Chord.
+
+    Cheap enough to answer conditional requests without loading the chord.
+
+    Args:
+        chord_id (int): The primary key of the Chord.
 
+    Returns:
+        tuple[int, datetime]: The chord revision and its updated_at value.
 
-def get_all_chords() -> QuerySet[Chord]:
+    Raises:
+        Chord.DoesNotExist: If the chord with the given ID is not found.
+    """
+    return Chord.objects.values_list("revision", "updated_at").get(id=chord_id)
+
+
+def get_chord_diagram_spec(*, chord_id: int) -> tuple[DiagramSpec, datetime]:
+    """Get what the diagram of a Chord depends on.
+
+    Args:
+        chord_id (int): The primary key of the Chord.
+
+    Returns:
+        tuple[DiagramSpec, datetime]: The diagram spec and the updated_at
+            value of the chord.
+
+    Raises:
+        Chord.DoesNotExist: If the chord with the given ID is not found.
+    """
+    start_fret, has_barre, packed, updated_at = Chord.objects.values_list(
+        "start_fret", "has_barre", "packed_positions", "updated_at"
+    ).get(id=chord_id)
+    if not packed:
+        positions = get_positions_by_chord_ids(chord_ids=[chord_id])
+        packed = pack_positions(positions.get(chord_id, []))
+    return DiagramSpec(start_fret, has_barre, packed), updated_at
+
+
+def get_chord_diagram_specs(
+    *, title: str | None = None
+) -> list[tuple[int, str, DiagramSpec]]:
+    """Get the diagrams of the catalog, or of one note, in catalog order.
+
+    Args:
+        title (str | None): Title (note) of the chords, None for all chords.
+
+    Returns:
+        list[tuple[int, str, DiagramSpec]]: Primary keys, titles and diagram
+            specs, ordered by title, order_in_note and id.
+    """
+    chords = Chord.objects.order_by("title", "order_in_note", "id")
+    if title is not None:
+        chords = chords.filter(title=title)
+    rows = list(
+        chords.values_list("id", "title", "start_fret", "has_barre", "packed_positions")
+    )
+    unpacked = [chord_id for chord_id, *_, packed in rows if not packed]
+    positions = get_positions_by_chord_ids(chord_ids=unpacked) if unpacked else {}
+    return [
+        (
+            chord_id,
+            chord_title,
+            DiagramSpec(
+                start_fret,
+                has_barre,
+                packed or pack_positions(positions.get(chord_id, [])),
+            ),
+        )
+        for chord_id, chord_title, start_fret, has_barre, packed in rows
+    ]
+
+
+def get_all_chords(*, fields: Collection[str] | None = None) -> QuerySet[Chord]:
     """Get a QuerySet of all Chord objects with positions.
 
+    Positions are served from the packed column, so no prefetch is needed.
+
+    Args:
+        fields (Collection[str] | None): Output fields to load the columns
+            of, None for all columns.
+
     Returns:
         QuerySet[Chord]: Optimized QuerySet of all chords ordered by
-            order_in_note and title.
+            title, order_in_note and id (the keyset pagination order).
+    """
+    chords = Chord.objects.all().order_by("title", "order_in_note", "id")
+    if fields is not None:
+        chords = chords.only(*get_chord_columns(fields))
+    return chords
+
+
+def get_chords_by_note(*, title: str | None = None) -> QuerySet[Chord]:
+    """Get chords grouped by title (note) and ordered within each group.
+
+    The order matches the `(title, order_in_note, id)` keyset index, so the
+    chords of one title are a single range scan of that index and the
+    whole catalog needs no sort.
+
+    Args:
+        title (str | None): Title of the only group to get, None for all.
+
+    Returns:
+        QuerySet[Chord]: Chords ordered by title, order_in_note and id.
+    """
+    chords = get_all_chords()
+    if title is None:
+        return chords
+    return chords.filter(title=title)
+
+
+def get_chord_names() -> list[tuple[int, str, str]]:
+    """Get the titles and musical titles of all chords.
+
+    Returns:
+        list[tuple[int, str, str]]: Id, title and musical title of every
+            chord, in the `get_all_chords` order.
     """
+    return list(get_all_chords().values_list("id", "title", "musical_title").iterator())
+
+
+def get_chord_frets_by_ids(*, chord_ids: Iterable[int]) -> dict[int, list[int]]:
+    """Get the frets of several chords from their shapes.
+
+    Args:
+        chord_ids (Iterable[int]): Primary keys of the chords.
+
+    Returns:
+        dict[int, list[int]]: Frets from the sixth string to the first, for
+            every chord that exists and has a complete shape.
+    """
+    shapes = Chord.objects.filter(id__in=chord_ids).exclude(shape="")
+    return {
+        chord_id: frets_from_shape(shape)
+        for chord_id, shape in shapes.values_list("id", "shape")
+    }
+
+
+def get_chords_by_ids(*, chord_ids: Sequence[int]) -> QuerySet[Chord]:
+    """Get several chords by primary key, in the order of the keys.
+
+    The order is a `CASE` expression over the keys, so the chords are read
+    in one query and need no sorting afterwards. Missing keys are skipped.
+
+    Args:
+        chord_ids (Sequence[int]): Primary keys of the chords, without
+            repeats.
+
+    Returns:
+        QuerySet[Chord]: The chords ordered like `chord_ids`.
+    """
+    order = Case(*(When(id=chord_id, then=i) for i, chord_id in enumerate(chord_ids)))
+    return Chord.objects.filter(id__in=chord_ids).order_by(order)
+
+
+def get_chords_by_titles(*, titles: Sequence[str]) -> QuerySet[Chord]:
+    """Get the chords of several titles (notes), in the order of the titles.
+
+    Chords of one title follow each other ordered by `order_in_note`, like
+    in `get_chords_by_note`. Titles without chords are skipped.
+
+    Args:
+        titles (Sequence[str]): Titles of the chords, without repeats.
+
+    Returns:
+        QuerySet[Chord]: The chords ordered like `titles`, then by
+            order_in_note and id.
+    """
+    order = Case(*(When(title=title, then=i) for i, title in enumerate(titles)))
+    return Chord.objects.filter(title__in=titles).order_by(order, "order_in_note", "id")
+
+
+def get_chords_by_shape(*, pattern: str) -> QuerySet[Chord]:
+    """Get chords whose shape matches a pattern.
+
+    Patterns without wildcards are one index seek on `Chord.shape`. Patterns
+    with a few wildcards are expanded into an `IN` list of shapes; the rest
+    scan the index range of the prefix before the first wildcard.
+
+    Args:
+        pattern (str): A shape pattern normalized by `normalize_shape_pattern`.
+
+    Returns:
+        QuerySet[Chord]: Matching chords in the `get_all_chords` order.
+    """
+    chords = get_all_chords()
+    if SHAPE_WILDCARD not in pattern:
+        return chords.filter(shape=pattern)
+    shapes = expand_shape_pattern(pattern)
+    if shapes is not None:
+        return chords.filter(shape__in=shapes)
+    prefix = pattern.split(SHAPE_WILDCARD, 1)[0]
+    return chords.filter(
+        shape__startswith=prefix, shape__regex=shape_pattern_to_regex(pattern)
+    )
+
+
+def search_chords(*, query: str) -> QuerySet[Chord]:
+    """Search chords by title and musical title, with typos.
+
+    Args:
+        query (str): Text to search for, e.g. `A mnor`.
+
+    Returns:
+        QuerySet[Chord]: Matching chords with their `search_rank`, the best
+            first, then in the `get_all_chords` order.
+    """
+    return filter_chords_by_similarity(Chord.objects.all(), query=query).order_by(
+        F("search_rank").desc(), "title", "order_in_note", "id"
+    )
+
+
+def filter_chords_by_similarity(
+    chords: QuerySet[Chord], *, query: str
+) -> QuerySet[Chord]:
+    """Keep the chords whose title or musical title is similar to a text.
+
+    The similarity is the trigram similarity of `pg_trgm`. On PostgreSQL
+    the `%` operator is answered from the trigram GIN indexes of both
+    columns; on other databases the titles are read and compared in Python
+    with `apps.chords.trigrams`, which is only meant for small development
+    databases.
+
+    Args:
+        chords (QuerySet[Chord]): Chords to search in.
+        query (str): Text to search for.
+
+    Returns:
+        QuerySet[Chord]: The similar chords, annotated with `search_rank`,
+            the better of the two similarities. The order is unchanged.
+    """
+    if connections[chords.db].vendor == "postgresql":
+        similar = Q(title__trigram_similar=query) | Q(
+            musical_title__trigram_similar=query
+        )
+        return chords.filter(similar).annotate(
+            search_rank=Greatest(
+                TrigramSimilarity("title", query),
+                TrigramSimilarity("musical_title", query),
+            )
+        )
+
+    query_trigrams = get_trigrams(query)
+    ranks: dict[int, float] = {}
+    for chord_id, title, musical_title in chords.values_list(
+        "id", "title", "musical_title"
+    ).iterator():
+        chord_rank = max(
+            trigram_similarity(query_trigrams, get_trigrams(title)),
+            trigram_similarity(query_trigrams, get_trigrams(musical_title)),
+        )
+        if chord_rank >= TRIGRAM_SIMILARITY_THRESHOLD:
+            ranks[chord_id] = chord_rank
+    rank = Case(
+        *(When(id=chord_id, then=Value(score)) for chord_id, score in ranks.items()),
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+    return chords.filter(id__in=ranks).annotate(search_rank=rank)
+
+
+def get_chords_changed_since(*, since: datetime | None) -> QuerySet[Chord]:
+    """Get chords created or changed after a point in time.
+
+    Uses the `(updated_at, id)` index, so the cost depends on the number of
+    changed chords, not on the size of the catalog.
+
+    Args:
+        since (datetime | None): Start of the window, None for all chords.
+
+    Returns:
+        QuerySet[Chord]: Changed chords ordered by updated_at and id.
+    """
+    chords = Chord.objects.order_by("updated_at", "id")
+    if since is None:
+        return chords
+    return chords.filter(updated_at__gt=since)
+
+
+def get_deleted_chord_ids_since(*, since: datetime) -> list[int]:
+    """Get the primary keys of chords deleted after a point in time.
+
+    Args:
+        since (datetime): Start of the window.
+
+    Returns:
+        list[int]: Deleted chord ids in the order of deletion, without
+            repeats.
+    """
+    chord_ids = (
+        ChordTombstone.objects.filter(deleted_at__gt=since)
+        .order_by("deleted_at", "id")
+        .values_list("chord_id", flat=True)
+    )
+    return list(dict.fromkeys(chord_ids))
+
+
+def get_positions_by_chord_ids(
+    *, chord_ids: Iterable[int]
+) -> dict[int, list[PackedPositionDict]]:
+    """Get the positions of several chords from the ChordPosition rows.
+
+    Args:
+        chord_ids (Iterable[int]): Primary keys of the chords.
+
+    Returns:
+        dict[int, list[PackedPositionDict]]: Positions ordered by string
+            number for every chord that has any.
+    """
+    return _group_positions(_get_position_rows(chord_ids))
+
+
+async def aget_positions_by_chord_ids(
+    *, chord_ids: Iterable[int]
+) -> dict[int, list[PackedPositionDict]]:
+    """Get the positions of several chords, the async version.
+
+    Args:
+        chord_ids (Iterable[int]): Primary keys of the chords.
+
+    Returns:
+        dict[int, list[PackedPositionDict]]: Positions ordered by string
+            number for every chord that has any.
+    """
+    rows = [row async for row in _get_position_rows(chord_ids)]
+    return _group_positions(rows)
+
+
+async def aget_chord_values(*, chord_id: int, columns: Iterable[str]) -> dict[str, Any]:
+    """Get some columns of a single Chord, the async version.
+
+    Args:
+        chord_id (int): The primary key of the Chord.
+        columns (Iterable[str]): Names of the columns.
+
+    Returns:
+        dict[str, Any]: Values of the columns.
+
+    Raises:
+        Chord.DoesNotExist: If the chord with the given ID is not found.
+    """
+    row: dict[str, Any] = await Chord.objects.values(*columns).aget(id=chord_id)
+    return row
+
+
+def _get_position_rows(
+    chord_ids: Iterable[int],
+) -> QuerySet[ChordPosition, tuple[int, int, int, int]]:
+    """Get the `(chord_id, string_number, fret, finger)` rows of chords."""
     return (
-        Chord.objects.all()
-        .order_by("title", "order_in_note")
-        .prefetch_related("positions")
+        ChordPosition.objects.filter(chord_id__in=chord_ids)
+        .order_by("chord_id", "string_number")
+        .values_list("chord_id", "string_number", "fret", "finger")
     )
+
+
+def _group_positions(
+    rows: Iterable[tuple[int, int, int, int]],
+) -> dict[int, list[PackedPositionDict]]:
+    """Group position rows by chord."""
+    positions: dict[int, list[PackedPositionDict]] = {}
+    for chord_id, string_number, fret, finger in rows:
+        positions.setdefault(chord_id, []).append({
+            "string_number": string_number,
+            "fret": fret,
+            "finger": finger,
+        })
+    return positions
@@ -4,12 +4,20 @@
 
 """Services for the chords app."""
 
-from typing import Any, TypedDict
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from typing import Any, Literal, NotRequired, TypedDict, cast
 
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import F, Field, Model, Q
+from django.utils import timezone
 
+from .catalog import bump_catalog_version
 from .constants import MAX_STRING_NUMBER
-from .models import Chord, ChordPosition
+from .models import Chord, ChordPosition, ChordTombstone
+from .packing import PackedPositionDict, pack_positions, unpack_positions
+from .shapes import shape_from_packed
 
 
 class ChordPositionCreateDict(TypedDict):
@@ -41,6 +49,39 @@ class ChordUpdateDict(TypedDict, total=False):
     positions: list[ChordPositionCreateDict]
 
 
+class ChordBulkOperationDict(TypedDict):
+    """Describe one operation of a bulk change.
+
+    Upserts find the chord by `id`, or by `title` and `order_in_note` of
+    `chord_fields` when there is no id. Deletes find it by `id`, or by
+    `title` and `order_in_note`.
+    """
+
+    line: int
+    op: Literal["upsert", "delete"]
+    id: int | None
+    title: str | None
+    order_in_note: int | None
+    chord_fields: ChordCreateDict | None
+    positions: list[ChordPositionCreateDict] | None
+
+
+class ChordImportDict(TypedDict):
+    """Describe one validated chord of an import."""
+
+    chord_fields: ChordCreateDict
+    positions: list[ChordPositionCreateDict]
+
+
+class ChordBulkResultDict(TypedDict):
+    """Describe the result of one line of a bulk change."""
+
+    line: int
+    status: Literal["created", "updated", "deleted", "error"]
+    id: NotRequired[int]
+    errors: NotRequired[dict[str, Any]]
+
+
 class ChordService:
     """Contains business logic execution and data manipulation for the Chord entity."""
 
@@ -63,8 +104,14 @@ class ChordService:
         if len(positions) != MAX_STRING_NUMBER:
             raise ValueError("Chord must have exactly 6 positions")
 
-        chord = Chord.objects.create(**chord_fields)
-        ChordService._replace_positions(chord, positions)
+        packed = pack_positions(positions)
+        chord = Chord.objects.create(
+            **chord_fields, packed_positions=packed, shape=shape_from_packed(packed)
+        )
+        ChordPosition.objects.bulk_create(
+            ChordPosition(chord=chord, **position) for position in positions
+        )
+        transaction.on_commit(bump_catalog_version)
         return chord
 
     @staticmethod
@@ -74,7 +121,11 @@ class ChordService:
         chord: Chord,
         data: dict[str, Any],
     ) -> Chord:
-        """Update an existing Chord and handles full replacement of nested positions.
+        """Update an existing Chord, writing only what has changed.
+
+        Only the changed columns are saved, and only the positions whose
+        fret or finger changed are updated. If nothing has changed, nothing
+        is written and the revision stays the same.
 
         Args:
             chord (Chord): The existing Chord instance to update.
@@ -87,36 +138,490 @@ class ChordService:
         if positions_data is not None and len(positions_data) != MAX_STRING_NUMBER:
             raise ValueError("Chord must have exactly 6 positions")
 
-        for field, value in data.items():
-            setattr(chord, field, value)
-        chord.save()
+        update_fields = [
+            field for field, value in data.items() if getattr(chord, field) != value
+        ]
+        for field in update_fields:
+            setattr(chord, field, data[field])
 
         if positions_data is not None:
-            ChordService._replace_positions(chord, positions_data)
+            positions_changed = ChordService._sync_positions(chord, positions_data)
+            packed = pack_positions(positions_data)
+            if positions_changed or packed != chord.packed_positions:
+                chord.packed_positions = packed
+                chord.shape = shape_from_packed(packed)
+                update_fields += ["packed_positions", "shape"]
+
+        if not update_fields:
+            return chord
 
+        chord.revision = F("revision") + 1
+        chord.save(update_fields=[*update_fields, "revision", "updated_at"])
+        chord.refresh_from_db(fields=["revision"])
+        transaction.on_commit(bump_catalog_version)
         return chord
 
     @staticmethod
-    def delete_chord(*, chord: Chord) -> None:
-        """Delete a Chord instance.
+    @transaction.atomic
+    def delete_chord(*, chord_id: int) -> bool:
+        """Delete a Chord by primary key and leave a tombstone for the sync.
+
+        Django's delete collector selects only the primary key of the chord,
+        and its positions are deleted with one statement, since they have
+        no delete signals.
+
+        Args:
+            chord_id (int): The primary key of the Chord.
+
+        Returns:
+            bool: True if the chord was deleted, False if it does not exist.
+        """
+        _, deleted = Chord.objects.filter(pk=chord_id).only("pk").delete()
+        if not deleted.get(Chord._meta.label):
+            return False
+        ChordService.record_deletions(chord_ids=[chord_id])
+        transaction.on_commit(bump_catalog_version)
+        return True
+
+    @staticmethod
+    def record_deletions(*, chord_ids: Iterable[int]) -> None:
+        """Leave tombstones for deleted chords, so sync clients drop them.
+
+        Used by every code path that deletes chords (e.g. the admin).
+
+        Args:
+            chord_ids (Iterable[int]): Primary keys of the deleted chords.
+        """
+        now = timezone.now()
+        ChordTombstone.objects.bulk_create(
+            ChordTombstone(chord_id=chord_id, deleted_at=now) for chord_id in chord_ids
+        )
+
+    @staticmethod
+    def prune_tombstones(*, before: datetime) -> int:
+        """Delete the tombstones of chords deleted before a given time.
+
+        Args:
+            before (datetime): Tombstones older than this are deleted.
+
+        Returns:
+            int: The number of deleted tombstones.
+        """
+        deleted, _ = ChordTombstone.objects.filter(deleted_at__lt=before).delete()
+        return deleted
+
+    @staticmethod
+    def refresh_packed_positions(*, chord: Chord) -> None:
+        """Rebuild the packed positions of a chord from its ChordPosition rows.
+
+        Used when positions are changed outside of the service (e.g. in the
+        admin inlines).
 
         Args:
-            chord (Chord): The Chord instance to delete.
+            chord (Chord): The chord whose positions were changed.
         """
-        if chord.pk is not None:
-            chord.delete()
+        positions = chord.positions.values("string_number", "fret", "finger")
+        ChordService._save_packed_positions(chord, pack_positions(positions))
 
     @staticmethod
-    def _replace_positions(
+    def _sync_positions(
         chord: Chord,
         positions_data: list[ChordPositionCreateDict],
-    ) -> None:
-        """Create positions for the chord.
+    ) -> bool:
+        """Bring the ChordPosition rows of a chord in line with new positions.
+
+        The current positions are read from the packed column (or from the
+        rows if the chord has none), so unchanged positions cost nothing.
+        Changed positions are updated in place, new ones are created and
+        the positions of strings that are gone are deleted.
 
         Args:
             chord (Chord): existing chord
             positions_data (list[ChordPositionCreateDict]): position data for the chord
+
+        Returns:
+            bool: True if any row was written
+        """
+        current: list[PackedPositionDict]
+        if chord.packed_positions:
+            current = unpack_positions(chord.packed_positions)
+        else:
+            rows = chord.positions.values("string_number", "fret", "finger")
+            current = cast(list[PackedPositionDict], list(rows))
+        current_by_string = {p["string_number"]: p for p in current}
+        new_by_string = {p["string_number"]: p for p in positions_data}
+
+        removed = current_by_string.keys() - new_by_string.keys()
+        if removed:
+            chord.positions.filter(string_number__in=removed).delete()
+        to_create: list[ChordPositionCreateDict] = []
+        changed = bool(removed)
+        for string_number, position in new_by_string.items():
+            old = current_by_string.get(string_number)
+            if old is None:
+                to_create.append(position)
+                continue
+            if (old["fret"], old["finger"]) == (position["fret"], position["finger"]):
+                continue
+            changed = True
+            updated = chord.positions.filter(string_number=string_number).update(
+                fret=position["fret"], finger=position["finger"]
+            )
+            if not updated:
+                to_create.append(position)
+        if to_create:
+            ChordPosition.objects.bulk_create(
+                ChordPosition(chord=chord, **position) for position in to_create
+            )
+        return changed or bool(to_create)
+
+    @staticmethod
+    def _save_packed_positions(chord: Chord, packed: str) -> None:
+        """Store the packed positions and the shape of a chord.
+
+        Args:
+            chord (Chord): existing chord
+            packed (str): positions packed by `pack_positions`
+        """
+        chord.packed_positions = packed
+        chord.shape = shape_from_packed(packed)
+        Chord.objects.filter(pk=chord.pk).update(
+            packed_positions=packed, shape=chord.shape
+        )
+
+
+class ChordBulkService:
+    """Applies bulk changes to the Chord entity with a fixed number of queries."""
+
+    update_fields = (
+        "title",
+        "musical_title",
+        "order_in_note",
+        "start_fret",
+        "has_barre",
+        "packed_positions",
+        "shape",
+        "revision",
+        "updated_at",
+    )
+
+    @staticmethod
+    @transaction.atomic
+    def apply_batch(
+        *,
+        operations: list[ChordBulkOperationDict],
+    ) -> list[ChordBulkResultDict]:
+        """Apply a batch of upserts and deletes in one transaction.
+
+        Chords and positions are written with `bulk_create`/`bulk_update`,
+        so the number of queries does not depend on the batch size. Every
+        chord may be changed by only one operation of a batch.
+
+        Args:
+            operations (list[ChordBulkOperationDict]): Validated operations.
+
+        Returns:
+            list[ChordBulkResultDict]: One result per operation, in order.
+        """
+        by_id, by_key = ChordBulkService._find_chords(operations)
+        batch = _ChordBulkBatch()
+        results = []
+        for operation in operations:
+            if operation["id"] is not None:
+                chord = by_id.get(operation["id"])
+                candidates = [chord] if chord is not None else []
+            else:
+                candidates = by_key[ChordBulkService._get_key(operation)]
+            results.append(batch.add(operation, candidates))
+        batch.save()
+        return results
+
+    @staticmethod
+    def _find_chords(
+        operations: list[ChordBulkOperationDict],
+    ) -> tuple[dict[int, Chord], defaultdict[tuple[str, int], list[Chord]]]:
+        """Load all chords the operations refer to with one query.
+
+        Args:
+            operations (list[ChordBulkOperationDict]): Operations of a batch.
+
+        Returns:
+            tuple: Chords by id and chords by `(title, order_in_note)`.
+        """
+        ids = {op["id"] for op in operations if op["id"] is not None}
+        titles = {
+            ChordBulkService._get_key(op)[0] for op in operations if op["id"] is None
+        }
+        by_id: dict[int, Chord] = {}
+        by_key: defaultdict[tuple[str, int], list[Chord]] = defaultdict(list)
+        if ids or titles:
+            chords = Chord.objects.filter(Q(id__in=ids) | Q(title__in=titles))
+            for chord in chords.order_by("id"):
+                by_id[chord.pk] = chord
+                by_key[chord.title, chord.order_in_note].append(chord)
+        return by_id, by_key
+
+    @staticmethod
+    def _get_key(operation: ChordBulkOperationDict) -> tuple[str, int]:
+        """Get the `(title, order_in_note)` key of an operation.
+
+        Args:
+            operation (ChordBulkOperationDict): Operation without an id.
+
+        Returns:
+            tuple[str, int]: The natural key of the chord.
+        """
+        fields = operation["chord_fields"]
+        if fields is not None:
+            return fields["title"], fields["order_in_note"]
+        return operation["title"] or "", operation["order_in_note"] or 0
+
+
+class _ChordBulkBatch:
+    """Collects the changes of one bulk batch and writes them together."""
+
+    def __init__(self) -> None:
+        """Create an empty batch."""
+        self.now = timezone.now()
+        self.created_results: list[ChordBulkResultDict] = []
+        self.changed: dict[int, int] = {}
+        self.to_create: list[tuple[Chord, list[ChordPositionCreateDict]]] = []
+        self.to_update: list[tuple[Chord, list[ChordPositionCreateDict]]] = []
+        self.to_delete: list[int] = []
+
+    def add(
+        self,
+        operation: ChordBulkOperationDict,
+        candidates: list[Chord],
+    ) -> ChordBulkResultDict:
+        """Plan one operation.
+
+        Args:
+            operation (ChordBulkOperationDict): The operation.
+            candidates (list[Chord]): Existing chords that match the operation.
+
+        Returns:
+            ChordBulkResultDict: The result of the operation. The id of a
+                created chord is filled in by `save`.
+        """
+        line = operation["line"]
+        if len(candidates) > 1:
+            return self._error(line, "Several chords match the key.")
+        chord = candidates[0] if candidates else None
+        if chord is not None and chord.pk in self.changed:
+            previous = self.changed[chord.pk]
+            return self._error(
+                line, f"The chord is already changed by line {previous}."
+            )
+
+        if operation["op"] == "delete":
+            return self._add_delete(line, chord)
+        return self._add_upsert(operation, chord)
+
+    def _add_delete(self, line: int, chord: Chord | None) -> ChordBulkResultDict:
+        """Plan a delete.
+
+        Args:
+            line (int): Line number of the operation.
+            chord (Chord | None): The matching chord.
+
+        Returns:
+            ChordBulkResultDict: The result of the operation.
+        """
+        if chord is None:
+            return self._error(line, "Chord not found.")
+        self.changed[chord.pk] = line
+        self.to_delete.append(chord.pk)
+        return {"line": line, "status": "deleted", "id": chord.pk}
+
+    def _add_upsert(
+        self,
+        operation: ChordBulkOperationDict,
+        chord: Chord | None,
+    ) -> ChordBulkResultDict:
+        """Plan a create or an update.
+
+        Args:
+            operation (ChordBulkOperationDict): The operation.
+            chord (Chord | None): The matching chord.
+
+        Returns:
+            ChordBulkResultDict: The result of the operation.
+        """
+        line = operation["line"]
+        fields = operation["chord_fields"]
+        positions = operation["positions"]
+        if fields is None or positions is None:
+            return self._error(line, "Chord data is missing.")
+        if chord is None and operation["id"] is not None:
+            return self._error(line, "Chord not found.")
+
+        result: ChordBulkResultDict
+        if chord is None:
+            chord = Chord(**fields, updated_at=self.now)
+            self.to_create.append((chord, positions))
+            result = {"line": line, "status": "created"}
+            self.created_results.append(result)
+        else:
+            self.changed[chord.pk] = line
+            for field, value in fields.items():
+                setattr(chord, field, value)
+            chord.revision = F("revision") + 1
+            chord.updated_at = self.now
+            self.to_update.append((chord, positions))
+            result = {"line": line, "status": "updated", "id": chord.pk}
+        chord.packed_positions = pack_positions(positions)
+        chord.shape = shape_from_packed(chord.packed_positions)
+        return result
+
+    def save(self) -> None:
+        """Write all planned changes and fill in the ids of created chords."""
+        if self.to_delete:
+            Chord.objects.filter(id__in=self.to_delete).delete()
+            ChordService.record_deletions(chord_ids=self.to_delete)
+        if self.to_update:
+            updated = [chord for chord, _ in self.to_update]
+            Chord.objects.bulk_update(updated, ChordBulkService.update_fields)
+            ChordPosition.objects.filter(chord__in=updated).delete()
+        if self.to_create:
+            Chord.objects.bulk_create([chord for chord, _ in self.to_create])
+            for result, (chord, _) in zip(
+                self.created_results, self.to_create, strict=True
+            ):
+                result["id"] = chord.pk
+        ChordPosition.objects.bulk_create(
+            ChordPosition(chord=chord, **position)
+            for chord, positions in (*self.to_update, *self.to_create)
+            for position in positions
+        )
+        if self.to_delete or self.to_update or self.to_create:
+            transaction.on_commit(bump_catalog_version)
+
+    @staticmethod
+    def _error(line: int, detail: str) -> ChordBulkResultDict:
+        """Build the result of a failed operation.
+
+        Args:
+            line (int): Line number of the operation.
+            detail (str): Description of the error.
+
+        Returns:
+            ChordBulkResultDict: The error result.
+        """
+        return {"line": line, "status": "error", "errors": {"detail": [detail]}}
+
+
+class ChordImportService:
+    """Creates many new chords at once, with `COPY` on PostgreSQL."""
+
+    @staticmethod
+    @transaction.atomic
+    def import_chords(*, chords: list[ChordImportDict]) -> int:
+        """Create a batch of chords and their positions in one transaction.
+
+        On PostgreSQL the ids of the chords are taken from their sequence
+        in one query and both tables are loaded with `COPY`, three round
+        trips for the whole batch. Other databases use `bulk_create`.
+
+        Args:
+            chords (list[ChordImportDict]): Validated chords.
+
+        Returns:
+            int: The number of created chords.
+        """
+        if not chords:
+            return 0
+        now = timezone.now()
+        objects = []
+        for chord in chords:
+            packed = pack_positions(chord["positions"])
+            objects.append(
+                Chord(
+                    **chord["chord_fields"],
+                    packed_positions=packed,
+                    shape=shape_from_packed(packed),
+                    updated_at=now,
+                )
+            )
+
+        if connection.vendor == "postgresql":
+            ChordImportService._copy_chords(objects, chords)
+        else:
+            Chord.objects.bulk_create(objects)
+            ChordPosition.objects.bulk_create(
+                ChordImportService._build_positions(objects, chords)
+            )
+        transaction.on_commit(bump_catalog_version)
+        return len(objects)
+
+    @staticmethod
+    def _copy_chords(objects: list[Chord], chords: list[ChordImportDict]) -> None:
+        """Load chords and positions with `COPY`, ids taken in advance.
+
+        Args:
+            objects (list[Chord]): Unsaved chords, given their ids here.
+            chords (list[ChordImportDict]): The chords the objects are built
+                from, for the positions.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, 'id')) "
+                "FROM generate_series(1, %s)",
+                [Chord._meta.db_table, len(objects)],
+            )
+            for chord, (chord_id,) in zip(objects, cursor.fetchall(), strict=True):
+                chord.pk = chord_id
+            ChordImportService._copy_objects(
+                cursor, objects, Chord._meta.concrete_fields
+            )
+            positions = ChordImportService._build_positions(objects, chords)
+            position_fields = [
+                field
+                for field in ChordPosition._meta.concrete_fields
+                if not field.primary_key
+            ]
+            ChordImportService._copy_objects(cursor, positions, position_fields)
+
+    @staticmethod
+    def _copy_objects(
+        cursor: Any,  # noqa: ANN401
+        objects: Sequence[Model],
+        fields: Sequence["Field[Any, Any]"],
+    ) -> None:
+        """Write model instances to their table with `COPY ... FROM STDIN`.
+
+        Args:
+            cursor (Any): A cursor of a psycopg 3 connection.
+            objects (Sequence[Model]): Instances of one model.
+            fields (Sequence[Field]): Fields to write, in column order.
+        """
+        if not objects:
+            return
+        quote_name = connection.ops.quote_name
+        table = quote_name(objects[0]._meta.db_table)
+        columns = ", ".join(quote_name(str(field.column)) for field in fields)
+        with cursor.copy(f"COPY {table} ({columns}) FROM STDIN") as copy:
+            for obj in objects:
+                copy.write_row([
+                    field.get_db_prep_save(field.pre_save(obj, add=True), connection)
+                    for field in fields
+                ])
+
+    @staticmethod
+    def _build_positions(
+        objects: list[Chord], chords: list[ChordImportDict]
+    ) -> list[ChordPosition]:
+        """Build the positions of saved chords.
+
+        Args:
+            objects (list[Chord]): Saved chords, in the order of `chords`.
+            chords (list[ChordImportDict]): Imported chords with positions.
+
+        Returns:
+            list[ChordPosition]: Unsaved positions of all chords.
         """
-        chord.positions.all().delete()
-        positions = [ChordPosition(chord=chord, **pos) for pos in positions_data]
-        ChordPosition.objects.bulk_create(positions)
+        return [
+            ChordPosition(chord_id=chord.pk, **position)
+            for chord, data in zip(objects, chords, strict=True)
+            for position in data["positions"]
+        ]
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Fret shapes of chords, e.g. `x02210` for Am.
+
+A shape has one character per string, from the sixth (low) string to the
+first, as guitarists write it. Frets use the same codes as the packed
+positions (`x` for a muted string, `0`-`9` and `a`-`c` for frets 0-12).
+Shape patterns may also contain the `?` wildcard, which matches any fret.
+"""
+
+import itertools
+import re
+from typing import Final
+
+from .constants import MAX_STRING_NUMBER, MIN_STRING_NUMBER
+from .packing import FRET_CODES, PACKED_POSITION_LENGTH, decode_fret
+
+SHAPE_WILDCARD: Final[str] = "?"
+"""Pattern character that matches any fret."""
+
+SHAPE_WILDCARD_ALIASES: Final[str] = "?*."
+"""Characters accepted as the wildcard in user input."""
+
+MAX_SHAPE_EXPANSIONS: Final[int] = 256
+"""Maximum number of shapes a pattern is expanded into for an `IN` lookup."""
+
+
+def shape_from_packed(packed: str) -> str:
+    """Build the shape of a chord from its packed positions.
+
+    Args:
+        packed (str): Positions packed by `pack_positions`.
+
+    Returns:
+        str: The shape, or an empty string if some string has no position.
+    """
+    frets = {
+        int(packed[i]): packed[i + 1]
+        for i in range(0, len(packed), PACKED_POSITION_LENGTH)
+    }
+    strings = range(MAX_STRING_NUMBER, MIN_STRING_NUMBER - 1, -1)
+    if any(string not in frets for string in strings):
+        return ""
+    return "".join(frets[string] for string in strings)
+
+
+def frets_from_shape(shape: str) -> list[int]:
+    """Decode the frets of a shape.
+
+    Args:
+        shape (str): The shape, e.g. `x02210`.
+
+    Returns:
+        list[int]: Frets from the sixth string to the first, -1 for a
+            muted string, e.g. `[-1, 0, 2, 2, 1, 0]`.
+
+    Raises:
+        ValueError: If the shape has unknown characters.
+    """
+    return [decode_fret(code) for code in shape]
+
+
+def normalize_shape_pattern(pattern: str) -> str:
+    """Normalize a shape pattern typed by a user.
+
+    Letters are lowercased and wildcard aliases are replaced with `?`.
+
+    Args:
+        pattern (str): The pattern, e.g. `X02?10`.
+
+    Returns:
+        str: The normalized pattern, e.g. `x02?10`.
+
+    Raises:
+        ValueError: If the pattern has a wrong length or unknown characters.
+    """
+    normalized = "".join(
+        SHAPE_WILDCARD if char in SHAPE_WILDCARD_ALIASES else char
+        for char in pattern.strip().lower()
+    )
+    if len(normalized) != MAX_STRING_NUMBER:
+        raise ValueError(f"Shape must have {MAX_STRING_NUMBER} characters.")
+    unknown = set(normalized) - set(FRET_CODES) - {SHAPE_WILDCARD}
+    if unknown:
+        raise ValueError(f"Unknown shape characters: {''.join(sorted(unknown))}.")
+    return normalized
+
+
+def expand_shape_pattern(pattern: str) -> list[str] | None:
+    """Expand the wildcards of a normalized pattern into concrete shapes.
+
+    Args:
+        pattern (str): A normalized shape pattern.
+
+    Returns:
+        list[str] | None: All matching shapes, or None if there are more
+            than `MAX_SHAPE_EXPANSIONS` of them.
+    """
+    if len(FRET_CODES) ** pattern.count(SHAPE_WILDCARD) > MAX_SHAPE_EXPANSIONS:
+        return None
+    choices = [FRET_CODES if char == SHAPE_WILDCARD else char for char in pattern]
+    return ["".join(shape) for shape in itertools.product(*choices)]
+
+
+def shape_pattern_to_regex(pattern: str) -> str:
+    """Convert a normalized pattern into an anchored regular expression.
+
+    Args:
+        pattern (str): A normalized shape pattern.
+
+    Returns:
+        str: The regular expression.
+    """
+    body = "".join(
+        "." if char == SHAPE_WILDCARD else re.escape(char) for char in pattern
+    )
+    return f"^{body}$"
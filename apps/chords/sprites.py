@@ -0,0 +1,280 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Sprite sheets of chord diagrams with a manifest of their coordinates.
+
+A client showing a grid of chords loads a few sheets instead of one image
+per chord. Every note (chord title) is laid out in its own sheets of up to
+`SPRITE_SHEET_CHORDS` PNG diagrams, `SPRITE_COLUMNS` per row, and the
+manifest gives the sheet and the rectangle of every chord.
+
+Like the diagrams, a sheet is named by a hash of its content, so a file
+never changes once written and can be cached by clients for good. Sheets
+never mix notes, so adding, changing or deleting a chord only gives new
+names to the sheets of its note: all of them if the note has more than
+`SPRITE_SHEET_CHORDS` chords and an insert or a delete moves the chords
+after it, only the changed one otherwise. The `prune_chord_diagrams`
+management command deletes the sheets the current catalog no longer lays
+out.
+
+Laying out the manifest renders nothing. A sheet is built when it is first
+requested, in one job of the render pool, which renders the diagrams that
+are not on disk yet and puts them together.
+"""
+
+import hashlib
+import io
+import itertools
+import operator
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Final, Literal, NamedTuple, TypedDict
+
+from django.conf import settings
+from PIL import Image
+
+from .diagrams import (
+    PNG_SCALE,
+    DiagramSpec,
+    get_cached_diagram,
+    get_png_size,
+    render_png,
+    run_in_render_pool,
+    write_atomically,
+)
+
+type SpriteFormat = Literal["png", "webp"]
+
+SPRITE_FORMATS: Final[tuple[SpriteFormat, ...]] = ("png", "webp")
+"""Formats the sheets are served in."""
+
+SPRITE_VERSION: Final[int] = 1
+"""Version of the sheet layout, part of the file names."""
+
+SPRITE_SHEET_CHORDS: Final[int] = 50
+"""Maximum number of chords in one sheet, the chords of a note may take more."""
+
+SPRITE_COLUMNS: Final[int] = 10
+"""Number of chords in one row of a sheet."""
+
+
+class SpriteSheetDict(TypedDict):
+    """One sheet of a sprite manifest."""
+
+    key: str
+    width: int
+    height: int
+
+
+class SpriteFrameDict(TypedDict):
+    """The place of one chord in a sprite manifest."""
+
+    id: int
+    sheet: int
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+class SpriteManifestDict(TypedDict):
+    """Sheets and the coordinates of the chords in them, in image pixels.
+
+    `scale` is the number of image pixels per CSS pixel.
+    """
+
+    format: SpriteFormat
+    scale: int
+    sheets: list[SpriteSheetDict]
+    chords: list[SpriteFrameDict]
+
+
+class SpriteSheet(NamedTuple):
+    """Everything a sheet is built from.
+
+    Attributes:
+        key (str): Content key of the sheet, see `get_sprite_key`.
+        specs (tuple[DiagramSpec, ...]): Diagrams in the sheet, in order.
+        cell_size (tuple[int, int]): Width and height of a cell.
+    """
+
+    key: str
+    specs: tuple[DiagramSpec, ...]
+    cell_size: tuple[int, int]
+
+
+class SpriteLayout(NamedTuple):
+    """A manifest and the sheets it refers to, by their keys."""
+
+    manifest: SpriteManifestDict
+    sheets: dict[str, SpriteSheet]
+
+
+def layout_sprites(
+    sprite_format: SpriteFormat, chords: Sequence[tuple[int, str, DiagramSpec]]
+) -> SpriteLayout:
+    """Lay out chords in sprite sheets, one note after another.
+
+    Nothing is rendered: the sheets are built by `get_sprite_sheet`.
+
+    Args:
+        sprite_format (SpriteFormat): Format of the sheets.
+        chords (Sequence[tuple[int, str, DiagramSpec]]): Ids, titles and
+            diagrams of the chords, the chords of a note next to each other.
+
+    Returns:
+        SpriteLayout: The manifest and its sheets.
+    """
+    manifest: SpriteManifestDict = {
+        "format": sprite_format,
+        "scale": PNG_SCALE,
+        "sheets": [],
+        "chords": [],
+    }
+    sheets: dict[str, SpriteSheet] = {}
+    for _, note_chords in itertools.groupby(chords, key=operator.itemgetter(1)):
+        for batch in itertools.batched(note_chords, SPRITE_SHEET_CHORDS):
+            specs = tuple(spec for _, _, spec in batch)
+            sizes = [get_png_size(spec) for spec in specs]
+            cell_size = (max(w for w, _ in sizes), max(h for _, h in sizes))
+            key = get_sprite_key(sprite_format, specs)
+            columns = min(len(batch), SPRITE_COLUMNS)
+            rows = -(-len(batch) // SPRITE_COLUMNS)
+            manifest["sheets"].append({
+                "key": key,
+                "width": columns * cell_size[0],
+                "height": rows * cell_size[1],
+            })
+            sheets[key] = SpriteSheet(key, specs, cell_size)
+            for i, ((chord_id, _, _), (width, height)) in enumerate(
+                zip(batch, sizes, strict=True)
+            ):
+                row, column = divmod(i, SPRITE_COLUMNS)
+                manifest["chords"].append({
+                    "id": chord_id,
+                    "sheet": len(manifest["sheets"]) - 1,
+                    "x": column * cell_size[0],
+                    "y": row * cell_size[1],
+                    "width": width,
+                    "height": height,
+                })
+    return SpriteLayout(manifest, sheets)
+
+
+def get_sprite_sheet(sprite_format: SpriteFormat, sheet: SpriteSheet) -> bytes:
+    """Get a sheet from disk, building it if needed.
+
+    The diagrams already on disk are sent to the render pool with the job,
+    so building a sheet takes one job whatever the number of cold diagrams.
+
+    Args:
+        sprite_format (SpriteFormat): Format of the sheet.
+        sheet (SpriteSheet): The sheet.
+
+    Returns:
+        bytes: The sheet.
+
+    Raises:
+        DiagramBusyError: If the render queue stays full.
+    """
+    path = get_sprite_path(sheet.key, sprite_format)
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        pass
+
+    cells = [get_cached_diagram("png", spec) for spec in sheet.specs]
+    content = run_in_render_pool(
+        build_sprite_sheet, sprite_format, sheet.specs, cells, sheet.cell_size
+    )
+    write_atomically(path, content)
+    return content
+
+
+def get_sprite_key(sprite_format: SpriteFormat, specs: Sequence[DiagramSpec]) -> str:
+    """Get the content key of a sheet.
+
+    Args:
+        sprite_format (SpriteFormat): Format of the sheet.
+        specs (Sequence[DiagramSpec]): Diagrams in the sheet, in order.
+
+    Returns:
+        str: A hex digest that changes with the sheet content.
+    """
+    source = "|".join((
+        str(SPRITE_VERSION),
+        sprite_format,
+        str(SPRITE_COLUMNS),
+        *(spec.get_key("png") for spec in specs),
+    ))
+    return hashlib.sha256(source.encode()).hexdigest()[:32]
+
+
+def get_sprite_path(key: str, sprite_format: SpriteFormat) -> Path:
+    """Get the path of a sheet on disk.
+
+    Args:
+        key (str): Content key of the sheet.
+        sprite_format (SpriteFormat): Format of the sheet.
+
+    Returns:
+        Path: The path, the file may not exist.
+    """
+    return Path(settings.CHORD_DIAGRAM_ROOT) / "sprites" / f"{key}.{sprite_format}"
+
+
+def prune_sprite_sheets(keys: Iterable[str]) -> int:
+    """Delete every other sheet from the disk.
+
+    Args:
+        keys (Iterable[str]): Content keys of the sheets to keep.
+
+    Returns:
+        int: The number of deleted files.
+    """
+    keep = set(keys)
+    root = Path(settings.CHORD_DIAGRAM_ROOT) / "sprites"
+    deleted = 0
+    for sprite_format in SPRITE_FORMATS:
+        for path in root.glob(f"*.{sprite_format}"):
+            if path.stem not in keep:
+                path.unlink(missing_ok=True)
+                deleted += 1
+    return deleted
+
+
+def build_sprite_sheet(
+    sprite_format: SpriteFormat,
+    specs: tuple[DiagramSpec, ...],
+    cells: list[bytes | None],
+    cell_size: tuple[int, int],
+) -> bytes:
+    """Put PNG diagrams together in one image; runs in the worker processes.
+
+    Args:
+        sprite_format (SpriteFormat): Format of the sheet.
+        specs (tuple[DiagramSpec, ...]): Diagrams in the sheet, in order.
+        cells (list[bytes | None]): Rendered PNG diagrams of the specs, None
+            for the ones to render here.
+        cell_size (tuple[int, int]): Width and height of a cell, at least
+            the size of every diagram.
+
+    Returns:
+        bytes: The sheet, lossless in both formats.
+    """
+    cell_width, cell_height = cell_size
+    columns = min(len(specs), SPRITE_COLUMNS)
+    rows = -(-len(specs) // SPRITE_COLUMNS)
+    sheet = Image.new("RGBA", (columns * cell_width, rows * cell_height), (0, 0, 0, 0))
+    for i, (spec, cell) in enumerate(zip(specs, cells, strict=True)):
+        row, column = divmod(i, SPRITE_COLUMNS)
+        content = render_png(spec) if cell is None else cell
+        with Image.open(io.BytesIO(content)) as image:
+            sheet.paste(image, (column * cell_width, row * cell_height))
+    output = io.BytesIO()
+    if sprite_format == "webp":
+        sheet.save(output, format="WEBP", lossless=True)
+    else:
+        sheet.save(output, format="PNG", optimize=True)
+    return output.getvalue()
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Sync tokens for the chords delta sync.
+
+A sync token is an opaque string that records when a client last synced.
+The next sync returns the chords changed and deleted after that time, minus
+`SYNC_TOKEN_OVERLAP`: a write that started before the previous sync but
+committed after it still has an older `updated_at`, and the overlap makes
+sure it is not missed. Clients apply changes idempotently, so sending a few
+chords twice is harmless.
+
+Deletions are sent from tombstones, which are kept for
+`SYNC_TOMBSTONE_RETENTION` and then removed by the `prune_chord_tombstones`
+management command. A token older than that may have missed deletions, so
+the feed refuses it and the client has to sync again without a token.
+"""
+
+import base64
+import binascii
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Final
+
+SYNC_TOKEN_OVERLAP: Final[timedelta] = timedelta(seconds=30)
+"""How far back before the token time changes are sent again."""
+
+SYNC_TOMBSTONE_RETENTION: Final[timedelta] = timedelta(days=30)
+"""How long tombstones are kept, and so the age of the oldest usable token."""
+
+_SYNC_TOKEN_VERSION: Final[int] = 1
+
+
+def get_sync_horizon(now: datetime) -> datetime:
+    """Get the oldest time a delta sync can still start from.
+
+    Tombstones before this time may have been pruned.
+
+    Args:
+        now (datetime): Current time (timezone-aware).
+
+    Returns:
+        datetime: The oldest usable sync time.
+    """
+    return now - SYNC_TOMBSTONE_RETENTION
+
+
+def encode_sync_token(synced_at: datetime) -> str:
+    """Encode the time of a sync into a token.
+
+    Args:
+        synced_at (datetime): Time the sync started (timezone-aware).
+
+    Returns:
+        str: URL-safe sync token.
+    """
+    payload = {
+        "v": _SYNC_TOKEN_VERSION,
+        "t": int(synced_at.timestamp() * 1_000_000),
+    }
+    raw = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode("ascii")
+
+
+def decode_sync_token(token: str) -> datetime:
+    """Decode a sync token.
+
+    Args:
+        token (str): Token returned by a previous sync.
+
+    Returns:
+        datetime: Time of the previous sync, in UTC.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        if payload["v"] != _SYNC_TOKEN_VERSION:
+            raise ValueError(payload["v"])
+        return datetime.fromtimestamp(int(payload["t"]) / 1_000_000, tz=UTC)
+    except (binascii.Error, UnicodeError, KeyError, TypeError, ValueError) as e:
+        raise ValueError("Invalid sync token.") from e
@@ -4,7 +4,12 @@
 
 """Pytest configuration and fixtures for testing chords app."""
 
+from collections.abc import Iterator
+from pathlib import Path
+
 import pytest
+from django.core.cache import cache
+from pytest_django import Settings
 
 from apps.chords.models import Chord, ChordPosition
 from apps.chords.tests.factories import (
@@ -14,6 +19,28 @@ from apps.chords.tests.factories import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_catalog_cache() -> Iterator[None]:
+    """Start every test with a fresh catalog version."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(scope="session")
+def chord_diagram_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory for the chord diagrams rendered by the tests."""
+    return tmp_path_factory.mktemp("chord_diagrams")
+
+
+@pytest.fixture(autouse=True)
+def chord_diagram_settings(settings: Settings, chord_diagram_root: Path) -> Settings:
+    """Keep rendered diagrams out of MEDIA_ROOT and render them in process."""
+    settings.CHORD_DIAGRAM_ROOT = chord_diagram_root
+    settings.CHORD_DIAGRAM_WORKERS = 0
+    return settings
+
+
 @pytest.fixture
 def chord_factory() -> type[FullChordFactory]:
     """Fixture providing the FullChord Factory for creating chords in tests."""
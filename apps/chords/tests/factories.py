@@ -10,6 +10,7 @@ from factory import Faker  # type: ignore[attr-defined]
 from factory.django import DjangoModelFactory
 
 from apps.chords.models import Chord, ChordPosition
+from apps.chords.services import ChordService
 
 
 class ChordFactory(DjangoModelFactory[Chord]):
@@ -56,3 +57,4 @@ class FullChordFactory(ChordFactory):
                 string_number=string_num,
             )
             chord_position.save()
+        ChordService.refresh_packed_positions(chord=self)
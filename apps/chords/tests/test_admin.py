@@ -8,10 +8,12 @@ from django.core.exceptions import PermissionDenied
 from django.http import HttpResponse
 from django.test import RequestFactory
 from django.urls import reverse
+from pytest_django import DjangoCaptureOnCommitCallbacks
 
 from apps.accounts.tests.factories.user import UserFactory
 from apps.chords.admin import ChordAdmin, ChordPositionInline
-from apps.chords.models import Chord, ChordPosition
+from apps.chords.catalog import get_catalog_version
+from apps.chords.models import Chord, ChordPosition, ChordTombstone
 
 
 @pytest.fixture
@@ -71,3 +73,121 @@ def test_chord_admin_inline_in_list_view_fail(
     request.user = user
     with pytest.raises(PermissionDenied):
         chord_admin.changelist_view(request)
+
+
+@pytest.mark.django_db
+def test_chord_admin_delete_model_bumps_catalog_version(
+    chord_admin: ChordAdmin,
+    chord: Chord,
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    request = RequestFactory().post("/")
+    version = get_catalog_version()
+
+    chord_id = chord.pk
+
+    with django_capture_on_commit_callbacks(execute=True):
+        chord_admin.delete_model(request, chord)
+
+    assert get_catalog_version() != version
+    assert not Chord.objects.exists()
+    assert list(ChordTombstone.objects.values_list("chord_id", flat=True)) == [chord_id]
+
+
+@pytest.mark.django_db
+def test_chord_admin_delete_queryset_bumps_catalog_version(
+    chord_admin: ChordAdmin,
+    chord: Chord,
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    request = RequestFactory().post("/")
+    version = get_catalog_version()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        chord_admin.delete_queryset(request, Chord.objects.all())
+
+    assert get_catalog_version() != version
+    assert not Chord.objects.exists()
+    assert list(ChordTombstone.objects.values_list("chord_id", flat=True)) == [chord.pk]
+
+
+@pytest.mark.django_db
+def test_chord_admin_save_related_bumps_catalog_version(
+    chord_admin: ChordAdmin,
+    chord: Chord,
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    request = RequestFactory().post("/")
+    form_class = chord_admin.get_form(request, chord)
+    form = form_class(
+        data={
+            "title": "Am",
+            "musical_title": "A minor",
+            "order_in_note": 1,
+            "start_fret": 1,
+        },
+        instance=chord,
+    )
+    assert form.is_valid()
+    form.save(commit=False)
+    version = get_catalog_version()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        chord_admin.save_related(request, form, [], change=True)
+
+    assert get_catalog_version() != version
+
+
+@pytest.mark.django_db
+def test_chord_admin_save_model_increments_revision(
+    chord_admin: ChordAdmin,
+    chord: Chord,
+) -> None:
+    request = RequestFactory().post("/")
+    form = chord_admin.get_form(request, chord)(instance=chord)
+
+    chord_admin.save_model(request, chord, form, change=True)
+
+    assert chord.revision == 2
+
+
+@pytest.mark.django_db
+def test_chord_admin_save_model_keeps_revision_on_add(
+    chord_admin: ChordAdmin,
+) -> None:
+    request = RequestFactory().post("/")
+    chord = Chord(title="Am", musical_title="A minor")
+    form = chord_admin.get_form(request)(instance=chord)
+
+    chord_admin.save_model(request, chord, form, change=False)
+
+    assert chord.revision == 1
+
+
+@pytest.mark.django_db
+def test_chord_admin_search_tolerates_typos(chord_admin: ChordAdmin) -> None:
+    Chord.objects.create(title="A", musical_title="A major")
+    Chord.objects.create(title="Am", musical_title="A minor")
+    Chord.objects.create(title="G", musical_title="G major")
+    request = RequestFactory().get(
+        reverse("admin:chords_chord_changelist"), {"q": "A mnor"}
+    )
+    request.user = UserFactory.create(is_superuser=True)
+
+    response = chord_admin.changelist_view(request)
+
+    results = response.context_data["cl"].result_list  # type: ignore[attr-defined]
+    assert [chord.title for chord in results] == ["Am", "A"]
+
+
+@pytest.mark.django_db
+def test_chord_admin_blank_search_keeps_all(chord_admin: ChordAdmin) -> None:
+    Chord.objects.create(title="Am", musical_title="A minor")
+    request = RequestFactory().get(reverse("admin:chords_chord_changelist"), {"q": " "})
+
+    queryset, may_have_duplicates = chord_admin.get_search_results(
+        request, Chord.objects.all(), " "
+    )
+
+    assert queryset.count() == 1
+    assert may_have_duplicates is False
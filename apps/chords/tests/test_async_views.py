@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from pytest_django import DjangoAssertNumQueries
+from pytest_mock import MockerFixture
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.accounts.models.user import User
+from apps.chords.api import async_views
+from apps.chords.models import Chord
+from apps.chords.tests.factories import FullChordFactory
+
+CHORDS_URL = "/api/v1/data/chords/"
+ASYNC_CHORDS_URL = "/api/v1/data/async/chords/"
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+@pytest.mark.django_db
+def test_async_list_matches_sync_list(
+    api_client: APIClient, chord_factory: type[FullChordFactory]
+) -> None:
+    chord_factory.create_batch(3)
+
+    sync_response = api_client.get(CHORDS_URL)
+    async_response = api_client.get(ASYNC_CHORDS_URL)
+
+    assert async_response.status_code == status.HTTP_200_OK
+    assert async_response.headers["Content-Type"] == "application/json"
+    assert async_response.content == sync_response.content
+    assert async_response.headers["ETag"] == sync_response.headers["ETag"]
+
+
+@pytest.mark.django_db
+def test_async_list_is_served_from_cache(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    chord_factory.create(title="Am")
+    first = api_client.get(ASYNC_CHORDS_URL)
+
+    with django_assert_num_queries(0):
+        second = api_client.get(ASYNC_CHORDS_URL)
+
+    assert second.content == first.content
+
+
+@pytest.mark.django_db
+def test_async_list_not_modified_for_matching_etag(api_client: APIClient) -> None:
+    etag = api_client.get(ASYNC_CHORDS_URL).headers["ETag"]
+
+    response = api_client.get(ASYNC_CHORDS_URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", [ASYNC_CHORDS_URL, f"{ASYNC_CHORDS_URL}1/"])
+def test_async_views_reject_writes(
+    api_client: APIClient, staff_user: User, url: str
+) -> None:
+    api_client.force_login(staff_user)
+
+    response = api_client.post(url)
+
+    assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", [ASYNC_CHORDS_URL, f"{ASYNC_CHORDS_URL}1/"])
+def test_async_views_check_permission(
+    api_client: APIClient, mocker: MockerFixture, url: str
+) -> None:
+    check = mocker.patch.object(
+        async_views._permission, "ahas_permission", return_value=False
+    )
+
+    response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.json() == {
+        "detail": "You do not have permission to perform this action."
+    }
+    check.assert_awaited_once()
+
+
+@pytest.mark.django_db
+def test_async_detail_matches_sync_detail(
+    api_client: APIClient, chord_factory: type[FullChordFactory]
+) -> None:
+    chord = chord_factory.create()
+
+    sync_response = api_client.get(f"{CHORDS_URL}{chord.pk}/")
+    async_response = api_client.get(f"{ASYNC_CHORDS_URL}{chord.pk}/")
+
+    assert async_response.status_code == status.HTTP_200_OK
+    assert async_response.content == sync_response.content
+    assert async_response.headers["ETag"] == sync_response.headers["ETag"]
+    assert (
+        async_response.headers["Last-Modified"]
+        == sync_response.headers["Last-Modified"]
+    )
+
+
+@pytest.mark.django_db
+def test_async_detail_reads_unpacked_positions(
+    api_client: APIClient, chord_factory: type[FullChordFactory]
+) -> None:
+    chord = chord_factory.create()
+    expected = api_client.get(f"{CHORDS_URL}{chord.pk}/").json()
+    Chord.objects.filter(pk=chord.pk).update(packed_positions="")
+
+    response = api_client.get(f"{ASYNC_CHORDS_URL}{chord.pk}/")
+
+    assert response.json()["positions"] == expected["positions"]
+
+
+@pytest.mark.django_db
+def test_async_detail_not_modified_for_matching_etag(
+    api_client: APIClient, chord_factory: type[FullChordFactory]
+) -> None:
+    chord = chord_factory.create()
+    url = f"{ASYNC_CHORDS_URL}{chord.pk}/"
+    etag = api_client.get(url).headers["ETag"]
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_async_detail_not_found(api_client: APIClient) -> None:
+    response = api_client.get(f"{ASYNC_CHORDS_URL}999999/")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"detail": "Chord not found."}
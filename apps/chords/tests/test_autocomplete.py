@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from pytest_django import DjangoAssertNumQueries
+
+from apps.chords.autocomplete import (
+    ChordAutocompleteIndex,
+    get_autocomplete_index,
+    normalize_name,
+)
+from apps.chords.catalog import bump_catalog_version
+from apps.chords.tests.factories import ChordFactory
+
+ROWS = [
+    (1, "Am", "A minor"),
+    (2, "Am", "A minor"),
+    (3, "A", "A major"),
+    (4, "Amaj7", "A major seventh"),
+    (5, "C#m", "C sharp minor"),
+]
+
+
+@pytest.fixture
+def index() -> ChordAutocompleteIndex:
+    return ChordAutocompleteIndex(ROWS)
+
+
+def _values(index: ChordAutocompleteIndex, prefix: str, limit: int = 10) -> list[str]:
+    return [suggestion["value"] for suggestion in index.suggest(prefix, limit)]
+
+
+def test_normalize_name() -> None:
+    assert normalize_name("  C♯   Minor ") == "c# minor"
+    assert normalize_name("B♭") == "bb"
+
+
+def test_index_counts_distinct_names(index: ChordAutocompleteIndex) -> None:
+    assert len(index) == 8
+
+
+def test_suggest_prefix_in_key_order(index: ChordAutocompleteIndex) -> None:
+    assert _values(index, "a") == [
+        "A",
+        "A major",
+        "A major seventh",
+        "A minor",
+        "Am",
+        "Amaj7",
+    ]
+    assert _values(index, "AM") == ["Am", "Amaj7"]
+    assert _values(index, "c♯") == ["C#m"]
+
+
+def test_suggest_later_words_of_musical_titles(index: ChordAutocompleteIndex) -> None:
+    assert _values(index, "min") == ["A minor", "C sharp minor"]
+    assert _values(index, "major s") == ["A major seventh"]
+
+
+def test_suggestion_lists_chord_ids(index: ChordAutocompleteIndex) -> None:
+    suggestion = index.suggest("am", 1)[0]
+
+    assert suggestion == {"value": "Am", "kind": "title", "ids": [1, 2]}
+
+
+@pytest.mark.parametrize("prefix", ["", "  ", "d", "a minor x"])
+def test_suggest_nothing(index: ChordAutocompleteIndex, prefix: str) -> None:
+    assert index.suggest(prefix, 10) == []
+
+
+def test_suggest_limit(index: ChordAutocompleteIndex) -> None:
+    assert _values(index, "a", limit=2) == ["A", "A major"]
+
+
+@pytest.mark.django_db
+def test_index_is_built_once_per_catalog_version(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    ChordFactory.create(title="Am", musical_title="A minor")
+    with django_assert_num_queries(1):
+        first = get_autocomplete_index()
+    with django_assert_num_queries(0):
+        assert get_autocomplete_index() is first
+
+    ChordFactory.create(title="Em", musical_title="E minor")
+    bump_catalog_version()
+    with django_assert_num_queries(1):
+        second = get_autocomplete_index()
+
+    assert second is not first
+    assert [s["value"] for s in second.suggest("minor", 10)] == ["A minor", "E minor"]
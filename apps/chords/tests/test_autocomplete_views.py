@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from pytest_django import DjangoAssertNumQueries
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.chords.constants import MAX_AUTOCOMPLETE_SUGGESTIONS
+from apps.chords.tests.factories import ChordFactory
+
+AUTOCOMPLETE_URL = "/api/v1/data/chords/autocomplete/"
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+@pytest.mark.django_db
+def test_autocomplete(
+    api_client: APIClient, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    am = ChordFactory.create(title="Am", musical_title="A minor")
+    ChordFactory.create(title="G", musical_title="G major")
+    api_client.get(AUTOCOMPLETE_URL, {"q": "a"})
+
+    with django_assert_num_queries(0):
+        response = api_client.get(AUTOCOMPLETE_URL, {"q": "a m"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "suggestions": [{"value": "A minor", "kind": "musical_title", "ids": [am.pk]}]
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("params", "field"),
+    [
+        ({}, "q"),
+        ({"q": " "}, "q"),
+        ({"q": "a", "limit": str(MAX_AUTOCOMPLETE_SUGGESTIONS + 1)}, "limit"),
+    ],
+)
+def test_autocomplete_invalid(
+    api_client: APIClient, params: dict[str, str], field: str
+) -> None:
+    response = api_client.get(AUTOCOMPLETE_URL, params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert field in response.json()
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import struct
+
+import pytest
+
+from apps.chords.binary import BINARY_MAGIC, decode_chords, encode_chords
+from apps.chords.constants import MAX_START_FRET
+
+MUSICAL_TITLE = "Ля минор"
+CHORD = {
+    "id": 7,
+    "title": "Am",
+    "musical_title": MUSICAL_TITLE,
+    "order_in_note": 2,
+    "start_fret": 1,
+    "has_barre": True,
+    "positions": [
+        {"string_number": 6, "fret": -1, "finger": 0},
+        {"string_number": 1, "fret": 12, "finger": 4},
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        [CHORD, {**CHORD, "id": 8, "has_barre": False, "positions": []}],
+        CHORD,
+        {"next": "http://testserver/api/v1/data/chords/?cursor=x", "results": [CHORD]},
+        {"next": None, "results": []},
+    ],
+)
+def test_round_trip(data: object) -> None:
+    assert decode_chords(encode_chords(data)) == data
+
+
+def test_round_trip_of_largest_start_fret() -> None:
+    chord = {**CHORD, "start_fret": MAX_START_FRET}
+
+    assert decode_chords(encode_chords(chord)) == chord
+
+
+def test_start_fret_above_limit_does_not_fit() -> None:
+    with pytest.raises(struct.error):
+        encode_chords({**CHORD, "start_fret": MAX_START_FRET + 1})
+
+
+def test_encoding_is_compact() -> None:
+    payload = encode_chords(CHORD)
+
+    assert payload.startswith(BINARY_MAGIC)
+    # header, chord fields, two strings with lengths, position count, positions
+    assert (
+        len(payload) == 8 + 8 + (2 + 2) + (2 + len(MUSICAL_TITLE.encode())) + 1 + 2 * 3
+    )
+
+
+def test_encode_rejects_other_data() -> None:
+    with pytest.raises(ValueError, match="Not a chord payload"):
+        encode_chords({"detail": "Not found."})
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"",
+        b"XXXX" + encode_chords([])[4:],
+        encode_chords([])[:4] + b"\x02" + encode_chords([])[5:],
+        encode_chords([])[:5] + b"\x09" + encode_chords([])[6:],
+        encode_chords([CHORD])[:-1],
+        encode_chords([CHORD]) + b"\x00",
+        encode_chords([])[:8] + struct.pack("<I", 1) + b"\x00" * 8 + b"\x05\x00ab",
+    ],
+)
+def test_decode_rejects_malformed_payload(payload: bytes) -> None:
+    with pytest.raises(ValueError, match="payload"):
+        decode_chords(payload)
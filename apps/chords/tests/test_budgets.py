@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Endpoint budgets of the chords API against a seeded catalog."""
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.accounts.models.user import User
+from apps.chords.api.budgets import CHORD_BUDGETS
+from apps.chords.api.sprite_views import get_sprite_layout
+from apps.chords.models import Chord, ChordPosition
+from apps.chords.packing import PackedPositionDict, pack_positions, unpack_positions
+from apps.chords.shapes import shape_from_packed
+from apps.chords.sprites import get_sprite_sheet
+from apps.shared.budgets import EndpointBudget, get_unbudgeted_routes
+from apps.shared.pytest_budgets import BudgetChecker
+
+NOTES = ("Am", "C", "D", "Dm", "E", "Em", "F", "G")
+SHAPES = ("x02210", "x32010", "xx0232", "320003")
+
+
+@pytest.fixture
+def seeded_catalog(budget_catalog_size: int) -> list[Chord]:
+    """Seed the catalog with chords that have both packed and row positions."""
+    chords = []
+    for i in range(budget_catalog_size):
+        shape = SHAPES[i % len(SHAPES)]
+        positions: list[PackedPositionDict] = [
+            {"string_number": 6 - j, "fret": -1 if c == "x" else int(c), "finger": 0}
+            for j, c in enumerate(shape)
+        ]
+        packed = pack_positions(positions)
+        chords.append(
+            Chord(
+                title=NOTES[i % len(NOTES)],
+                musical_title=f"Chord {i}",
+                order_in_note=i // len(NOTES) + 1,
+                packed_positions=packed,
+                shape=shape_from_packed(packed),
+            )
+        )
+    chords = Chord.objects.bulk_create(chords)
+    ChordPosition.objects.bulk_create(
+        ChordPosition(chord=chord, **position)
+        for chord in chords
+        for position in unpack_positions(chord.packed_positions)
+    )
+    return chords
+
+
+def test_every_route_has_a_budget() -> None:
+    assert get_unbudgeted_routes() == []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("budget", CHORD_BUDGETS, ids=lambda b: b.label)
+def test_chord_endpoint_budget(
+    budget: EndpointBudget,
+    seeded_catalog: list[Chord],
+    staff_user: User,
+    check_budget: BudgetChecker,
+) -> None:
+    client = APIClient()
+    if budget.staff:
+        client.force_authenticate(staff_user)
+    layout = get_sprite_layout("png")
+    sheet = next(iter(layout.sheets.values()))
+    get_sprite_sheet("png", sheet)
+
+    check_budget(
+        client,
+        budget,
+        items=len(seeded_catalog),
+        url_kwargs={
+            "pk": seeded_catalog[0].pk,
+            "diagram_format": "svg",
+            "sprite_key": sheet.key,
+            "format": "png",
+        },
+    )
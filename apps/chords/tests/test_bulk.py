@@ -0,0 +1,262 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import json
+from collections.abc import Generator, Iterable, Iterator
+from typing import Any, NoReturn, cast
+
+import pytest
+from django.db import DatabaseError
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from apps.accounts.models.user import User
+from apps.chords.api.bulk import ChordBulkLoader
+from apps.chords.models import Chord
+from apps.chords.services import (
+    ChordBulkOperationDict,
+    ChordBulkResultDict,
+    ChordBulkService,
+)
+from apps.chords.tests.factories import FullChordFactory
+
+BULK_URL = "/api/v1/data/chords/bulk/"
+
+
+def _chord_line(title: str, **extra: object) -> dict[str, Any]:
+    return {
+        "title": title,
+        "musical_title": title,
+        "order_in_note": 1,
+        "start_fret": 1,
+        "has_barre": False,
+        "positions": [
+            {"string_number": i, "fret": 0, "finger": 0} for i in range(1, 7)
+        ],
+        **extra,
+    }
+
+
+def _ndjson(*lines: object) -> bytes:
+    return b"".join(
+        (line if isinstance(line, bytes) else json.dumps(line).encode()) + b"\n"
+        for line in lines
+    )
+
+
+def _records(loader: ChordBulkLoader, lines: Iterable[bytes]) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in loader.run(lines)]
+
+
+def _run(loader: ChordBulkLoader, body: bytes) -> list[dict[str, Any]]:
+    *results, summary = _records(loader, body.splitlines(keepends=True))
+    assert summary["status"] == "complete"
+    return results
+
+
+@pytest.fixture
+def staff_client(staff_user: User) -> APIClient:
+    client = APIClient()
+    client.force_authenticate(staff_user)
+    return client
+
+
+@pytest.mark.django_db
+def test_loader_applies_lines_in_order(chord_factory: type[FullChordFactory]) -> None:
+    chord = chord_factory.create(title="Dm", order_in_note=1)
+    body = _ndjson(
+        _chord_line("Am"),
+        b"",
+        {"op": "delete", "id": chord.pk},
+        _chord_line("Em"),
+    )
+
+    results = _run(ChordBulkLoader(), body)
+
+    assert [(r["line"], r["status"]) for r in results] == [
+        (1, "created"),
+        (3, "deleted"),
+        (4, "created"),
+    ]
+    assert sorted(Chord.objects.values_list("title", flat=True)) == ["Am", "Em"]
+
+
+@pytest.mark.django_db
+def test_loader_reports_invalid_lines() -> None:
+    body = _ndjson(
+        b"{not json",
+        [1, 2],
+        {"op": "rename"},
+        {"op": "delete", "title": "Am"},
+        _chord_line("Am", positions=[]),
+        _chord_line("Am"),
+    )
+
+    results = _run(ChordBulkLoader(), body)
+
+    assert [r["status"] for r in results] == ["error"] * 5 + ["created"]
+    assert results[0]["errors"] == {"detail": ["Invalid JSON."]}
+    assert results[1]["errors"] == {"detail": ["Expected a JSON object."]}
+    assert results[2]["errors"] == {"op": ['Unknown operation "rename".']}
+    assert "non_field_errors" in results[3]["errors"]
+    assert "positions" in results[4]["errors"]
+
+
+@pytest.mark.django_db
+def test_loader_commits_in_batches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    batches: list[int] = []
+    apply_batch = ChordBulkService.apply_batch
+
+    def spy(*, operations: list[ChordBulkOperationDict]) -> list[ChordBulkResultDict]:
+        batches.append(len(operations))
+        return apply_batch(operations=operations)
+
+    monkeypatch.setattr(ChordBulkService, "apply_batch", spy)
+    body = _ndjson(*(_chord_line(f"C{i}") for i in range(5)))
+
+    results = _run(ChordBulkLoader(batch_size=2), body)
+
+    assert batches == [2, 2, 1]
+    assert [r["line"] for r in results] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.django_db
+def test_loader_flushes_before_repeated_key() -> None:
+    body = _ndjson(_chord_line("Am"), _chord_line("Am", musical_title="A minor"))
+
+    results = _run(ChordBulkLoader(), body)
+
+    assert [r["status"] for r in results] == ["created", "updated"]
+    assert Chord.objects.get().musical_title == "A minor"
+
+
+@pytest.mark.django_db
+def test_loader_reports_failed_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(**kwargs: object) -> NoReturn:
+        raise DatabaseError("boom")
+
+    monkeypatch.setattr(ChordBulkService, "apply_batch", fail)
+
+    results = _run(ChordBulkLoader(), _ndjson(_chord_line("Am")))
+
+    assert results == [
+        {"line": 1, "status": "error", "errors": {"detail": ["Batch failed: boom"]}}
+    ]
+
+
+@pytest.mark.django_db
+def test_loader_reports_unexpected_batch_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = 0
+    apply_batch = ChordBulkService.apply_batch
+
+    def fail_second(
+        *, operations: list[ChordBulkOperationDict]
+    ) -> list[ChordBulkResultDict]:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise ValueError("boom")
+        return apply_batch(operations=operations)
+
+    monkeypatch.setattr(ChordBulkService, "apply_batch", fail_second)
+    body = _ndjson(_chord_line("Am"), _chord_line("Em"), _chord_line("G"))
+
+    records = _records(ChordBulkLoader(batch_size=1), body.splitlines())
+
+    assert records == [
+        {"line": 1, "status": "created", "id": Chord.objects.get(title="Am").pk},
+        {"line": 2, "status": "error", "errors": {"detail": ["Batch failed."]}},
+        {"line": 3, "status": "created", "id": Chord.objects.get(title="G").pk},
+        {"status": "complete", "lines": 3, "failed": 1},
+    ]
+    assert not Chord.objects.filter(title="Em").exists()
+
+
+@pytest.mark.django_db
+def test_loader_aborts_when_body_cannot_be_read() -> None:
+    def body() -> Iterator[bytes]:
+        yield from _ndjson(_chord_line("Am"), _chord_line("Em")).splitlines()
+        yield _ndjson(_chord_line("G"))
+        raise OSError("connection reset")
+
+    records = _records(ChordBulkLoader(batch_size=2), body())
+
+    assert [r["status"] for r in records] == ["created", "created", "error", "aborted"]
+    assert records[2]["errors"] == {
+        "detail": ["Not applied: the bulk change was aborted."]
+    }
+    assert records[-1] == {"status": "aborted", "lines": 3, "failed": 1}
+    assert set(Chord.objects.values_list("title", flat=True)) == {"Am", "Em"}
+
+
+@pytest.mark.django_db
+def test_loader_keeps_sent_batches_on_disconnect() -> None:
+    body = _ndjson(_chord_line("Am"), _chord_line("Em"), _chord_line("G"))
+    output = cast(
+        Generator[bytes], ChordBulkLoader(batch_size=1).run(body.splitlines())
+    )
+
+    first = json.loads(next(output))
+    output.close()
+
+    assert first["status"] == "created"
+    assert list(Chord.objects.values_list("title", flat=True)) == ["Am"]
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [("", 500), ("?batch_size=10", 10), ("?batch_size=0", 500), ("?batch_size=x", 500)],
+)
+def test_loader_batch_size_from_request(
+    api_request_factory: APIRequestFactory,
+    query: str,
+    expected: int,
+) -> None:
+    request = Request(api_request_factory.post(BULK_URL + query))
+
+    assert ChordBulkLoader.from_request(request).batch_size == expected
+
+
+@pytest.mark.django_db
+def test_bulk_endpoint_streams_results(staff_client: APIClient) -> None:
+    body = _ndjson(_chord_line("Am"), _chord_line("Em"))
+
+    response = cast(
+        StreamingHttpResponse,
+        staff_client.generic(
+            "POST", BULK_URL, body.decode(), content_type="application/x-ndjson"
+        ),
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/x-ndjson"
+    lines = response.getvalue().splitlines()
+    assert [json.loads(line)["status"] for line in lines] == [
+        "created",
+        "created",
+        "complete",
+    ]
+    assert Chord.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_bulk_endpoint_is_staff_only(common_user: User) -> None:
+    client = APIClient()
+    client.force_authenticate(common_user)
+
+    response = client.generic(
+        "POST",
+        BULK_URL,
+        _ndjson(_chord_line("Am")).decode(),
+        content_type="application/x-ndjson",
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert not Chord.objects.exists()
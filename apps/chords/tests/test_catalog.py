@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from unittest.mock import AsyncMock, Mock
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from pytest_mock import MockerFixture
+
+from apps.chords.catalog import (
+    CATALOG_VERSION_KEY,
+    CatalogCache,
+    aget_catalog_modified,
+    aget_catalog_version,
+    bump_catalog_version,
+    get_catalog_modified,
+    get_catalog_version,
+)
+
+
+def test_catalog_version_is_stable() -> None:
+    assert get_catalog_version() == get_catalog_version()
+
+
+def test_bump_catalog_version_changes_version() -> None:
+    version = get_catalog_version()
+
+    bump_catalog_version()
+
+    assert get_catalog_version() != version
+
+
+def test_bump_catalog_version_without_stored_version() -> None:
+    cache.delete(CATALOG_VERSION_KEY)
+
+    bump_catalog_version()
+
+    assert cache.get(CATALOG_VERSION_KEY) is not None
+
+
+def test_catalog_version_without_working_cache(mocker: MockerFixture) -> None:
+    mocker.patch("apps.chords.catalog.cache.get", return_value=None)
+
+    assert get_catalog_version() > 0
+
+
+def test_catalog_cache_builds_once_per_version() -> None:
+    catalog_cache: CatalogCache[int] = CatalogCache()
+    builder = Mock(return_value=42)
+
+    assert catalog_cache.get_or_build("key", builder) == 42
+    assert catalog_cache.get_or_build("key", builder) == 42
+
+    builder.assert_called_once()
+
+
+def test_catalog_cache_rebuilds_after_bump() -> None:
+    catalog_cache: CatalogCache[int] = CatalogCache()
+    builder = Mock(side_effect=[1, 2])
+
+    first = catalog_cache.get_or_build("key", builder)
+    bump_catalog_version()
+    second = catalog_cache.get_or_build("key", builder)
+
+    assert (first, second) == (1, 2)
+
+
+def test_catalog_cache_respects_max_entries() -> None:
+    catalog_cache: CatalogCache[str] = CatalogCache(max_entries=1)
+    builder = Mock(side_effect=["a", "b", "c"])
+
+    catalog_cache.get_or_build("a", builder)
+    catalog_cache.get_or_build("b", builder)
+    catalog_cache.get_or_build("b", builder)
+
+    assert builder.call_count == 3
+
+
+def test_catalog_cache_clear() -> None:
+    catalog_cache: CatalogCache[int] = CatalogCache()
+    builder = Mock(side_effect=[1, 2])
+
+    catalog_cache.get_or_build("key", builder)
+    catalog_cache.clear()
+
+    assert catalog_cache.get_or_build("key", builder) == 2
+
+
+def test_async_catalog_version_matches_sync_version() -> None:
+    assert async_to_sync(aget_catalog_version)() == get_catalog_version()
+
+
+def test_async_catalog_modified_matches_sync_modified() -> None:
+    modified = async_to_sync(aget_catalog_modified)()
+
+    assert modified == get_catalog_modified()
+
+
+def test_async_catalog_version_without_working_cache(mocker: MockerFixture) -> None:
+    mocker.patch("apps.chords.catalog.cache.aget", return_value=None)
+    mocker.patch("apps.chords.catalog.cache.aadd")
+
+    assert async_to_sync(aget_catalog_version)() > 0
+    assert async_to_sync(aget_catalog_modified)() is not None
+
+
+def test_catalog_cache_builds_once_per_version_async() -> None:
+    catalog_cache: CatalogCache[int] = CatalogCache()
+    builder = AsyncMock(return_value=42)
+
+    assert async_to_sync(catalog_cache.aget_or_build)("key", builder) == 42
+    assert async_to_sync(catalog_cache.aget_or_build)("key", builder) == 42
+
+    builder.assert_awaited_once()
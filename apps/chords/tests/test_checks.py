@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import SystemCheckError
+from django.test import override_settings
+
+from apps.chords.checks import check_shared_catalog_cache
+
+
+def test_check_warns_about_process_local_cache() -> None:
+    with override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    ):
+        messages = check_shared_catalog_cache(None)
+
+    assert [message.id for message in messages] == ["chords.W001"]
+
+
+def test_check_accepts_shared_cache() -> None:
+    with override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache"}}
+    ):
+        assert check_shared_catalog_cache(None) == []
+
+
+def test_check_runs_with_deploy_checks() -> None:
+    with pytest.raises(SystemCheckError, match=r"chords\.W001"):
+        call_command("check", "--deploy", "--fail-level", "WARNING")
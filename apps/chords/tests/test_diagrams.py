@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import io
+import stat
+from pathlib import Path
+from xml.etree import ElementTree
+
+import pytest
+from django.core.management import call_command
+from PIL import Image
+from pytest_django import Settings
+from pytest_mock import MockerFixture
+
+from apps.chords import diagrams
+from apps.chords.diagrams import (
+    DIAGRAM_FILE_MODE,
+    DiagramBusyError,
+    DiagramSpec,
+    get_diagram,
+    get_diagram_path,
+    prune_diagrams,
+    render_png,
+    render_svg,
+    shutdown_diagram_pool,
+)
+from apps.chords.selectors import get_chord_diagram_spec
+from apps.chords.sprites import get_sprite_key, get_sprite_path, layout_sprites
+from apps.chords.tests.factories import FullChordFactory
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+AM = DiagramSpec(start_fret=1, has_barre=False, packed_positions="1002113234225006x0")
+F = DiagramSpec(start_fret=1, has_barre=True, packed_positions="111212323433521611")
+HIGH = DiagramSpec(start_fret=5, has_barre=False, packed_positions="1712813934945716x0")
+
+
+def _count(svg: bytes, tag: str) -> int:
+    return len(ElementTree.fromstring(svg).findall(f"{SVG_NS}{tag}"))
+
+
+def test_diagram_key_depends_on_format_and_fingering() -> None:
+    keys = {
+        AM.get_key("svg"),
+        AM.get_key("png"),
+        F.get_key("svg"),
+        AM._replace(start_fret=2).get_key("svg"),
+    }
+
+    assert len(keys) == 4
+    assert AM.get_key("svg") == DiagramSpec(*AM).get_key("svg")
+
+
+def test_render_svg_open_strings_and_fingers() -> None:
+    svg = render_svg(AM)
+
+    root = ElementTree.fromstring(svg)
+    assert root.tag == f"{SVG_NS}svg"
+    open_marks = root.findall(f"{SVG_NS}circle[@fill='none']")
+    assert len(open_marks) == 2
+    assert [t.text for t in root.findall(f"{SVG_NS}text")] == ["1", "3", "2"]
+    assert _count(svg, "rect") == 0
+
+
+def test_render_svg_barre() -> None:
+    svg = render_svg(F)
+
+    assert _count(svg, "rect") == 1
+
+
+def test_render_svg_start_fret_label_and_muted_string() -> None:
+    svg = render_svg(HIGH)
+
+    texts = [t.text for t in ElementTree.fromstring(svg).findall(f"{SVG_NS}text")]
+    assert texts[0] == "5"
+    # Six strings, six fret lines (five rows) and a cross of two lines.
+    assert _count(svg, "line") == 6 + 6 + 2
+
+
+def test_render_png() -> None:
+    image = Image.open(io.BytesIO(render_png(F)))
+
+    assert image.format == "PNG"
+    assert image.mode == "RGBA"
+    assert image.size == (2 * 128, 2 * 151)
+
+
+def test_get_diagram_renders_once(
+    chord_diagram_root: Path, mocker: MockerFixture
+) -> None:
+    spec = AM._replace(start_fret=3)
+    first = get_diagram("svg", spec)
+    render = mocker.patch("apps.chords.diagrams.render_diagram")
+
+    second = get_diagram("svg", spec)
+
+    assert second == first
+    render.assert_not_called()
+    key = spec.get_key("svg")
+    assert (chord_diagram_root / key[:2] / f"{key}.svg").read_bytes() == first
+
+
+def test_diagram_files_are_readable_by_everyone() -> None:
+    spec = AM._replace(start_fret=7)
+    get_diagram("svg", spec)
+
+    mode = stat.S_IMODE(get_diagram_path("svg", spec).stat().st_mode)
+
+    assert mode == DIAGRAM_FILE_MODE
+
+
+def test_prune_diagrams(settings: Settings, tmp_path: Path) -> None:
+    settings.CHORD_DIAGRAM_ROOT = tmp_path
+    for spec in (AM, F):
+        get_diagram("svg", spec)
+        get_diagram("png", spec)
+    (tmp_path / "sprites").mkdir()
+    (tmp_path / "sprites" / "sheet.png").write_bytes(b"")
+
+    deleted = prune_diagrams([AM])
+
+    assert deleted == 2
+    assert get_diagram_path("svg", AM).exists()
+    assert get_diagram_path("png", AM).exists()
+    assert not get_diagram_path("svg", F).exists()
+    assert not get_diagram_path("png", F).exists()
+    assert (tmp_path / "sprites" / "sheet.png").exists()
+
+
+@pytest.mark.django_db
+def test_prune_chord_diagrams_command(
+    settings: Settings, tmp_path: Path, chord_factory: type[FullChordFactory]
+) -> None:
+    settings.CHORD_DIAGRAM_ROOT = tmp_path
+    chord = chord_factory.create()
+    spec = get_chord_diagram_spec(chord_id=chord.pk)[0]
+    get_diagram("svg", spec)
+    get_diagram("svg", HIGH)
+    (sheet,) = layout_sprites("webp", [(chord.pk, chord.title, spec)]).sheets
+    stale = get_sprite_key("png", [HIGH])
+    (tmp_path / "sprites").mkdir()
+    get_sprite_path(sheet, "webp").write_bytes(b"")
+    get_sprite_path(stale, "png").write_bytes(b"")
+    stdout = io.StringIO()
+
+    call_command("prune_chord_diagrams", stdout=stdout)
+
+    assert stdout.getvalue() == "Deleted 1 diagrams and 1 sprite sheets.\n"
+    assert get_diagram_path("svg", spec).exists()
+    assert not get_diagram_path("svg", HIGH).exists()
+    assert get_sprite_path(sheet, "webp").exists()
+    assert not get_sprite_path(stale, "png").exists()
+
+
+def test_get_diagram_in_worker_process(settings: Settings) -> None:
+    settings.CHORD_DIAGRAM_WORKERS = 1
+    spec = F._replace(start_fret=4)
+    try:
+        content = get_diagram("png", spec)
+    finally:
+        shutdown_diagram_pool()
+
+    assert content == render_png(spec)
+
+
+def test_get_diagram_refuses_when_queue_is_full(
+    settings: Settings, mocker: MockerFixture
+) -> None:
+    settings.CHORD_DIAGRAM_WORKERS = 1
+    queue = mocker.Mock()
+    queue.acquire.return_value = False
+    mocker.patch.object(diagrams, "_get_pool", return_value=(mocker.Mock(), queue))
+
+    with pytest.raises(DiagramBusyError):
+        get_diagram("svg", AM._replace(start_fret=6))
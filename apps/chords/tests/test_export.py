@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from pytest_django import DjangoAssertNumQueries
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.accounts.models.user import User
+from apps.chords.api.export import CSV_COLUMNS, export_chords
+from apps.chords.api.serializers import ChordOutputSerializer
+from apps.chords.models import Chord
+from apps.chords.selectors import get_all_chords
+from apps.chords.tests.factories import FullChordFactory
+
+EXPORT_URL = "/api/v1/data/chords/export/"
+
+
+@pytest.fixture
+def chords(chord_factory: type[FullChordFactory]) -> list[Chord]:
+    return chord_factory.create_batch(5)
+
+
+@pytest.fixture
+def staff_client(staff_user: User) -> APIClient:
+    client = APIClient()
+    client.force_authenticate(staff_user)
+    return client
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("chords")
+def test_ndjson_export_has_the_serializer_output() -> None:
+    content = b"".join(export_chords("ndjson"))
+
+    lines = [json.loads(line) for line in content.splitlines()]
+    assert lines == list(ChordOutputSerializer(get_all_chords(), many=True).data)
+
+
+@pytest.mark.django_db
+def test_csv_export(chords: list[Chord]) -> None:
+    content = b"".join(export_chords("csv")).decode()
+
+    rows = list(csv.reader(io.StringIO(content)))
+    assert tuple(rows[0]) == CSV_COLUMNS
+    by_id = {int(row[0]): row for row in rows[1:]}
+    assert by_id.keys() == {chord.pk for chord in chords}
+    chord = chords[0]
+    assert by_id[chord.pk] == [
+        str(chord.pk),
+        chord.title,
+        chord.musical_title,
+        str(chord.order_in_note),
+        str(chord.start_fret),
+        "true" if chord.has_barre else "false",
+        chord.packed_positions,
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("chords")
+@pytest.mark.parametrize(("export_format", "parts"), [("ndjson", 3), ("csv", 4)])
+def test_export_yields_one_part_per_chunk(export_format: str, parts: int) -> None:
+    assert len(list(export_chords(export_format, chunk_size=2))) == parts  # type: ignore[arg-type]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("chords")
+def test_export_reads_unpacked_positions_per_chunk(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    Chord.objects.update(packed_positions="")
+
+    with django_assert_num_queries(4):
+        content = b"".join(export_chords("ndjson", chunk_size=2))
+
+    assert all(len(json.loads(line)["positions"]) == 6 for line in content.splitlines())
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("chords")
+def test_export_endpoint_streams_csv(staff_client: APIClient) -> None:
+    response = staff_client.get(EXPORT_URL, {"export_format": "csv"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response["Content-Type"] == "text/csv; charset=utf-8"
+    assert response["Content-Disposition"] == 'attachment; filename="chords.csv"'
+    assert len(response.getvalue().splitlines()) == 6
+
+
+@pytest.mark.django_db
+def test_export_endpoint_defaults_to_ndjson(staff_client: APIClient) -> None:
+    response = staff_client.get(EXPORT_URL)
+
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert response.getvalue() == b""
+
+
+@pytest.mark.django_db
+def test_export_endpoint_rejects_unknown_format(staff_client: APIClient) -> None:
+    response = staff_client.get(EXPORT_URL, {"export_format": "xml"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_export_endpoint_is_staff_only(common_user: User) -> None:
+    client = APIClient()
+    client.force_authenticate(common_user)
+
+    response = client.get(EXPORT_URL)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("chords")
+def test_export_command_writes_stdout() -> None:
+    stdout = io.StringIO()
+
+    call_command("export_chords", "--chunk-size", "2", stdout=stdout)
+
+    assert len(stdout.getvalue().splitlines()) == 5
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("chords")
+def test_export_command_writes_file(tmp_path: Path) -> None:
+    output = tmp_path / "chords.csv"
+    stderr = io.StringIO()
+
+    call_command("export_chords", "--format", "csv", "-o", str(output), stderr=stderr)
+
+    assert output.read_text().splitlines()[0] == ",".join(CSV_COLUMNS)
+    assert f"to {output}" in stderr.getvalue()
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from apps.chords.api.fast_output import (
+    CHORD_OUTPUT_VALUES,
+    build_chord_output,
+    dump_chord_groups,
+    dump_chord_list,
+    dump_chord_page,
+    group_chord_output,
+)
+from apps.chords.api.renderers import ChordJSONRenderer, RenderedJSON
+from apps.chords.api.serializers import ChordOutputSerializer
+from apps.chords.models import Chord
+from apps.chords.selectors import get_all_chords
+from apps.chords.tests.factories import ChordPositionFactory, FullChordFactory
+
+TRICKY_TITLES = (
+    "Am",
+    "Ля минор",
+    'C "open"',
+    "back\\slash",
+    "tab\tnew\nline\x01",
+    "sep\u2028par\u2029",
+    "emoji 🎸",
+    "del\x7f",
+)
+
+
+def _render_with_drf(data: object) -> bytes:
+    return bytes(JSONRenderer().render(data))
+
+
+@pytest.mark.django_db
+def test_list_is_identical_to_drf(chord_factory: type[FullChordFactory]) -> None:
+    for i, title in enumerate(TRICKY_TITLES):
+        chord_factory.create(title=title, musical_title=title[::-1], order_in_note=i)
+    chords = get_all_chords()
+
+    expected = _render_with_drf(ChordOutputSerializer(chords, many=True).data)
+    rows = chords.values(*CHORD_OUTPUT_VALUES)
+
+    assert dump_chord_list(build_chord_output(rows)) == expected
+
+
+@pytest.mark.django_db
+def test_page_is_identical_to_drf(chord_factory: type[FullChordFactory]) -> None:
+    chord_factory.create_batch(3)
+    chords = get_all_chords()
+    next_link = "http://testserver/api/v1/data/chords/?cursor=abc"
+
+    serializer = ChordOutputSerializer(chords, many=True)
+    expected = _render_with_drf({"next": next_link, "results": serializer.data})
+    rows = chords.values(*CHORD_OUTPUT_VALUES)
+
+    assert dump_chord_page(next_link, build_chord_output(rows)) == expected
+
+
+@pytest.mark.django_db
+def test_groups_are_identical_to_drf(chord_factory: type[FullChordFactory]) -> None:
+    for title, order_in_note in (("Am", 2), ("Am", 1), ("C", 1), ("Ля минор", 1)):
+        chord_factory.create(title=title, order_in_note=order_in_note)
+    chords = get_all_chords()
+
+    data = ChordOutputSerializer(chords, many=True).data
+    expected = _render_with_drf([
+        {"title": "Am", "chords": data[:2]},
+        {"title": "C", "chords": data[2:3]},
+        {"title": "Ля минор", "chords": data[3:]},
+    ])
+    groups = group_chord_output(build_chord_output(chords.values(*CHORD_OUTPUT_VALUES)))
+
+    assert dump_chord_groups(groups) == expected
+
+
+@pytest.mark.django_db
+def test_unpacked_chords_fall_back_to_position_rows() -> None:
+    chord = Chord.objects.create(title="Am", musical_title="A minor")
+    for string_number in (3, 1, 2):
+        ChordPositionFactory.create(chord=chord, string_number=string_number)
+    Chord.objects.create(title="Em", musical_title="E minor")
+    chords = get_all_chords()
+
+    expected = _render_with_drf(ChordOutputSerializer(chords, many=True).data)
+    rows = chords.values(*CHORD_OUTPUT_VALUES)
+
+    assert dump_chord_list(build_chord_output(rows)) == expected
+
+
+def test_empty_list() -> None:
+    assert dump_chord_list(build_chord_output([])) == b"[]"
+
+
+def test_renderer_passes_rendered_json_through() -> None:
+    content = RenderedJSON(b'{"a":1}')
+
+    assert ChordJSONRenderer().render(content) == b'{"a":1}'
+
+
+def test_renderer_renders_plain_data() -> None:
+    assert ChordJSONRenderer().render({"a": 1}) == b'{"a":1}'
@@ -0,0 +1,226 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import io
+import json
+from pathlib import Path
+from typing import Any, Self
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connections
+from pytest_django import DjangoAssertNumQueries
+from pytest_mock import MockerFixture
+
+from apps.chords.api.export import export_chords
+from apps.chords.api.imports import read_import_batches
+from apps.chords.models import Chord, ChordPosition
+from apps.chords.services import ChordImportDict, ChordImportService
+from apps.chords.tests.factories import FullChordFactory
+
+AM_POSITIONS = [
+    {"string_number": 1, "fret": 0, "finger": 0},
+    {"string_number": 2, "fret": 1, "finger": 1},
+    {"string_number": 3, "fret": 2, "finger": 3},
+    {"string_number": 4, "fret": 2, "finger": 2},
+    {"string_number": 5, "fret": 0, "finger": 0},
+    {"string_number": 6, "fret": -1, "finger": 0},
+]
+AM = {
+    "title": "Am",
+    "musical_title": "A minor",
+    "order_in_note": 1,
+    "start_fret": 1,
+    "has_barre": False,
+    "positions": AM_POSITIONS,
+}
+CSV_HEADER = "id,title,musical_title,order_in_note,start_fret,has_barre,positions\n"
+
+
+def _import_dicts(count: int) -> list[ChordImportDict]:
+    return [
+        {
+            "chord_fields": {
+                "title": "Am",
+                "musical_title": "A minor",
+                "order_in_note": i,
+                "start_fret": 1,
+                "has_barre": False,
+            },
+            "positions": AM_POSITIONS,  # type: ignore[typeddict-item]
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def test_read_ndjson_batches() -> None:
+    duplicate = {**AM, "positions": [AM_POSITIONS[0]] * 6}
+    lines = [json.dumps(AM), "", "{not json", json.dumps(duplicate), json.dumps(AM)]
+
+    batches = list(read_import_batches(lines, "ndjson", batch_size=2))
+
+    assert len(batches) == 2
+    assert [len(batch["chords"]) for batch in batches] == [1, 1]
+    first = batches[0]["chords"][0]
+    assert first["chord_fields"]["musical_title"] == "A minor"
+    assert first["positions"][5] == {"string_number": 6, "fret": -1, "finger": 0}
+    errors = batches[0]["errors"] + batches[1]["errors"]
+    assert [error["line"] for error in errors] == [3, 4]
+    assert errors[0]["errors"] == {"detail": ["Invalid JSON."]}
+    assert errors[1]["errors"]["positions"] == [
+        "Duplicate string numbers are not allowed."
+    ]
+
+
+def test_read_csv_batches() -> None:
+    lines = io.StringIO(
+        CSV_HEADER
+        + "7,Am,A minor,1,1,false,1002113234225006x0\n"
+        + "8,C,C major,1,1,true,1z0\n"
+        + ",E,E major,1,1,maybe,100201\n"
+    )
+
+    (batch,) = read_import_batches(lines, "csv")
+
+    assert batch["chords"][0]["chord_fields"] == {
+        "title": "Am",
+        "musical_title": "A minor",
+        "order_in_note": 1,
+        "start_fret": 1,
+        "has_barre": False,
+    }
+    assert len(batch["chords"][0]["positions"]) == 6
+    assert batch["errors"][0] == {
+        "line": 3,
+        "errors": {"positions": ["Invalid packed positions."]},
+    }
+    assert batch["errors"][1]["line"] == 4
+    assert set(batch["errors"][1]["errors"]) == {"has_barre", "positions"}
+
+
+@pytest.mark.django_db
+def test_import_chords_with_bulk_create(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    with django_assert_num_queries(4):
+        created = ChordImportService.import_chords(chords=_import_dicts(20))
+
+    assert created == 20
+    chord = Chord.objects.get(order_in_note=7)
+    assert chord.packed_positions == "1002113234225006x0"
+    assert chord.shape == "x02210"
+    assert ChordPosition.objects.filter(chord=chord).count() == 6
+
+
+@pytest.mark.django_db
+def test_import_nothing(django_assert_num_queries: DjangoAssertNumQueries) -> None:
+    with django_assert_num_queries(2):
+        assert ChordImportService.import_chords(chords=[]) == 0
+
+
+class _FakeCopy:
+    def __init__(self, sql: str) -> None:
+        self.sql = sql
+        self.rows: list[list[Any]] = []
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        return None
+
+    def write_row(self, row: list[Any]) -> None:
+        self.rows.append(row)
+
+
+class _FakeCursor:
+    """A psycopg 3 cursor that records COPY rows."""
+
+    def __init__(self) -> None:
+        self.copies: list[_FakeCopy] = []
+        self.count = 0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        return None
+
+    def execute(self, sql: str, params: list[Any] | None = None) -> None:
+        if "nextval" in sql:
+            assert params is not None
+            self.count = params[1]
+
+    def fetchall(self) -> list[tuple[int]]:
+        return [(100 + i,) for i in range(self.count)]
+
+    def copy(self, sql: str) -> _FakeCopy:
+        self.copies.append(_FakeCopy(sql))
+        return self.copies[-1]
+
+
+@pytest.mark.django_db
+def test_import_chords_with_copy_on_postgres(mocker: MockerFixture) -> None:
+    connection = connections["default"]
+    cursor = _FakeCursor()
+    mocker.patch.object(connection, "vendor", "postgresql")
+    mocker.patch.object(connection, "cursor", return_value=cursor)
+
+    created = ChordImportService.import_chords(chords=_import_dicts(2))
+
+    assert created == 2
+    chords, positions = cursor.copies
+    assert chords.sql.startswith('COPY "chords_chord" ("id", "title", "musical_title"')
+    assert [row[:2] for row in chords.rows] == [[100, "Am"], [101, "Am"]]
+    assert "1002113234225006x0" in chords.rows[0]
+    assert positions.sql.startswith('COPY "chords_chordposition" ("chord_id",')
+    assert len(positions.rows) == 12
+    assert positions.rows[6][0] == 101
+    mocker.stopall()
+    assert not Chord.objects.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("export_format", "suffix"), [("ndjson", "ndjson"), ("csv", "csv")]
+)
+def test_import_command_loads_an_export(
+    chord_factory: type[FullChordFactory],
+    tmp_path: Path,
+    export_format: str,
+    suffix: str,
+) -> None:
+    exported = chord_factory.create_batch(3)
+    path = tmp_path / f"chords.{suffix}"
+    path.write_bytes(b"".join(export_chords(export_format)))  # type: ignore[arg-type]
+    Chord.objects.all().delete()
+    stdout = io.StringIO()
+
+    call_command("import_chords", str(path), "--batch-size", "2", stdout=stdout)
+
+    fields = ("title", "musical_title", "order_in_note", "packed_positions")
+    imported = set(Chord.objects.values_list(*fields))
+    assert imported == {tuple(getattr(chord, f) for f in fields) for chord in exported}
+    assert ChordPosition.objects.count() == 18
+    assert "Imported 3 chords in" in stdout.getvalue()
+    assert "bulk_create), rejected 0 lines." in stdout.getvalue()
+
+
+@pytest.mark.django_db
+def test_import_command_reports_invalid_lines(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    mocker.patch("sys.stdin", io.StringIO(json.dumps(AM) + "\n[]\n"))
+    stdout, stderr = io.StringIO(), io.StringIO()
+
+    call_command("import_chords", "-", stdout=stdout, stderr=stderr)
+
+    assert Chord.objects.count() == 1
+    assert stderr.getvalue().startswith("Line 2: ")
+    assert "rejected 1 lines." in stdout.getvalue()
+
+
+def test_import_command_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(CommandError, match="Cannot open"):
+        call_command("import_chords", str(tmp_path / "missing.csv"))
@@ -2,12 +2,14 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+from datetime import UTC, datetime
+
 import pytest
 from django.core.exceptions import ValidationError
 from django.db.utils import IntegrityError
 
 from apps.chords.constants import MAX_FINGER, MAX_STRING_NUMBER
-from apps.chords.models import Chord, ChordPosition
+from apps.chords.models import Chord, ChordPosition, ChordTombstone
 from apps.chords.tests.factories import ChordFactory, ChordPositionFactory
 
 
@@ -97,3 +99,11 @@ def test_chord_position_str(chord_position: ChordPosition) -> None:
     assert f"String #{chord_position.string_number}" in result
     assert f"fret {chord_position.fret}" in result
     assert f"finger {chord_position.finger}" in result
+
+
+def test_chord_tombstone_str() -> None:
+    tombstone = ChordTombstone(
+        chord_id=7, deleted_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+    )
+
+    assert str(tombstone) == "Chord #7 deleted at 2026-01-02 03:04:05+00:00"
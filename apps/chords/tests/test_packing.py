@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+
+from apps.chords.constants import MAX_FRET, MIN_FRET
+from apps.chords.packing import (
+    PackedPositionDict,
+    decode_fret,
+    encode_fret,
+    pack_positions,
+    unpack_positions,
+)
+
+A_MINOR: list[PackedPositionDict] = [
+    {"string_number": 1, "fret": 0, "finger": 0},
+    {"string_number": 2, "fret": 1, "finger": 1},
+    {"string_number": 3, "fret": 2, "finger": 3},
+    {"string_number": 4, "fret": 2, "finger": 2},
+    {"string_number": 5, "fret": 0, "finger": 0},
+    {"string_number": 6, "fret": -1, "finger": 0},
+]
+
+
+@pytest.mark.parametrize(
+    "fret, code", [(-1, "x"), (0, "0"), (9, "9"), (10, "a"), (12, "c")]
+)
+def test_fret_codes(fret: int, code: str) -> None:
+    assert encode_fret(fret) == code
+    assert decode_fret(code) == fret
+
+
+def test_all_frets_round_trip() -> None:
+    for fret in range(MIN_FRET, MAX_FRET + 1):
+        assert decode_fret(encode_fret(fret)) == fret
+
+
+@pytest.mark.parametrize("fret", [MIN_FRET - 1, MAX_FRET + 1])
+def test_encode_fret_out_of_range(fret: int) -> None:
+    with pytest.raises(ValueError, match="out of range"):
+        encode_fret(fret)
+
+
+@pytest.mark.parametrize("code", ["z", "", "10"])
+def test_decode_unknown_fret_code(code: str) -> None:
+    with pytest.raises(ValueError, match="Unknown fret code"):
+        decode_fret(code)
+
+
+def test_pack_positions() -> None:
+    assert pack_positions(A_MINOR) == "1002113234225006x0"
+
+
+def test_pack_positions_sorts_by_string_number() -> None:
+    assert pack_positions(reversed(A_MINOR)) == pack_positions(A_MINOR)
+
+
+def test_unpack_positions_round_trip() -> None:
+    assert unpack_positions(pack_positions(A_MINOR)) == A_MINOR
+
+
+def test_partial_positions_round_trip() -> None:
+    positions = A_MINOR[:2]
+    assert unpack_positions(pack_positions(positions)) == positions
+
+
+def test_empty_positions() -> None:
+    assert not pack_positions([])
+    assert unpack_positions("") == []
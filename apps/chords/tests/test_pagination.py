@@ -0,0 +1,187 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from django.db import connection
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.chords.api.pagination import ChordKeysetPagination
+from apps.chords.models import Chord
+from apps.chords.selectors import get_all_chords
+from apps.chords.tests.factories import ChordFactory
+
+
+@pytest.fixture
+def paginator() -> ChordKeysetPagination:
+    return ChordKeysetPagination()
+
+
+@pytest.fixture
+def chords_in_db() -> list[Chord]:
+    return [
+        ChordFactory.create(title="Am", order_in_note=1),
+        ChordFactory.create(title="Am", order_in_note=1),
+        ChordFactory.create(title="Am", order_in_note=2),
+        ChordFactory.create(title="C", order_in_note=1),
+        ChordFactory.create(title="Dm", order_in_note=3),
+    ]
+
+
+def make_request(factory: APIRequestFactory, **params: str) -> Request:
+    return Request(factory.get("/chords/", params))
+
+
+@pytest.mark.django_db
+def test_paginate_queryset_is_opt_in(
+    paginator: ChordKeysetPagination,
+    api_request_factory: APIRequestFactory,
+) -> None:
+    request = make_request(api_request_factory)
+
+    assert paginator.paginate_queryset(get_all_chords(), request) is None
+
+
+@pytest.mark.django_db
+def test_paginate_queryset_walks_all_pages_in_order(
+    paginator: ChordKeysetPagination,
+    api_request_factory: APIRequestFactory,
+    chords_in_db: list[Chord],
+) -> None:
+    seen: list[Chord] = []
+    params = {"page_size": "2"}
+    while True:
+        page = paginator.paginate_queryset(
+            get_all_chords(), make_request(api_request_factory, **params)
+        )
+        assert page is not None
+        seen.extend(page)
+        if paginator.next_cursor is None:
+            break
+        params["cursor"] = paginator.encode_cursor(paginator.next_cursor)
+
+    assert seen == list(get_all_chords())
+    assert len(seen) == len(chords_in_db)
+
+
+@pytest.mark.django_db
+def test_next_link_contains_cursor(
+    paginator: ChordKeysetPagination,
+    api_request_factory: APIRequestFactory,
+    chords_in_db: list[Chord],
+) -> None:
+    request = make_request(api_request_factory, page_size="4")
+
+    paginator.paginate_queryset(get_all_chords(), request)
+    response = paginator.get_paginated_response([])
+
+    assert paginator.next_cursor is not None
+    assert response.data["next"].startswith("http://testserver/chords/?")
+    assert "cursor=" in response.data["next"]
+
+
+@pytest.mark.django_db
+def test_next_link_is_none_on_last_page(
+    paginator: ChordKeysetPagination,
+    api_request_factory: APIRequestFactory,
+    chords_in_db: list[Chord],
+) -> None:
+    request = make_request(api_request_factory, page_size="10")
+
+    page = paginator.paginate_queryset(get_all_chords(), request)
+
+    assert page is not None
+    assert len(page) == len(chords_in_db)
+    assert paginator.get_next_link() is None
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("5", 5), ("0", 100), ("-1", 100), ("abc", 100), ("100000", 500)],
+)
+def test_get_page_size(
+    paginator: ChordKeysetPagination,
+    api_request_factory: APIRequestFactory,
+    value: str,
+    expected: int,
+) -> None:
+    request = make_request(api_request_factory, page_size=value)
+
+    assert paginator.get_page_size(request) == expected
+
+
+@pytest.mark.parametrize("cursor", ["!!!", "bm90LWpzb24=", "WzEsMiwzXQ=="])
+def test_decode_invalid_cursor(
+    paginator: ChordKeysetPagination,
+    api_request_factory: APIRequestFactory,
+    cursor: str,
+) -> None:
+    request = make_request(api_request_factory, cursor=cursor)
+
+    with pytest.raises(NotFound):
+        paginator.decode_cursor(request)
+
+
+def test_cursor_round_trip(
+    paginator: ChordKeysetPagination,
+    api_request_factory: APIRequestFactory,
+) -> None:
+    cursor = paginator.encode_cursor(("Ля минор", 2, 10))
+    request = make_request(api_request_factory, cursor=cursor)
+
+    assert paginator.decode_cursor(request) == ("Ля минор", 2, 10)
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    connection.vendor != "sqlite",
+    reason="PostgreSQL may scan small tables sequentially",
+)
+def test_filter_after_cursor_starts_index_range_scan() -> None:
+    queryset = ChordKeysetPagination.filter_after_cursor(get_all_chords(), ("Am", 1, 3))
+
+    plan = queryset.explain()
+
+    assert "chord_keyset_idx (title>?)" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.django_db
+def test_filter_after_cursor_ands_sargable_title_bound() -> None:
+    queryset = ChordKeysetPagination.filter_after_cursor(get_all_chords(), ("Am", 1, 3))
+
+    where = str(queryset.query).split(" WHERE ", 1)[1]
+
+    assert where.startswith('("chords_chord"."title" >= Am AND (')
+
+
+def test_paginate_queryset_needs_a_queryset(
+    paginator: ChordKeysetPagination,
+    api_request_factory: APIRequestFactory,
+) -> None:
+    request = make_request(api_request_factory, page_size="2")
+
+    with pytest.raises(TypeError):
+        paginator.paginate_queryset([], request)
+
+
+@pytest.mark.django_db
+def test_paginate_values_rows(
+    paginator: ChordKeysetPagination,
+    api_request_factory: APIRequestFactory,
+    chords_in_db: list[Chord],
+) -> None:
+    rows = get_all_chords().values("id", "title", "order_in_note")
+    request = make_request(api_request_factory, page_size="2")
+
+    page = paginator.paginate_queryset(rows, request)
+
+    assert page is not None
+    assert paginator.next_cursor == (page[-1]["title"], 1, page[-1]["id"])
+
+
+def test_get_row_cursor_rejects_other_rows() -> None:
+    with pytest.raises(TypeError):
+        ChordKeysetPagination.get_row_cursor(("Am", 1, 1))
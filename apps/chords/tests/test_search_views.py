@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.chords.constants import MAX_SEARCH_RESULTS
+from apps.chords.tests.factories import FullChordFactory
+
+SEARCH_URL = "/api/v1/data/chords/search/"
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+@pytest.mark.django_db
+def test_search(api_client: APIClient) -> None:
+    am = FullChordFactory.create(title="Am", musical_title="A minor")
+    FullChordFactory.create(title="A", musical_title="A major")
+    FullChordFactory.create(title="G", musical_title="G major")
+
+    response = api_client.get(SEARCH_URL, {"q": "a mnor"})
+
+    data = response.json()
+    assert response.status_code == status.HTTP_200_OK
+    assert [chord["title"] for chord in data] == ["Am", "A"]
+    assert data[0]["id"] == am.pk
+    assert data[0]["score"] == 0.5
+    assert len(data[0]["positions"]) == 6
+
+
+@pytest.mark.django_db
+def test_search_limit(api_client: APIClient) -> None:
+    FullChordFactory.create_batch(3, title="Am", musical_title="A minor")
+
+    response = api_client.get(SEARCH_URL, {"q": "Am", "limit": "2"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("params", "field"),
+    [
+        ({}, "q"),
+        ({"q": " "}, "q"),
+        ({"q": "Am", "limit": str(MAX_SEARCH_RESULTS + 1)}, "limit"),
+    ],
+)
+def test_search_invalid(
+    api_client: APIClient, params: dict[str, str], field: str
+) -> None:
+    response = api_client.get(SEARCH_URL, params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert field in response.json()
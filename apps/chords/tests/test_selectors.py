@@ -3,11 +3,34 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 
+from datetime import timedelta
+
 import pytest
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection, connections
+from django.db.models import F
+from django.utils import timezone
+from pytest_mock import MockerFixture
 
-from apps.chords.models import Chord
-from apps.chords.selectors import get_all_chords, get_full_chord_by_id
+from apps.chords.models import Chord, ChordTombstone
+from apps.chords.packing import FRET_CODES
+from apps.chords.selectors import (
+    get_all_chords,
+    get_chord_columns,
+    get_chord_diagram_spec,
+    get_chord_diagram_specs,
+    get_chord_frets_by_ids,
+    get_chord_validators,
+    get_chords_by_ids,
+    get_chords_by_note,
+    get_chords_by_shape,
+    get_chords_by_titles,
+    get_chords_changed_since,
+    get_deleted_chord_ids_since,
+    get_full_chord_by_id,
+    search_chords,
+)
+from apps.chords.services import ChordService
 from apps.chords.tests.factories import FullChordFactory
 
 
@@ -61,3 +84,276 @@ def test_get_chords_with_positions_returns_all_chords(
 
     for chord in qs:
         assert chord.positions.count() == 6
+
+
+def test_get_chord_columns() -> None:
+    assert get_chord_columns(["has_barre", "positions", "id"]) == (
+        "id",
+        "title",
+        "order_in_note",
+        "has_barre",
+        "packed_positions",
+    )
+
+
+@pytest.mark.django_db
+def test_get_all_chords_loads_only_requested_columns(
+    multiple_chords_in_db: tuple[Chord, Chord, Chord],
+) -> None:
+    chords = list(get_all_chords(fields=["has_barre"]))
+
+    assert [c.title for c in chords] == ["Am", "Bm", "F"]
+    assert chords[0].get_deferred_fields() >= {"musical_title", "packed_positions"}
+
+
+@pytest.mark.django_db
+def test_get_chords_by_note(chord_factory: type[FullChordFactory]) -> None:
+    second = chord_factory.create(title="Am", order_in_note=2)
+    first = chord_factory.create(title="Am", order_in_note=1)
+    chord_factory.create(title="C", order_in_note=1)
+
+    chords = get_chords_by_note(title="Am")
+
+    assert list(chords) == [first, second]
+    assert [c.title for c in get_chords_by_note()] == ["Am", "Am", "C"]
+
+
+@pytest.mark.django_db
+def test_get_chords_by_ids_keeps_order(chord_factory: type[FullChordFactory]) -> None:
+    first, second, third = chord_factory.create_batch(3)
+
+    chords = get_chords_by_ids(chord_ids=[third.pk, 999_999, first.pk, second.pk])
+
+    assert list(chords) == [third, first, second]
+
+
+@pytest.mark.django_db
+def test_get_chords_by_titles_keeps_order(
+    chord_factory: type[FullChordFactory],
+) -> None:
+    am_second = chord_factory.create(title="Am", order_in_note=2)
+    am_first = chord_factory.create(title="Am", order_in_note=1)
+    g = chord_factory.create(title="G", order_in_note=1)
+    chord_factory.create(title="C", order_in_note=1)
+
+    chords = get_chords_by_titles(titles=["G", "H", "Am"])
+
+    assert list(chords) == [g, am_first, am_second]
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    connection.vendor != "sqlite",
+    reason="PostgreSQL may scan small tables sequentially",
+)
+def test_get_chords_by_note_uses_keyset_index() -> None:
+    plan = get_chords_by_note(title="Am").explain()
+
+    assert "chord_keyset_idx" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.django_db
+def test_get_chord_validators(chord_factory: type[FullChordFactory]) -> None:
+    chord_instance = chord_factory.create()
+
+    revision, updated_at = get_chord_validators(chord_id=chord_instance.pk)
+
+    assert revision == 1
+    assert updated_at == chord_instance.updated_at
+
+
+@pytest.mark.django_db
+def test_get_chord_validators_not_found() -> None:
+    with pytest.raises(ObjectDoesNotExist):
+        get_chord_validators(chord_id=999)
+
+
+@pytest.mark.django_db
+def test_get_chord_diagram_spec(chord_factory: type[FullChordFactory]) -> None:
+    chord_instance = chord_factory.create(start_fret=3, has_barre=True)
+
+    spec, updated_at = get_chord_diagram_spec(chord_id=chord_instance.pk)
+
+    assert spec == (3, True, chord_instance.packed_positions)
+    assert updated_at == chord_instance.updated_at
+
+
+@pytest.mark.django_db
+def test_get_chord_diagram_spec_packs_position_rows(
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord_instance = chord_factory.create()
+    packed = chord_instance.packed_positions
+    Chord.objects.filter(pk=chord_instance.pk).update(packed_positions="")
+
+    spec, _ = get_chord_diagram_spec(chord_id=chord_instance.pk)
+
+    assert spec.packed_positions == packed
+
+
+@pytest.mark.django_db
+def test_get_chord_diagram_spec_not_found() -> None:
+    with pytest.raises(ObjectDoesNotExist):
+        get_chord_diagram_spec(chord_id=999)
+
+
+@pytest.mark.django_db
+def test_get_chord_diagram_specs(chord_factory: type[FullChordFactory]) -> None:
+    am = chord_factory.create(title="Am", order_in_note=2)
+    am_first = chord_factory.create(title="Am", order_in_note=1)
+    c = chord_factory.create(title="C")
+    packed = c.packed_positions
+    Chord.objects.filter(pk=c.pk).update(packed_positions="")
+
+    specs = get_chord_diagram_specs()
+    note_specs = get_chord_diagram_specs(title="Am")
+
+    assert [(chord_id, title) for chord_id, title, _ in specs] == [
+        (am_first.pk, "Am"),
+        (am.pk, "Am"),
+        (c.pk, "C"),
+    ]
+    assert specs[0][2] == (
+        am_first.start_fret,
+        am_first.has_barre,
+        am_first.packed_positions,
+    )
+    assert specs[2][2].packed_positions == packed
+    assert note_specs == specs[:2]
+
+
+@pytest.mark.django_db
+def test_get_chord_frets_by_ids(chord_factory: type[FullChordFactory]) -> None:
+    chord_instance = chord_factory.create()
+    incomplete = chord_factory.create()
+    Chord.objects.filter(pk=incomplete.pk).update(shape="")
+
+    frets = get_chord_frets_by_ids(chord_ids=[chord_instance.pk, incomplete.pk, 999])
+
+    assert list(frets) == [chord_instance.pk]
+    assert "".join(FRET_CODES[f + 1] for f in frets[chord_instance.pk]) == (
+        chord_instance.shape
+    )
+
+
+def _create_chord_with_shape(title: str, shape: str) -> Chord:
+    frets = [-1 if code == "x" else int(code, 16) for code in reversed(shape)]
+    return ChordService.create_chord(
+        positions=[
+            {"string_number": i, "fret": fret, "finger": 0}
+            for i, fret in enumerate(frets, start=1)
+        ],
+        chord_fields={
+            "title": title,
+            "musical_title": title,
+            "order_in_note": 1,
+            "start_fret": 1,
+            "has_barre": False,
+        },
+    )
+
+
+@pytest.fixture
+def shaped_chords() -> None:
+    _create_chord_with_shape("Am", "x02210")
+    _create_chord_with_shape("C", "x32010")
+    _create_chord_with_shape("E", "022100")
+    _create_chord_with_shape("Bm", "x24432")
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("shaped_chords")
+@pytest.mark.parametrize(
+    ("pattern", "titles"),
+    [
+        ("x02210", ["Am"]),
+        ("x02211", []),
+        ("x?2?10", ["Am", "C"]),
+        ("?????0", ["Am", "C", "E"]),
+        ("x2????", ["Bm"]),
+    ],
+)
+def test_get_chords_by_shape(pattern: str, titles: list[str]) -> None:
+    chords = get_chords_by_shape(pattern=pattern)
+
+    assert [chord.title for chord in chords] == titles
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("pattern", ["x02210", "x0221?", "x0???0"])
+def test_get_chords_by_shape_does_not_join(pattern: str) -> None:
+    sql = str(get_chords_by_shape(pattern=pattern).query)
+
+    assert "JOIN" not in sql
+    assert '"shape"' in sql
+
+
+@pytest.fixture
+def titled_chords(chord_factory: type[FullChordFactory]) -> None:
+    chord_factory.create(title="Am", musical_title="A minor")
+    chord_factory.create(title="A", musical_title="A major")
+    chord_factory.create(title="Cmaj7", musical_title="C major seventh")
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("titled_chords")
+@pytest.mark.parametrize(
+    ("query", "titles"),
+    [
+        ("A minor", ["Am", "A"]),
+        ("A mnor", ["Am", "A"]),
+        ("Cmaj", ["Cmaj7"]),
+        ("Dm", []),
+    ],
+)
+def test_search_chords(query: str, titles: list[str]) -> None:
+    chords = search_chords(query=query)
+
+    assert [chord.title for chord in chords] == titles
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("titled_chords")
+def test_search_chords_ranks_by_similarity() -> None:
+    ranks = list(
+        search_chords(query="A minor").values_list(F("search_rank"), flat=True)
+    )
+
+    assert ranks == [1.0, pytest.approx(1 / 3)]
+
+
+@pytest.mark.django_db
+def test_search_chords_uses_trigram_operators_on_postgres(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(connections["default"], "vendor", "postgresql")
+
+    sql = str(search_chords(query="Am").query)
+
+    assert "SIMILARITY(" in sql
+    assert '"title" %' in sql
+
+
+@pytest.mark.django_db
+def test_get_chords_changed_since(chord_factory: type[FullChordFactory]) -> None:
+    old = chord_factory.create(title="Am")
+    new = chord_factory.create(title="Em")
+    since = timezone.now() - timedelta(minutes=5)
+    Chord.objects.filter(pk=old.pk).update(updated_at=since - timedelta(seconds=1))
+
+    assert list(get_chords_changed_since(since=since)) == [new]
+    assert list(get_chords_changed_since(since=None)) == [old, new]
+
+
+@pytest.mark.django_db
+def test_get_deleted_chord_ids_since() -> None:
+    now = timezone.now()
+    ChordTombstone.objects.create(chord_id=1, deleted_at=now - timedelta(hours=1))
+    ChordTombstone.objects.create(chord_id=3, deleted_at=now)
+    ChordTombstone.objects.create(chord_id=2, deleted_at=now + timedelta(seconds=1))
+    ChordTombstone.objects.create(chord_id=3, deleted_at=now + timedelta(seconds=2))
+
+    since = now - timedelta(minutes=1)
+
+    assert get_deleted_chord_ids_since(since=since) == [3, 2]
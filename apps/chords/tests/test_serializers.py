@@ -5,6 +5,7 @@
 from typing import Any
 
 import pytest
+from pytest_django import DjangoAssertNumQueries
 from rest_framework.serializers import ValidationError
 
 from apps.chords.api.serializers import (
@@ -15,6 +16,7 @@ from apps.chords.api.serializers import (
 from apps.chords.constants import (
     MAX_FINGER,
     MAX_FRET,
+    MAX_START_FRET,
     MAX_STRING_NUMBER,
     MIN_FINGER,
     MIN_FRET,
@@ -218,6 +220,23 @@ def test_chord_create_serializer_missing_required_field(
     assert "title" in serializer.errors
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("start_fret", "is_valid"), [(MAX_START_FRET, True), (MAX_START_FRET + 1, False)]
+)
+def test_chord_create_serializer_start_fret_fits_binary_format(
+    valid_chord_data: dict[str, Any],
+    start_fret: int,
+    is_valid: bool,
+) -> None:
+    serializer = ChordCreateUpdateSerializer(
+        data={**valid_chord_data, "start_fret": start_fret}
+    )
+
+    assert serializer.is_valid() is is_valid
+    assert ("start_fret" in serializer.errors) is not is_valid
+
+
 # --- ТЕСТЫ СЕРИАЛИЗАТОРА ВЫВОДА (OUTPUT) ---
 
 
@@ -234,3 +253,27 @@ def test_chord_output_serializer_read(db_chord_instance: Chord) -> None:
     assert data["has_barre"] is False
     assert "positions" in data
     assert len(data["positions"]) == 6
+
+
+@pytest.mark.django_db
+def test_chord_output_serializer_reads_packed_positions(
+    db_chord_instance: Chord,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    expected = ChordPositionSerializer(
+        db_chord_instance.positions.all(), many=True
+    ).data
+
+    with django_assert_num_queries(0):
+        data = ChordOutputSerializer(db_chord_instance).data
+
+    assert data["positions"] == expected
+
+
+@pytest.mark.django_db
+def test_chord_output_serializer_falls_back_to_position_rows(chord: Chord) -> None:
+    ChordPosition.objects.create(chord=chord, string_number=1, fret=2, finger=3)
+
+    data = ChordOutputSerializer(chord).data
+
+    assert data["positions"] == [{"string_number": 1, "fret": 2, "finger": 3}]
@@ -2,13 +2,36 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
-import pytest
+from datetime import timedelta
 
-from apps.chords.models import Chord, ChordPosition
-from apps.chords.services import ChordCreateDict, ChordPositionCreateDict, ChordService
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from pytest_django import DjangoAssertNumQueries, DjangoCaptureOnCommitCallbacks
+
+from apps.chords.catalog import get_catalog_version
+from apps.chords.models import Chord, ChordPosition, ChordTombstone
+from apps.chords.packing import pack_positions, unpack_positions
+from apps.chords.services import (
+    ChordBulkOperationDict,
+    ChordBulkService,
+    ChordCreateDict,
+    ChordPositionCreateDict,
+    ChordService,
+)
 from apps.chords.tests.factories import FullChordFactory
 
 
+def _statements(context: CaptureQueriesContext) -> list[str]:
+    """Get the SQL of the captured queries without the savepoints."""
+    return [
+        query["sql"]
+        for query in context.captured_queries
+        if "SAVEPOINT" not in query["sql"]
+    ]
+
+
 @pytest.mark.django_db
 def test_create_chord_success() -> None:
     chord_fields: ChordCreateDict = {
@@ -137,30 +160,56 @@ def test_update_chord_fail_when_not_enough_positions(
 @pytest.mark.django_db
 def test_delete_chord(chord_factory: type[FullChordFactory]) -> None:
     chord = chord_factory.create()
+    chord_id = chord.pk
 
-    ChordService.delete_chord(chord=chord)
+    with CaptureQueriesContext(connection) as context:
+        deleted = ChordService.delete_chord(chord_id=chord_id)
 
+    assert deleted is True
+    assert [sql.split()[0] for sql in _statements(context)] == [
+        "SELECT",
+        "DELETE",
+        "DELETE",
+        "INSERT",
+    ]
+    assert _statements(context)[0].startswith('SELECT "chords_chord"."id" FROM')
     assert Chord.objects.count() == 0
     assert ChordPosition.objects.count() == 0
+    tombstone = ChordTombstone.objects.get()
+    assert tombstone.chord_id == chord_id
+
+
+@pytest.mark.django_db
+def test_delete_chord_not_found() -> None:
+    deleted = ChordService.delete_chord(chord_id=999_999)
+
+    assert deleted is False
+    assert not ChordTombstone.objects.exists()
 
 
 @pytest.mark.django_db
-def test_delete_chord_with_none_pk(chord_factory: type[FullChordFactory]) -> None:
-    chord = chord_factory.build()
+def test_prune_tombstones() -> None:
+    now = timezone.now()
+    ChordTombstone.objects.create(chord_id=1, deleted_at=now - timedelta(days=2))
+    kept = ChordTombstone.objects.create(chord_id=2, deleted_at=now)
+
+    deleted = ChordService.prune_tombstones(before=now - timedelta(days=1))
 
-    ChordService.delete_chord(chord=chord)
+    assert deleted == 1
+    assert list(ChordTombstone.objects.all()) == [kept]
 
 
 @pytest.mark.django_db
-def test_replace_positions_creates_positions(chord: Chord) -> None:
+def test_sync_positions_creates_positions(chord: Chord) -> None:
     positions_data: list[ChordPositionCreateDict] = [
         {"string_number": 1, "fret": 0, "finger": 0},
         {"string_number": 2, "fret": 1, "finger": 1},
         {"string_number": 3, "fret": 2, "finger": 2},
     ]
 
-    ChordService._replace_positions(chord, positions_data)
+    changed = ChordService._sync_positions(chord, positions_data)
 
+    assert changed is True
     positions = list(chord.positions.all())
     assert len(positions) == 3
 
@@ -171,23 +220,20 @@ def test_replace_positions_creates_positions(chord: Chord) -> None:
 
 
 @pytest.mark.django_db
-def test_replace_positions_replaces_existing(chord: Chord) -> None:
+def test_sync_positions_updates_rows_in_place(chord: Chord) -> None:
     old_positions = [
         ChordPosition.objects.create(chord=chord, string_number=i, fret=i, finger=i)
         for i in range(1, 4)
     ]
     new_positions_data: list[ChordPositionCreateDict] = [
-        {"string_number": 1, "fret": 0, "finger": 0},
-        {"string_number": 2, "fret": 1, "finger": 1},
+        {"string_number": 1, "fret": 1, "finger": 1},
+        {"string_number": 2, "fret": 0, "finger": 0},
     ]
 
-    ChordService._replace_positions(chord, new_positions_data)
-
-    for old in old_positions:
-        assert not ChordPosition.objects.filter(pk=old.pk).exists()
+    ChordService._sync_positions(chord, new_positions_data)
 
     positions = list(chord.positions.all())
-    assert len(positions) == len(new_positions_data)
+    assert [pos.pk for pos in positions] == [p.pk for p in old_positions[:2]]
     for data, pos in zip(new_positions_data, positions, strict=True):
         assert pos.string_number == data["string_number"]
         assert pos.fret == data["fret"]
@@ -195,10 +241,351 @@ def test_replace_positions_replaces_existing(chord: Chord) -> None:
 
 
 @pytest.mark.django_db
-def test_replace_positions_empty_list(chord: Chord) -> None:
+def test_sync_positions_empty_list(chord: Chord) -> None:
     for i in range(1, 4):
         ChordPosition.objects.create(chord=chord, string_number=i, fret=i, finger=i)
 
-    ChordService._replace_positions(chord, [])
+    ChordService._sync_positions(chord, [])
 
     assert chord.positions.count() == 0
+
+
+@pytest.mark.django_db
+def test_sync_positions_recreates_missing_rows(chord: Chord) -> None:
+    chord.packed_positions = "100"
+
+    changed = ChordService._sync_positions(
+        chord, [{"string_number": 1, "fret": 2, "finger": 3}]
+    )
+
+    assert changed is True
+    assert list(chord.positions.values_list("fret", "finger")) == [(2, 3)]
+
+
+@pytest.mark.django_db
+def test_update_chord_writes_only_changed_position(
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord = chord_factory.create()
+    positions = unpack_positions(chord.packed_positions)
+    position_ids = set(chord.positions.values_list("pk", flat=True))
+    positions[0]["fret"] = 7 if positions[0]["fret"] != 7 else 8
+
+    with CaptureQueriesContext(connection) as context:
+        ChordService.update_chord(chord=chord, data={"positions": positions})
+
+    # The changed position, the changed columns and the new revision.
+    statements = _statements(context)
+    assert [sql.split()[0] for sql in statements] == ["UPDATE", "UPDATE", "SELECT"]
+    assert '"title"' not in statements[1]
+
+    assert set(chord.positions.values_list("pk", flat=True)) == position_ids
+    first = chord.positions.get(string_number=positions[0]["string_number"])
+    assert first.fret == positions[0]["fret"]
+    chord.refresh_from_db()
+    assert chord.revision == 2
+    assert chord.packed_positions == pack_positions(positions)
+
+
+@pytest.mark.django_db
+def test_update_chord_saves_only_dirty_fields(
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord = chord_factory.create(title="Am", musical_title="A minor")
+    Chord.objects.filter(pk=chord.pk).update(musical_title="Changed elsewhere")
+
+    ChordService.update_chord(
+        chord=chord, data={"title": "Am7", "musical_title": "A minor"}
+    )
+
+    chord.refresh_from_db()
+    assert chord.title == "Am7"
+    assert chord.musical_title == "Changed elsewhere"
+
+
+@pytest.mark.django_db
+def test_update_chord_without_changes_writes_nothing(
+    chord_factory: type[FullChordFactory],
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    chord = chord_factory.create()
+    positions = unpack_positions(chord.packed_positions)
+    data = {"title": chord.title, "has_barre": chord.has_barre, "positions": positions}
+
+    with (
+        CaptureQueriesContext(connection) as context,
+        django_capture_on_commit_callbacks() as callbacks,
+    ):
+        ChordService.update_chord(chord=chord, data=data)
+
+    assert _statements(context) == []
+    assert callbacks == []
+    chord.refresh_from_db()
+    assert chord.revision == 1
+
+
+@pytest.mark.django_db
+def test_create_chord_bumps_catalog_version_on_commit(
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    version = get_catalog_version()
+    chord_fields: ChordCreateDict = {
+        "title": "Am",
+        "musical_title": "A minor",
+        "order_in_note": 1,
+        "start_fret": 1,
+        "has_barre": False,
+    }
+    positions: list[ChordPositionCreateDict] = [
+        {"string_number": i, "fret": 0, "finger": 0} for i in range(1, 7)
+    ]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ChordService.create_chord(positions=positions, chord_fields=chord_fields)
+
+    assert get_catalog_version() != version
+
+
+@pytest.mark.django_db
+def test_update_chord_bumps_catalog_version_on_commit(
+    chord_factory: type[FullChordFactory],
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    chord = chord_factory.create()
+    version = get_catalog_version()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ChordService.update_chord(chord=chord, data={"title": "G"})
+
+    assert get_catalog_version() != version
+
+
+@pytest.mark.django_db
+def test_delete_chord_bumps_catalog_version_on_commit(
+    chord_factory: type[FullChordFactory],
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    chord = chord_factory.create()
+    version = get_catalog_version()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ChordService.delete_chord(chord_id=chord.pk)
+
+    assert get_catalog_version() != version
+
+
+@pytest.mark.django_db
+def test_update_chord_increments_revision(
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord = chord_factory.create()
+
+    ChordService.update_chord(chord=chord, data={"title": "G"})
+    ChordService.update_chord(chord=chord, data={"title": "G7"})
+
+    assert chord.revision == 3
+    chord.refresh_from_db()
+    assert chord.revision == 3
+
+
+@pytest.mark.django_db
+def test_create_chord_packs_positions() -> None:
+    chord_fields: ChordCreateDict = {
+        "title": "Am",
+        "musical_title": "A minor",
+        "order_in_note": 1,
+        "start_fret": 1,
+        "has_barre": False,
+    }
+    positions: list[ChordPositionCreateDict] = [
+        {"string_number": i, "fret": i - 1, "finger": 0} for i in range(6, 0, -1)
+    ]
+
+    chord = ChordService.create_chord(positions=positions, chord_fields=chord_fields)
+
+    chord.refresh_from_db()
+    assert chord.packed_positions == "100210320430540650"
+    assert chord.shape == "543210"
+
+
+@pytest.mark.django_db
+def test_refresh_packed_positions(chord: Chord) -> None:
+    ChordPosition.objects.create(chord=chord, string_number=2, fret=3, finger=4)
+    ChordPosition.objects.create(chord=chord, string_number=1, fret=-1, finger=0)
+
+    ChordService.refresh_packed_positions(chord=chord)
+
+    assert chord.packed_positions == "1x0234"
+    chord.refresh_from_db()
+    assert chord.packed_positions == "1x0234"
+
+
+def _upsert(
+    line: int,
+    title: str,
+    *,
+    chord_id: int | None = None,
+    order_in_note: int = 1,
+    fret: int = 0,
+) -> ChordBulkOperationDict:
+    return {
+        "line": line,
+        "op": "upsert",
+        "id": chord_id,
+        "title": title,
+        "order_in_note": order_in_note,
+        "chord_fields": {
+            "title": title,
+            "musical_title": title,
+            "order_in_note": order_in_note,
+            "start_fret": 1,
+            "has_barre": False,
+        },
+        "positions": [
+            {"string_number": i, "fret": fret, "finger": 0} for i in range(1, 7)
+        ],
+    }
+
+
+def _delete(
+    line: int,
+    *,
+    chord_id: int | None = None,
+    title: str | None = None,
+    order_in_note: int | None = None,
+) -> ChordBulkOperationDict:
+    return {
+        "line": line,
+        "op": "delete",
+        "id": chord_id,
+        "title": title,
+        "order_in_note": order_in_note,
+        "chord_fields": None,
+        "positions": None,
+    }
+
+
+@pytest.mark.django_db
+def test_bulk_creates_chords_with_positions(
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    version = get_catalog_version()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        results = ChordBulkService.apply_batch(
+            operations=[_upsert(1, "Am"), _upsert(2, "Em")]
+        )
+
+    chords = {chord.title: chord for chord in Chord.objects.all()}
+    assert results == [
+        {"line": 1, "status": "created", "id": chords["Am"].pk},
+        {"line": 2, "status": "created", "id": chords["Em"].pk},
+    ]
+    assert ChordPosition.objects.count() == 12
+    assert chords["Am"].packed_positions == "100200300400500600"
+    assert chords["Am"].shape == "000000"
+    assert get_catalog_version() != version
+
+
+@pytest.mark.django_db
+def test_bulk_updates_by_id_and_by_key(chord_factory: type[FullChordFactory]) -> None:
+    by_id = chord_factory.create(title="Am", order_in_note=1)
+    by_key = chord_factory.create(title="Em", order_in_note=2)
+
+    results = ChordBulkService.apply_batch(
+        operations=[
+            _upsert(1, "Am7", chord_id=by_id.pk, fret=1),
+            _upsert(2, "Em", order_in_note=2, fret=2),
+        ]
+    )
+
+    assert [r["status"] for r in results] == ["updated", "updated"]
+    by_id.refresh_from_db()
+    by_key.refresh_from_db()
+    assert by_id.title == "Am7"
+    assert by_id.revision == 2
+    assert by_id.packed_positions == "110210310410510610"
+    assert by_key.packed_positions == "120220320420520620"
+    assert by_key.shape == "222222"
+    assert list(by_key.positions.values_list("fret", flat=True)) == [2] * 6
+    assert ChordPosition.objects.count() == 12
+
+
+@pytest.mark.django_db
+def test_bulk_deletes_by_id_and_by_key(chord_factory: type[FullChordFactory]) -> None:
+    first = chord_factory.create(title="Am", order_in_note=1)
+    chord_factory.create(title="Em", order_in_note=2)
+
+    results = ChordBulkService.apply_batch(
+        operations=[
+            _delete(1, chord_id=first.pk),
+            _delete(2, title="Em", order_in_note=2),
+        ]
+    )
+
+    assert [r["status"] for r in results] == ["deleted", "deleted"]
+    assert not Chord.objects.exists()
+    assert not ChordPosition.objects.exists()
+    assert ChordTombstone.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_bulk_reports_errors(chord_factory: type[FullChordFactory]) -> None:
+    chord = chord_factory.create(title="Am", order_in_note=1)
+    chord_factory.create(title="Dm", order_in_note=1)
+    chord_factory.create(title="Dm", order_in_note=1)
+
+    results = ChordBulkService.apply_batch(
+        operations=[
+            _upsert(1, "Am", chord_id=chord.pk),
+            _delete(2, chord_id=chord.pk),
+            _delete(3, chord_id=chord.pk + 100),
+            _upsert(4, "Em", chord_id=chord.pk + 100),
+            _upsert(5, "Dm"),
+            {**_upsert(6, "Gm"), "positions": None},
+        ]
+    )
+
+    assert results[0]["status"] == "updated"
+    assert [r.get("errors") for r in results[1:]] == [
+        {"detail": ["The chord is already changed by line 1."]},
+        {"detail": ["Chord not found."]},
+        {"detail": ["Chord not found."]},
+        {"detail": ["Several chords match the key."]},
+        {"detail": ["Chord data is missing."]},
+    ]
+    assert Chord.objects.count() == 3
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("size", [1, 20])
+def test_bulk_query_count_does_not_depend_on_size(
+    chord_factory: type[FullChordFactory],
+    django_assert_num_queries: DjangoAssertNumQueries,
+    size: int,
+) -> None:
+    chords = chord_factory.create_batch(size)
+    operations = [
+        _upsert(i, f"new-{i}", chord_id=chord.pk) for i, chord in enumerate(chords)
+    ]
+    operations += [_upsert(size + i, f"created-{i}") for i in range(size)]
+
+    # select, bulk update, positions delete, bulk create, positions bulk create,
+    # and the savepoint queries of the transaction
+    with django_assert_num_queries(7):
+        ChordBulkService.apply_batch(operations=operations)
+
+
+@pytest.mark.django_db
+def test_bulk_empty_batch_does_nothing(
+    django_assert_num_queries: DjangoAssertNumQueries,
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    # only the savepoint queries of the transaction
+    with (
+        django_capture_on_commit_callbacks() as callbacks,
+        django_assert_num_queries(2),
+    ):
+        assert ChordBulkService.apply_batch(operations=[]) == []
+
+    assert callbacks == []
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import re
+
+import pytest
+
+from apps.chords.shapes import (
+    MAX_SHAPE_EXPANSIONS,
+    expand_shape_pattern,
+    frets_from_shape,
+    normalize_shape_pattern,
+    shape_from_packed,
+    shape_pattern_to_regex,
+)
+
+
+def test_shape_from_packed_orders_from_sixth_string() -> None:
+    assert shape_from_packed("1002113224235006x0") == "x02210"
+
+
+def test_shape_from_packed_with_missing_string() -> None:
+    assert not shape_from_packed("100211322423500")
+
+
+def test_frets_from_shape() -> None:
+    assert frets_from_shape("x0221c") == [-1, 0, 2, 2, 1, 12]
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("x02210", "x02210"),
+        (" X02210 ", "x02210"),
+        ("x0*2.?", "x0?2??"),
+        ("8aAcC8", "8aacc8"),
+    ],
+)
+def test_normalize_shape_pattern(pattern: str, expected: str) -> None:
+    assert normalize_shape_pattern(pattern) == expected
+
+
+@pytest.mark.parametrize(
+    ("pattern", "message"),
+    [
+        ("x0221", "Shape must have 6 characters."),
+        ("x022100", "Shape must have 6 characters."),
+        ("x0221d", "Unknown shape characters: d."),
+    ],
+)
+def test_normalize_shape_pattern_rejects(pattern: str, message: str) -> None:
+    with pytest.raises(ValueError, match=re.escape(message)):
+        normalize_shape_pattern(pattern)
+
+
+def test_expand_shape_pattern() -> None:
+    shapes = expand_shape_pattern("x0221?")
+
+    assert shapes is not None
+    assert len(shapes) == 14
+    assert shapes[0] == "x0221x"
+    assert shapes[-1] == "x0221c"
+
+
+def test_expand_shape_pattern_without_wildcards() -> None:
+    assert expand_shape_pattern("x02210") == ["x02210"]
+
+
+def test_expand_shape_pattern_too_many() -> None:
+    assert MAX_SHAPE_EXPANSIONS < 14**3
+    assert expand_shape_pattern("x0???0") is None
+
+
+def test_shape_pattern_to_regex() -> None:
+    regex = shape_pattern_to_regex("x0??10")
+
+    assert regex == "^x0..10$"
+    assert re.match(regex, "x02210")
+    assert not re.match(regex, "002210")
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from unittest.mock import patch
+
+import pytest
+from pytest_django import DjangoAssertNumQueries, DjangoCaptureOnCommitCallbacks
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.chords.api.views import DIAGRAM_IMMUTABLE_CACHE_CONTROL
+from apps.chords.diagrams import DiagramBusyError
+from apps.chords.models import Chord
+from apps.chords.services import ChordService
+from apps.chords.sprites import SPRITE_SHEET_CHORDS
+from apps.chords.tests.factories import FullChordFactory
+
+SPRITES_URL = "/api/v1/data/chords/sprites/"
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+@pytest.mark.django_db
+def test_sprites(api_client: APIClient) -> None:
+    chords = FullChordFactory.create_batch(3, title="Am")
+    FullChordFactory.create(title="C")
+
+    response = api_client.get(SPRITES_URL, {"title": "Am"})
+
+    data = response.json()
+    assert response.status_code == status.HTTP_200_OK
+    assert data["format"] == "png"
+    assert sorted(c["id"] for c in data["chords"]) == sorted(c.pk for c in chords)
+    sheet = api_client.get(data["sheets"][0]["url"])
+    assert sheet.status_code == status.HTTP_200_OK
+    assert sheet["Content-Type"] == "image/png"
+    assert sheet["Cache-Control"] == DIAGRAM_IMMUTABLE_CACHE_CONTROL
+    assert sheet.content.startswith(b"\x89PNG")
+
+
+@pytest.mark.django_db
+def test_sprites_webp_in_several_sheets(api_client: APIClient) -> None:
+    FullChordFactory.create_batch(SPRITE_SHEET_CHORDS + 1, title="Am")
+
+    data = api_client.get(SPRITES_URL, {"image_format": "webp"}).json()
+
+    assert len(data["sheets"]) == 2
+    assert data["sheets"][1]["url"].endswith(".webp/")
+    sheet = api_client.get(data["sheets"][1]["url"])
+    assert sheet["Content-Type"] == "image/webp"
+
+
+@pytest.mark.django_db
+def test_sprites_are_rebuilt_after_change(
+    api_client: APIClient,
+    chord: Chord,
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    first = api_client.get(SPRITES_URL)
+    not_modified = api_client.get(SPRITES_URL, HTTP_IF_NONE_MATCH=first["ETag"])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ChordService.update_chord(
+            chord=chord, data={"start_fret": chord.start_fret + 1}
+        )
+    second = api_client.get(SPRITES_URL, HTTP_IF_NONE_MATCH=first["ETag"])
+
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert second.status_code == status.HTTP_200_OK
+    assert second.json()["sheets"][0]["key"] != first.json()["sheets"][0]["key"]
+
+
+@pytest.mark.django_db
+def test_sprites_manifest_is_cached_per_catalog_version(
+    api_client: APIClient,
+    chord: Chord,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    first = api_client.get(SPRITES_URL).json()
+
+    with django_assert_num_queries(0):
+        cached = api_client.get(SPRITES_URL).json()
+    with django_capture_on_commit_callbacks(execute=True):
+        ChordService.delete_chord(chord_id=chord.pk)
+    changed = api_client.get(SPRITES_URL).json()
+
+    assert cached == first
+    assert changed["chords"] == []
+
+
+@pytest.mark.django_db
+def test_sprites_manifest_renders_nothing(api_client: APIClient) -> None:
+    FullChordFactory.create_batch(3, title="Am")
+
+    with patch("apps.chords.sprites.run_in_render_pool") as render:
+        response = api_client.get(SPRITES_URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    render.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_sprite_sheet_busy(api_client: APIClient, chord: Chord) -> None:
+    url = api_client.get(SPRITES_URL).json()["sheets"][0]["url"]
+
+    with patch(
+        "apps.chords.api.sprite_views.get_sprite_sheet",
+        side_effect=DiagramBusyError("Diagram renderers are busy."),
+    ):
+        response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response["Retry-After"] == "1"
+    assert response.json() == {"detail": "Diagram renderers are busy."}
+
+
+@pytest.mark.django_db
+def test_sprites_rejects_bad_format(api_client: APIClient) -> None:
+    response = api_client.get(SPRITES_URL, {"image_format": "gif"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_sprite_sheet_not_modified(api_client: APIClient, chord: Chord) -> None:
+    url = api_client.get(SPRITES_URL).json()["sheets"][0]["url"]
+    etag = api_client.get(url)["ETag"]
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response["Cache-Control"] == DIAGRAM_IMMUTABLE_CACHE_CONTROL
+
+
+@pytest.mark.django_db
+def test_sprite_sheet_not_found_is_rendered_as_json(api_client: APIClient) -> None:
+    response = api_client.get(f"{SPRITES_URL}{'0' * 32}.webp/")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"detail": "Sprite sheet not found."}
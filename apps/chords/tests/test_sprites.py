@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import io
+import stat
+from pathlib import Path
+
+from PIL import Image
+from pytest_django import Settings
+from pytest_mock import MockerFixture
+
+from apps.chords import sprites
+from apps.chords.diagrams import (
+    DIAGRAM_FILE_MODE,
+    DiagramSpec,
+    get_diagram,
+    get_png_size,
+    render_png,
+)
+from apps.chords.sprites import (
+    SPRITE_COLUMNS,
+    SPRITE_SHEET_CHORDS,
+    get_sprite_key,
+    get_sprite_path,
+    get_sprite_sheet,
+    layout_sprites,
+    prune_sprite_sheets,
+)
+
+AM = DiagramSpec(start_fret=1, has_barre=False, packed_positions="1002113234225006x0")
+F = DiagramSpec(start_fret=1, has_barre=True, packed_positions="111212323433521611")
+WIDE = DiagramSpec(start_fret=1, has_barre=False, packed_positions="1002113234725006x0")
+
+
+def _chords(
+    count: int, start_fret: int = 1, title: str = "Am", first_id: int = 1
+) -> list[tuple[int, str, DiagramSpec]]:
+    specs = (AM, F)
+    return [
+        (i, title, specs[i % 2]._replace(start_fret=start_fret))
+        for i in range(first_id, first_id + count)
+    ]
+
+
+def test_sprite_key_depends_on_format_and_diagrams() -> None:
+    keys = {
+        get_sprite_key("png", [AM, F]),
+        get_sprite_key("webp", [AM, F]),
+        get_sprite_key("png", [F, AM]),
+        get_sprite_key("png", [AM]),
+    }
+
+    assert len(keys) == 4
+
+
+def test_manifest_lays_out_chords_in_rows() -> None:
+    chords = _chords(SPRITE_COLUMNS + 2, start_fret=7)
+    width, height = get_png_size(AM)
+
+    manifest = layout_sprites("png", chords).manifest
+
+    assert manifest["scale"] == 2
+    assert manifest["sheets"][0]["width"] == SPRITE_COLUMNS * width
+    assert manifest["sheets"][0]["height"] == 2 * height
+    last = manifest["chords"][-1]
+    assert last == {
+        "id": SPRITE_COLUMNS + 2,
+        "sheet": 0,
+        "x": width,
+        "y": height,
+        "width": width,
+        "height": height,
+    }
+
+
+def test_layout_renders_nothing(mocker: MockerFixture) -> None:
+    render = mocker.patch.object(sprites, "run_in_render_pool")
+
+    layout = layout_sprites("png", _chords(3, start_fret=14))
+
+    render.assert_not_called()
+    assert not get_sprite_path(layout.manifest["sheets"][0]["key"], "png").exists()
+
+
+def test_sheet_holds_the_diagrams() -> None:
+    layout = layout_sprites("png", [(1, "Am", WIDE), (2, "Am", AM)])
+    sheet_info = layout.manifest["sheets"][0]
+
+    content = get_sprite_sheet("png", layout.sheets[sheet_info["key"]])
+
+    assert get_sprite_path(sheet_info["key"], "png").read_bytes() == content
+    with (
+        Image.open(io.BytesIO(content)) as sheet,
+        Image.open(io.BytesIO(render_png(AM))) as am,
+    ):
+        assert sheet.size == (sheet_info["width"], sheet_info["height"])
+        frame = layout.manifest["chords"][1]
+        assert frame["height"] < sheet.height
+        box = (frame["x"], frame["y"], frame["x"] + am.width, frame["y"] + am.height)
+        assert sheet.crop(box).tobytes() == am.tobytes()
+
+
+def test_sheet_is_built_in_one_render_job(mocker: MockerFixture) -> None:
+    cached = AM._replace(start_fret=16)
+    get_diagram("png", cached)
+    layout = layout_sprites("webp", [*_chords(4, start_fret=15), (9, "Am", cached)])
+    pool = mocker.spy(sprites, "run_in_render_pool")
+    render = mocker.spy(sprites, "render_png")
+
+    content = get_sprite_sheet("webp", next(iter(layout.sheets.values())))
+
+    pool.assert_called_once()
+    assert render.call_count == 4
+    with Image.open(io.BytesIO(content)) as sheet:
+        assert sheet.format == "WEBP"
+
+
+def test_sheet_on_disk_is_not_built_again(mocker: MockerFixture) -> None:
+    sheet = next(iter(layout_sprites("png", _chords(2, start_fret=13)).sheets.values()))
+    content = get_sprite_sheet("png", sheet)
+    pool = mocker.spy(sprites, "run_in_render_pool")
+
+    assert get_sprite_sheet("png", sheet) == content
+    pool.assert_not_called()
+
+
+def test_sheet_files_are_readable_by_everyone() -> None:
+    sheet = next(iter(layout_sprites("png", _chords(2, start_fret=14)).sheets.values()))
+    get_sprite_sheet("png", sheet)
+
+    mode = stat.S_IMODE(get_sprite_path(sheet.key, "png").stat().st_mode)
+
+    assert mode == DIAGRAM_FILE_MODE
+
+
+def test_prune_sprite_sheets(settings: Settings, tmp_path: Path) -> None:
+    settings.CHORD_DIAGRAM_ROOT = tmp_path
+    (old,) = layout_sprites("png", _chords(2, start_fret=1)).sheets
+    (new,) = layout_sprites("webp", _chords(2, start_fret=2)).sheets
+    (tmp_path / "sprites").mkdir()
+    get_sprite_path(old, "png").write_bytes(b"")
+    get_sprite_path(new, "webp").write_bytes(b"")
+
+    deleted = prune_sprite_sheets([new])
+
+    assert deleted == 1
+    assert not get_sprite_path(old, "png").exists()
+    assert get_sprite_path(new, "webp").exists()
+
+
+def test_manifest_splits_sheets_of_a_note() -> None:
+    chords = _chords(SPRITE_SHEET_CHORDS + 1, start_fret=8)
+
+    manifest = layout_sprites("webp", chords).manifest
+
+    assert len(manifest["sheets"]) == 2
+    assert [c["sheet"] for c in manifest["chords"][-2:]] == [0, 1]
+    assert manifest["chords"][-1]["x"] == 0
+
+
+def test_notes_do_not_share_sheets() -> None:
+    chords = [*_chords(2, title="Am"), *_chords(2, title="C", first_id=3)]
+
+    manifest = layout_sprites("png", chords).manifest
+
+    assert [c["sheet"] for c in manifest["chords"]] == [0, 0, 1, 1]
+
+
+def test_insert_changes_only_the_sheets_of_its_note() -> None:
+    am = _chords(3, title="Am")
+    c = _chords(3, title="C", first_id=10)
+    first = layout_sprites("png", [*am, *c]).manifest
+
+    second = layout_sprites("png", [*am[:1], (20, "Am", WIDE), *am[1:], *c]).manifest
+
+    assert second["sheets"][0]["key"] != first["sheets"][0]["key"]
+    assert second["sheets"][1] == first["sheets"][1]
+
+
+def test_change_rebuilds_only_its_sheet(mocker: MockerFixture) -> None:
+    chords = _chords(SPRITE_SHEET_CHORDS + 1, start_fret=9)
+    first = layout_sprites("png", chords)
+    for sheet in first.sheets.values():
+        get_sprite_sheet("png", sheet)
+    render = mocker.spy(sprites, "render_png")
+    changed = [*chords[:-1], (chords[-1][0], "Am", AM._replace(start_fret=10))]
+
+    second = layout_sprites("png", changed)
+    for sheet in second.sheets.values():
+        get_sprite_sheet("png", sheet)
+
+    assert second.manifest["sheets"][0] == first.manifest["sheets"][0]
+    assert second.manifest["sheets"][1]["key"] != first.manifest["sheets"][1]["key"]
+    render.assert_called_once()
+
+
+def test_insert_in_a_large_note_shifts_its_later_sheets() -> None:
+    am = _chords(SPRITE_SHEET_CHORDS + 1)
+    first = layout_sprites("png", am).manifest
+
+    second = layout_sprites("png", [(100, "Am", WIDE), *am]).manifest
+
+    assert len(second["sheets"]) == len(first["sheets"])
+    assert all(
+        new["key"] != old["key"]
+        for new, old in zip(second["sheets"], first["sheets"], strict=True)
+    )
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import base64
+import io
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.chords.models import ChordTombstone
+from apps.chords.sync import (
+    SYNC_TOMBSTONE_RETENTION,
+    decode_sync_token,
+    encode_sync_token,
+    get_sync_horizon,
+)
+
+
+def test_sync_token_round_trip() -> None:
+    synced_at = datetime(2026, 5, 1, 12, 30, 15, 123456, tzinfo=UTC)
+
+    assert decode_sync_token(encode_sync_token(synced_at)) == synced_at
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not base64!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        base64.urlsafe_b64encode(b"[1]").decode(),
+        base64.urlsafe_b64encode(b'{"v":2,"t":1}').decode(),
+        base64.urlsafe_b64encode(b'{"v":1,"t":"x"}').decode(),
+        "тест",
+    ],
+)
+def test_decode_invalid_sync_token(token: str) -> None:
+    with pytest.raises(ValueError, match="Invalid sync token"):
+        decode_sync_token(token)
+
+
+def test_sync_horizon() -> None:
+    now = datetime(2026, 5, 1, tzinfo=UTC)
+
+    assert get_sync_horizon(now) == now - SYNC_TOMBSTONE_RETENTION
+
+
+@pytest.mark.django_db
+def test_prune_chord_tombstones_command() -> None:
+    horizon = get_sync_horizon(timezone.now())
+    ChordTombstone.objects.create(chord_id=1, deleted_at=horizon - timedelta(minutes=1))
+    kept = ChordTombstone.objects.create(
+        chord_id=2, deleted_at=horizon + timedelta(minutes=1)
+    )
+    stdout = io.StringIO()
+
+    call_command("prune_chord_tombstones", stdout=stdout)
+
+    assert stdout.getvalue() == "Deleted 1 tombstones.\n"
+    assert list(ChordTombstone.objects.all()) == [kept]
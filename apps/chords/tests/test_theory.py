@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+
+from apps.chords.theory import identify_chord, identify_chords, parse_chord_name
+
+
+@pytest.mark.parametrize(
+    ("frets", "name"),
+    [
+        ([-1, 0, 2, 2, 1, 0], "Am"),
+        ([-1, 3, 2, 0, 1, 0], "C"),
+        ([3, 2, 0, 0, 0, 3], "G"),
+        ([0, 2, 2, 1, 0, 0], "E"),
+        ([1, 3, 3, 2, 1, 1], "F"),
+        ([-1, 2, 4, 4, 3, 2], "Bm"),
+        ([-1, 0, 2, 0, 2, 0], "A7"),
+        ([-1, -1, 0, 2, 1, 2], "D7"),
+        ([-1, 0, 2, 1, 2, 0], "Amaj7"),
+        ([-1, 0, 2, 0, 1, 0], "Am7"),
+        ([-1, 0, 2, 2, 3, 0], "Asus4"),
+        ([-1, -1, 0, 2, 3, 0], "Dsus2"),
+        ([3, 5, 5, -1, -1, -1], "G5"),
+        ([-1, 3, 4, 2, 4, -1], "Cdim7"),
+    ],
+)
+def test_identify_common_shapes(frets: list[int], name: str) -> None:
+    assert identify_chord(frets)[0]["name"] == name
+
+
+@pytest.mark.parametrize(
+    ("semitones", "names"),
+    [(2, ["Bm", "D6/B"]), (-10, ["Bm", "D6/B"]), (-1, ["G#m", "B6/G#"])],
+)
+def test_identify_transposed(semitones: int, names: list[str]) -> None:
+    matches = identify_chord([-1, 0, 2, 2, 1, 0], semitones)
+
+    assert [match["name"] for match in matches] == names
+
+
+def test_identify_ranks_root_position_first() -> None:
+    matches = identify_chord([-1, 0, 2, 2, 1, 0])
+
+    assert matches[0] == {"name": "Am", "root": "A", "quality": "minor", "bass": "A"}
+    assert matches[1] == {
+        "name": "C6/A",
+        "root": "C",
+        "quality": "major sixth",
+        "bass": "A",
+    }
+
+
+def test_identify_inversion() -> None:
+    assert identify_chord([0, 3, 2, 0, 1, 0])[0]["name"] == "C/E"
+
+
+def test_identify_uses_the_lowest_note_as_bass() -> None:
+    # the sixth string at the 12th fret (E3) is higher than the open D string
+    assert identify_chord([12, -1, 0, 2, 3, 2])[0]["name"] == "Dadd9"
+
+
+def test_identify_seventh_without_fifth() -> None:
+    matches = identify_chord([-1, 3, 2, 3, -1, -1])
+
+    assert matches[0]["name"] == "C7"
+
+
+@pytest.mark.parametrize(
+    "frets",
+    [[-1] * 6, [-1, -1, -1, -1, -1, 0], [0, 1, 2, 3, 4, 5]],
+)
+def test_identify_unknown(frets: list[int]) -> None:
+    assert identify_chord(frets) == []
+
+
+def test_identify_requires_six_frets() -> None:
+    with pytest.raises(ValueError, match="Expected 6 frets, got 5"):
+        identify_chord([0, 2, 2, 1, 0])
+
+
+def test_identify_chords_keeps_order() -> None:
+    results = identify_chords([[3, 2, 0, 0, 0, 3], [0, 2, 2, 1, 0, 0]])
+
+    assert [matches[0]["name"] for matches in results] == ["G", "E"]
+
+
+@pytest.mark.parametrize(
+    ("name", "root", "suffix"),
+    [("Am", 9, "m"), ("Bb", 10, ""), ("C#m7", 1, "m7"), ("G7", 7, "7")],
+)
+def test_parse_chord_name(name: str, root: int, suffix: str) -> None:
+    parsed_root, quality = parse_chord_name(name)
+
+    assert parsed_root == root
+    assert quality.suffix == suffix
+
+
+@pytest.mark.parametrize("name", ["", "H", "am", "Cx", "A#b"])
+def test_parse_unknown_chord_name(name: str) -> None:
+    with pytest.raises(ValueError, match="Unknown"):
+        parse_chord_name(name)
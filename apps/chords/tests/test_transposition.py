@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+
+from apps.chords.transposition import get_start_fret, transpose_shapes
+
+AM = [-1, 0, 2, 2, 1, 0]
+BM = [-1, 2, 4, 4, 3, 2]
+G = [3, 2, 0, 0, 0, 3]
+
+
+def _names(frets: list[int], semitones: int, capo: int = 0) -> list[str]:
+    result = transpose_shapes([frets], semitones=semitones, capo=capo)[0]
+    return [match["name"] for match in result["matches"]]
+
+
+@pytest.mark.parametrize(
+    ("frets", "semitones", "expected", "start_fret"),
+    [
+        (AM, 2, BM, 1),
+        (AM, 0, AM, 1),
+        (BM, -2, AM, 1),
+        (BM, 10, AM, 1),
+        (G, 5, [8, 7, 5, 5, 5, 8], 5),
+        (AM, 7, [-1, 7, 9, 9, 8, 7], 7),
+    ],
+)
+def test_transpose_uses_the_lowest_octave(
+    frets: list[int], semitones: int, expected: list[int], start_fret: int
+) -> None:
+    result = transpose_shapes([frets], semitones=semitones)[0]
+
+    assert result["frets"] == expected
+    assert result["start_fret"] == start_fret
+
+
+def test_transpose_names() -> None:
+    assert _names(AM, 2)[0] == "Bm"
+    assert _names(G, -3)[0] == "E"
+    assert _names(BM, 0, capo=2)[0] == "Bm"
+
+
+def test_capo_counts_frets_from_the_capo() -> None:
+    result = transpose_shapes([BM, G], semitones=0, capo=2)
+
+    assert result[0]["frets"] == AM
+    assert result[0]["matches"][0]["name"] == "Bm"
+    assert result[1]["frets"] is None
+    assert result[1]["matches"][0]["name"] == "G"
+
+
+def test_shape_that_does_not_fit() -> None:
+    result = transpose_shapes([AM], semitones=-1)[0]
+
+    assert result["frets"] is None
+    assert result["start_fret"] is None
+    assert result["matches"][0]["name"] == "G#m"
+
+
+def test_equal_shapes_are_transposed_once() -> None:
+    results = transpose_shapes([AM, G, list(AM)], semitones=3)
+
+    assert results[0] is results[2]
+    assert results[1] is not results[0]
+
+
+def test_muted_shape() -> None:
+    result = transpose_shapes([[-1] * 6], semitones=5)[0]
+
+    assert result == {"frets": [-1] * 6, "start_fret": 1, "matches": []}
+
+
+@pytest.mark.parametrize(
+    ("frets", "expected"),
+    [([-1, 0, 2, 2, 1, 0], 1), ([-1, 7, 9, 9, 8, 7], 7), ([-1] * 6, 1)],
+)
+def test_get_start_fret(frets: list[int], expected: int) -> None:
+    assert get_start_fret(frets) == expected
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from typing import Any
+
+import pytest
+from pytest_django import DjangoAssertNumQueries
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.chords.constants import MAX_TRANSPOSE_CHORDS
+from apps.chords.services import ChordService
+from apps.chords.tests.factories import FullChordFactory
+
+TRANSPOSE_URL = "/api/v1/data/chords/transpose/"
+AM = [-1, 0, 2, 2, 1, 0]
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+@pytest.mark.django_db
+def test_transpose_frets(
+    api_client: APIClient, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    with django_assert_num_queries(0):
+        response = api_client.post(
+            TRANSPOSE_URL, {"frets": [AM, AM], "semitones": 2}, format="json"
+        )
+
+    data = response.json()
+    assert response.status_code == status.HTTP_200_OK
+    assert data["semitones"] == 2
+    assert data["capo"] == 0
+    assert len(data["results"]) == 2
+    assert data["results"][0]["frets"] == [-1, 2, 4, 4, 3, 2]
+    assert data["results"][0]["matches"][0]["name"] == "Bm"
+
+
+@pytest.mark.django_db
+def test_transpose_ids_with_capo(
+    api_client: APIClient, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    chord = ChordService.create_chord(
+        positions=[
+            {"string_number": 6 - i, "fret": fret, "finger": 0}
+            for i, fret in enumerate([-1, 2, 4, 4, 3, 2])
+        ],
+        chord_fields={
+            "title": "Bm",
+            "musical_title": "B minor",
+            "order_in_note": 1,
+            "start_fret": 1,
+            "has_barre": True,
+        },
+    )
+    other = FullChordFactory.create()
+
+    with django_assert_num_queries(1):
+        response = api_client.post(
+            TRANSPOSE_URL,
+            {"ids": [chord.pk, other.pk, chord.pk], "capo": 2},
+            format="json",
+        )
+
+    results = response.json()["results"]
+    assert [r["id"] for r in results] == [chord.pk, other.pk, chord.pk]
+    assert results[0]["frets"] == AM
+    assert results[0]["matches"][0]["name"] == "Bm"
+
+
+@pytest.mark.django_db
+def test_transpose_unknown_ids(api_client: APIClient) -> None:
+    chord = FullChordFactory.create()
+
+    response = api_client.post(
+        TRANSPOSE_URL, {"ids": [chord.pk, 998, 999]}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"ids": ["Unknown chords: 998, 999."]}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {},
+        {"ids": [1], "frets": [AM]},
+        {"frets": []},
+        {"frets": [AM], "semitones": 12},
+        {"frets": [AM], "capo": 12},
+        {"frets": [AM[:5]]},
+        {"ids": [1] * (MAX_TRANSPOSE_CHORDS + 1)},
+    ],
+)
+def test_transpose_rejects_bad_input(
+    api_client: APIClient, body: dict[str, Any]
+) -> None:
+    response = api_client.post(TRANSPOSE_URL, body, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
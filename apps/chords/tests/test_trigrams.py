@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+
+from apps.chords.trigrams import get_trigrams, trigram_similarity
+
+
+def test_trigrams_of_padded_lowercase_words() -> None:
+    assert get_trigrams("Am") == {"  a", " am", "am "}
+    assert get_trigrams("A-m") == {"  a", " a ", "  m", " m "}
+    assert get_trigrams("Ля минор") >= {"  л", " ля", "ля ", "мин"}
+    assert get_trigrams(" _-") == frozenset()
+
+
+@pytest.mark.parametrize(
+    ("first", "second", "expected"),
+    [
+        ("A minor", "a minor", 1.0),
+        ("A mnor", "A minor", 0.5),
+        ("Am", "Am7", 0.4),
+        ("Am", "C", 0.0),
+        ("", "C", 0.0),
+    ],
+)
+def test_trigram_similarity(first: str, second: str, expected: float) -> None:
+    similarity = trigram_similarity(get_trigrams(first), get_trigrams(second))
+
+    assert similarity == pytest.approx(expected)
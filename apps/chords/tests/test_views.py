@@ -0,0 +1,703 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from pytest_django import DjangoAssertNumQueries, DjangoCaptureOnCommitCallbacks
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.chords.api.views import DIAGRAM_IMMUTABLE_CACHE_CONTROL, ChordViewSet
+from apps.chords.binary import decode_chords
+from apps.chords.catalog import bump_catalog_version, get_catalog_version
+from apps.chords.diagrams import DiagramBusyError
+from apps.chords.models import Chord
+from apps.chords.services import ChordService
+from apps.chords.sync import SYNC_TOMBSTONE_RETENTION, encode_sync_token
+from apps.chords.tests.factories import FullChordFactory
+
+CHORDS_URL = "/api/v1/data/chords/"
+BINARY_MEDIA_TYPE = "application/vnd.guitar0.chords+binary"
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+@pytest.mark.django_db
+def test_list_is_served_from_cache(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    chord_factory.create(title="Am")
+    first = api_client.get(CHORDS_URL)
+
+    with django_assert_num_queries(0):
+        second = api_client.get(CHORDS_URL)
+
+    assert second.status_code == status.HTTP_200_OK
+    assert second.json() == first.json()
+
+
+@pytest.mark.django_db
+def test_list_cache_is_invalidated_by_service(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    chord = chord_factory.create(title="Am")
+    api_client.get(CHORDS_URL)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ChordService.update_chord(chord=chord, data={"title": "Em"})
+    response = api_client.get(CHORDS_URL)
+
+    assert [c["title"] for c in response.json()] == ["Em"]
+
+
+@pytest.mark.django_db
+def test_list_sets_validators(api_client: APIClient) -> None:
+    response = api_client.get(CHORDS_URL)
+
+    assert response.headers["ETag"] == f'"chords-{get_catalog_version()}"'
+    assert "Last-Modified" in response.headers
+
+
+@pytest.mark.django_db
+def test_list_not_modified_for_matching_etag(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    chord_factory.create()
+    etag = api_client.get(CHORDS_URL).headers["ETag"]
+
+    with django_assert_num_queries(0):
+        response = api_client.get(CHORDS_URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+
+@pytest.mark.django_db
+def test_list_etag_changes_after_bump(api_client: APIClient) -> None:
+    etag = api_client.get(CHORDS_URL).headers["ETag"]
+    bump_catalog_version()
+
+    response = api_client.get(CHORDS_URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_retrieve_sets_validators(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord = chord_factory.create()
+
+    response = api_client.get(f"{CHORDS_URL}{chord.pk}/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] == f'"chord-{chord.pk}-{chord.revision}"'
+    assert "Last-Modified" in response.headers
+
+
+@pytest.mark.django_db
+def test_retrieve_not_modified_skips_selector(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    chord = chord_factory.create()
+    url = f"{CHORDS_URL}{chord.pk}/"
+    etag = api_client.get(url).headers["ETag"]
+
+    with django_assert_num_queries(1):
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_retrieve_etag_changes_after_update(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord = chord_factory.create()
+    url = f"{CHORDS_URL}{chord.pk}/"
+    etag = api_client.get(url).headers["ETag"]
+    ChordService.update_chord(chord=chord, data={"title": "Dm"})
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["title"] == "Dm"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("pk", ["999", "abc"])
+def test_retrieve_not_found(api_client: APIClient, pk: str) -> None:
+    response = api_client.get(f"{CHORDS_URL}{pk}/")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_list_paginated(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+) -> None:
+    for title in ("Am", "C", "Dm"):
+        chord_factory.create(title=title)
+
+    first = api_client.get(CHORDS_URL, {"page_size": 2}).json()
+    second = api_client.get(first["next"]).json()
+
+    assert [c["title"] for c in first["results"]] == ["Am", "C"]
+    assert [c["title"] for c in second["results"]] == ["Dm"]
+    assert second["next"] is None
+
+
+@pytest.mark.django_db
+def test_list_uses_single_query(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    chord_factory.create_batch(5)
+
+    with django_assert_num_queries(1):
+        response = api_client.get(CHORDS_URL)
+
+    assert len(response.json()) == 5
+    assert all(len(chord["positions"]) == 6 for chord in response.json())
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query", ["", "?page_size=2"])
+def test_fast_list_matches_serializer_list(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    monkeypatch: pytest.MonkeyPatch,
+    query: str,
+) -> None:
+    chord_factory.create_batch(3)
+    fast = api_client.get(CHORDS_URL + query)
+
+    monkeypatch.setattr(ChordViewSet, "fast_output", False)
+    regular = api_client.get(CHORDS_URL + query)
+
+    assert fast.content == regular.content
+
+
+@pytest.mark.django_db
+def test_list_with_indent_uses_serializer(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord_factory.create(title="Am")
+
+    response = api_client.get(CHORDS_URL, HTTP_ACCEPT="application/json; indent=2")
+
+    assert response.content.startswith(b'[\n  {\n    "id"')
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("fast_output", [True, False])
+@pytest.mark.parametrize("query", ["", "&page_size=2"])
+def test_list_sparse_fields(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    monkeypatch: pytest.MonkeyPatch,
+    fast_output: bool,
+    query: str,
+) -> None:
+    monkeypatch.setattr(ChordViewSet, "fast_output", fast_output)
+    chord_factory.create_batch(3)
+
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(f"{CHORDS_URL}?fields=has_barre,id,title{query}")
+
+    data = response.json()
+    chords = data["results"] if query else data
+    assert [list(chord) for chord in chords] == [["id", "title", "has_barre"]] * len(
+        chords
+    )
+    assert len(context.captured_queries) == 1
+    assert "packed_positions" not in context.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("fast_output", [True, False])
+def test_list_sparse_fields_with_positions(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    monkeypatch: pytest.MonkeyPatch,
+    fast_output: bool,
+) -> None:
+    monkeypatch.setattr(ChordViewSet, "fast_output", fast_output)
+    chord = chord_factory.create()
+    full = api_client.get(CHORDS_URL).json()[0]
+    Chord.objects.filter(pk=chord.pk).update(packed_positions="")
+
+    response = api_client.get(CHORDS_URL, {"fields": "positions,title"})
+
+    assert response.json() == [{"title": full["title"], "positions": full["positions"]}]
+
+
+@pytest.mark.django_db
+def test_retrieve_sparse_fields(
+    api_client: APIClient,
+    chord: Chord,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    url = f"{CHORDS_URL}{chord.pk}/"
+    full = api_client.get(url)
+
+    with django_assert_num_queries(2):
+        response = api_client.get(url, {"fields": "title,id"})
+
+    assert response.json() == {"id": chord.pk, "title": chord.title}
+    assert response["ETag"] != full["ETag"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("fields", ["", " , ", "title,shape"])
+def test_sparse_fields_rejects_bad_list(api_client: APIClient, fields: str) -> None:
+    response = api_client.get(CHORDS_URL, {"fields": fields})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "fields" in response.json()
+
+
+@pytest.mark.django_db
+def test_binary_ignores_sparse_fields(api_client: APIClient, chord: Chord) -> None:
+    response = api_client.get(
+        f"{CHORDS_URL}{chord.pk}/",
+        {"fields": "id", "format": "bin"},
+    )
+
+    assert decode_chords(response.content)["title"] == chord.title
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query", ["", "?page_size=2"])
+def test_binary_list_matches_json_list(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    query: str,
+) -> None:
+    chord_factory.create_batch(3)
+    json_response = api_client.get(CHORDS_URL + query)
+
+    response = api_client.get(CHORDS_URL + query, HTTP_ACCEPT=BINARY_MEDIA_TYPE)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == BINARY_MEDIA_TYPE
+    assert decode_chords(response.content) == json_response.json()
+    assert len(response.content) < len(json_response.content) / 2
+    assert response["ETag"] != json_response["ETag"]
+
+
+@pytest.mark.django_db
+def test_binary_retrieve(api_client: APIClient, chord: Chord) -> None:
+    url = f"{CHORDS_URL}{chord.pk}/"
+    json_response = api_client.get(url)
+
+    response = api_client.get(url, {"format": "bin"})
+    not_modified = api_client.get(
+        url, HTTP_ACCEPT=BINARY_MEDIA_TYPE, HTTP_IF_NONE_MATCH=response["ETag"]
+    )
+
+    assert decode_chords(response.content) == json_response.json()
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("accept", ["application/json", BINARY_MEDIA_TYPE])
+def test_negotiated_responses_vary_on_accept(
+    api_client: APIClient, chord: Chord, accept: str
+) -> None:
+    detail_url = f"{CHORDS_URL}{chord.pk}/"
+    responses = [
+        api_client.get(CHORDS_URL, HTTP_ACCEPT=accept),
+        api_client.get(detail_url, HTTP_ACCEPT=accept),
+    ]
+    responses += [
+        api_client.get(url, HTTP_ACCEPT=accept, HTTP_IF_NONE_MATCH=response["ETag"])
+        for url, response in zip([CHORDS_URL, detail_url], responses, strict=True)
+    ]
+
+    assert [r.status_code for r in responses] == [200, 200, 304, 304]
+    for response in responses:
+        assert "Accept" in response["Vary"]
+
+
+@pytest.mark.django_db
+def test_binary_errors_are_rendered_as_json(api_client: APIClient) -> None:
+    response = api_client.get(f"{CHORDS_URL}999/", HTTP_ACCEPT=BINARY_MEDIA_TYPE)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"detail": "Chord not found."}
+
+
+@pytest.mark.django_db
+def test_binary_is_not_acceptable_for_other_actions(api_client: APIClient) -> None:
+    response = api_client.post(
+        CHORDS_URL + "identify/",
+        {"frets": [[-1, 0, 2, 2, 1, 0]]},
+        format="json",
+        HTTP_ACCEPT=BINARY_MEDIA_TYPE,
+    )
+
+    assert response.status_code == status.HTTP_406_NOT_ACCEPTABLE
+    assert "detail" in response.json()
+
+
+@pytest.mark.django_db
+def test_notes(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    second = chord_factory.create(title="Am", order_in_note=2)
+    first = chord_factory.create(title="Am", order_in_note=1)
+    other = chord_factory.create(title="C", order_in_note=1)
+
+    groups = api_client.get(CHORDS_URL + "notes/").json()
+    response = api_client.get(CHORDS_URL + "notes/", {"title": "Am"})
+    with django_assert_num_queries(0):
+        cached = api_client.get(CHORDS_URL + "notes/", {"title": "Am"})
+
+    assert [(g["title"], [c["id"] for c in g["chords"]]) for g in groups] == [
+        ("Am", [first.pk, second.pk]),
+        ("C", [other.pk]),
+    ]
+    assert response.json() == groups[:1]
+    assert cached.content == response.content
+
+
+@pytest.mark.django_db
+def test_notes_not_modified_and_indented(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord_factory.create(title="Am")
+    compact = api_client.get(CHORDS_URL + "notes/")
+
+    not_modified = api_client.get(
+        CHORDS_URL + "notes/", HTTP_IF_NONE_MATCH=compact["ETag"]
+    )
+    indented = api_client.get(
+        CHORDS_URL + "notes/", HTTP_ACCEPT="application/json; indent=2"
+    )
+
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert indented.json() == compact.json()
+    assert indented.content.startswith(b'[\n  {\n    "title"')
+
+
+@pytest.mark.django_db
+def test_shape_search(api_client: APIClient) -> None:
+    chord = ChordService.create_chord(
+        positions=[
+            {"string_number": i, "fret": fret, "finger": 0}
+            for i, fret in enumerate([0, 1, 2, 2, 0, -1], start=1)
+        ],
+        chord_fields={
+            "title": "Am",
+            "musical_title": "A minor",
+            "order_in_note": 1,
+            "start_fret": 1,
+            "has_barre": False,
+        },
+    )
+
+    response = api_client.get(CHORDS_URL + "shape/", {"q": "X0*210"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [c["id"] for c in response.json()] == [chord.pk]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query", [{}, {"q": "x0221"}, {"q": "x0221z"}])
+def test_shape_search_rejects_bad_pattern(
+    api_client: APIClient, query: dict[str, str]
+) -> None:
+    response = api_client.get(CHORDS_URL + "shape/", query)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "q" in response.json()
+
+
+@pytest.mark.django_db
+def test_identify(api_client: APIClient) -> None:
+    response = api_client.post(
+        CHORDS_URL + "identify/",
+        {"frets": [[-1, 0, 2, 2, 1, 0], [-1, -1, -1, -1, -1, 0]]},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["results"]
+    assert results[0]["frets"] == [-1, 0, 2, 2, 1, 0]
+    assert results[0]["matches"][0]["name"] == "Am"
+    assert results[1]["matches"] == []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "frets",
+    [[], [[0, 2, 2, 1, 0]], [[0, 2, 2, 1, 0, 13]], [[0, 2, 2, 1, 0, 0]] * 1001],
+)
+def test_identify_rejects_bad_input(api_client: APIClient, frets: object) -> None:
+    response = api_client.post(
+        CHORDS_URL + "identify/", {"frets": frets}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_changes_full_then_delta(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("apps.chords.api.views.SYNC_TOKEN_OVERLAP", timedelta(0))
+    kept = chord_factory.create(title="Am")
+    deleted = chord_factory.create(title="Dm")
+
+    full = api_client.get(CHORDS_URL + "changes/").json()
+    assert [c["title"] for c in full["upserts"]] == ["Am", "Dm"]
+    assert full["deletes"] == []
+
+    Chord.objects.filter(pk=kept.pk).update(
+        updated_at=timezone.now() - timedelta(hours=1)
+    )
+    ChordService.update_chord(chord=deleted, data={"title": "D"})
+    deleted_id = deleted.pk
+    ChordService.delete_chord(chord_id=deleted_id)
+    added = chord_factory.create(title="Em")
+
+    delta = api_client.get(CHORDS_URL + "changes/", {"since": full["token"]}).json()
+
+    assert [c["id"] for c in delta["upserts"]] == [added.pk]
+    assert delta["upserts"][0]["positions"]
+    assert delta["deletes"] == [deleted_id]
+    assert delta["token"] != full["token"]
+
+
+@pytest.mark.django_db
+def test_changes_rejects_expired_token(api_client: APIClient) -> None:
+    expired = timezone.now() - SYNC_TOMBSTONE_RETENTION - timedelta(minutes=1)
+
+    response = api_client.get(
+        CHORDS_URL + "changes/", {"since": encode_sync_token(expired)}
+    )
+
+    assert response.status_code == status.HTTP_410_GONE
+    assert response.json() == {
+        "detail": "Sync token expired, sync again without since."
+    }
+
+
+@pytest.mark.django_db
+def test_changes_accepts_token_inside_retention(api_client: APIClient) -> None:
+    since = timezone.now() - SYNC_TOMBSTONE_RETENTION + timedelta(minutes=1)
+
+    response = api_client.get(
+        CHORDS_URL + "changes/", {"since": encode_sync_token(since)}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_changes_rejects_bad_token(api_client: APIClient) -> None:
+    response = api_client.get(CHORDS_URL + "changes/", {"since": "bad"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"since": ["Invalid sync token."]}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("fast_output", [True, False])
+def test_batch_by_ids_keeps_request_order(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    monkeypatch: pytest.MonkeyPatch,
+    fast_output: bool,
+) -> None:
+    monkeypatch.setattr(ChordViewSet, "fast_output", fast_output)
+    first, second, third = chord_factory.create_batch(3)
+    full = {c["id"]: c for c in api_client.get(CHORDS_URL).json()}
+
+    response = api_client.get(
+        CHORDS_URL + "batch/",
+        {"ids": f"{third.pk},999999,{first.pk},{third.pk},{second.pk}"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [full[third.pk], full[first.pk], full[second.pk]]
+
+
+@pytest.mark.django_db
+def test_batch_by_titles_in_two_queries(
+    api_client: APIClient,
+    chord_factory: type[FullChordFactory],
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    chord_factory.create(title="Am", order_in_note=2)
+    chord_factory.create(title="Am", order_in_note=1)
+    chord_factory.create(title="G", order_in_note=1)
+    chord_factory.create(title="C", order_in_note=1)
+    Chord.objects.filter(title="G").update(packed_positions="")
+
+    with django_assert_num_queries(2):
+        response = api_client.get(CHORDS_URL + "batch/", {"titles": "G, Am"})
+
+    chords = response.json()
+    assert [(c["title"], c["order_in_note"]) for c in chords] == [
+        ("G", 1),
+        ("Am", 1),
+        ("Am", 2),
+    ]
+    assert all(c["positions"] for c in chords)
+
+
+@pytest.mark.django_db
+def test_batch_sparse_fields_and_binary(api_client: APIClient, chord: Chord) -> None:
+    url = CHORDS_URL + "batch/"
+
+    sparse = api_client.get(url, {"ids": str(chord.pk), "fields": "title"})
+    binary = api_client.get(url, {"ids": chord.pk}, HTTP_ACCEPT=BINARY_MEDIA_TYPE)
+
+    assert sparse.json() == [{"title": chord.title}]
+    assert [c["id"] for c in decode_chords(binary.content)] == [chord.pk]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "query",
+    [
+        {},
+        {"ids": "1", "titles": "Am"},
+        {"ids": " , "},
+        {"ids": "1,a"},
+        {"ids": "0"},
+        {"ids": ",".join(str(i) for i in range(1, 102))},
+        {"titles": "A" * 51},
+    ],
+)
+def test_batch_rejects_bad_query(api_client: APIClient, query: dict[str, str]) -> None:
+    response = api_client.get(CHORDS_URL + "batch/", query)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_diagram_svg(api_client: APIClient, chord: Chord) -> None:
+    url = f"{CHORDS_URL}{chord.pk}/diagram.svg/"
+
+    response = api_client.get(url)
+
+    key = response["ETag"].strip('"')
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "image/svg+xml"
+    assert response.content.startswith(b"<svg ")
+    assert response["Cache-Control"] == "no-cache"
+    assert response["Content-Location"] == f"{url}?v={key}"
+
+
+@pytest.mark.django_db
+def test_diagram_versioned_url_is_immutable(
+    api_client: APIClient, chord: Chord
+) -> None:
+    url = f"{CHORDS_URL}{chord.pk}/diagram.svg/"
+    versioned_url = api_client.get(url)["Content-Location"]
+
+    response = api_client.get(versioned_url)
+    stale = api_client.get(f"{url}?v=stale")
+
+    assert response["Cache-Control"] == DIAGRAM_IMMUTABLE_CACHE_CONTROL
+    assert stale["Cache-Control"] == "no-cache"
+
+
+@pytest.mark.django_db
+def test_diagram_not_modified_skips_rendering(
+    api_client: APIClient, chord: Chord
+) -> None:
+    url = f"{CHORDS_URL}{chord.pk}/diagram.svg/"
+    etag = api_client.get(url)["ETag"]
+
+    with patch("apps.chords.api.views.get_diagram") as get_diagram:
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response["Cache-Control"] == "no-cache"
+    get_diagram.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_diagram_png(api_client: APIClient, chord: Chord) -> None:
+    svg = api_client.get(f"{CHORDS_URL}{chord.pk}/diagram.svg/")
+
+    response = api_client.get(f"{CHORDS_URL}{chord.pk}/diagram.png/")
+
+    assert response["Content-Type"] == "image/png"
+    assert response.content.startswith(b"\x89PNG")
+    assert response["ETag"] != svg["ETag"]
+
+
+@pytest.mark.django_db
+def test_diagram_changes_with_fingering(api_client: APIClient, chord: Chord) -> None:
+    url = f"{CHORDS_URL}{chord.pk}/diagram.svg/"
+    etag = api_client.get(url)["ETag"]
+
+    ChordService.update_chord(chord=chord, data={"start_fret": chord.start_fret + 1})
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_diagram_not_found_is_rendered_as_json(api_client: APIClient) -> None:
+    response = api_client.get(f"{CHORDS_URL}999/diagram.svg/")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"detail": "Chord not found."}
+
+
+@pytest.mark.django_db
+def test_diagram_busy(api_client: APIClient, chord: Chord) -> None:
+    with patch(
+        "apps.chords.api.views.get_diagram",
+        side_effect=DiagramBusyError("Diagram renderers are busy."),
+    ):
+        response = api_client.get(f"{CHORDS_URL}{chord.pk}/diagram.png/")
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response["Retry-After"] == "1"
+    assert response.json() == {"detail": "Diagram renderers are busy."}
+
+
+@pytest.mark.django_db
+def test_diagram_is_not_acceptable_as_json(api_client: APIClient, chord: Chord) -> None:
+    response = api_client.get(
+        f"{CHORDS_URL}{chord.pk}/diagram.svg/", HTTP_ACCEPT="application/json"
+    )
+
+    assert response.status_code == status.HTTP_406_NOT_ACCEPTABLE
+    assert "detail" in response.json()
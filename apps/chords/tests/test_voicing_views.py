@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from pytest_django import DjangoAssertNumQueries
+from rest_framework import status
+from rest_framework.test import APIClient
+
+VOICINGS_URL = "/api/v1/data/chords/voicings/"
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+@pytest.mark.django_db
+def test_voicings(
+    api_client: APIClient, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    with django_assert_num_queries(0):
+        response = api_client.get(VOICINGS_URL, {"name": "Am", "limit": "2"})
+
+    data = response.json()
+    assert response.status_code == status.HTTP_200_OK
+    assert data["name"] == "Am"
+    assert [v["shape"] for v in data["voicings"]] == ["x02210", "x0221x"]
+    assert len(data["voicings"][0]["positions"]) == 6
+
+
+@pytest.mark.django_db
+def test_voicings_constraints(api_client: APIClient) -> None:
+    response = api_client.get(
+        VOICINGS_URL, {"name": "F", "barre": "false", "max_fret": "5"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [v["shape"] for v in response.json()["voicings"]] == [
+        "10321x",
+        "xx3211",
+        "1332xx",
+        "xx321x",
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("params", "field"),
+    [
+        ({}, "name"),
+        ({"name": "H7"}, "name"),
+        ({"name": "Am", "max_stretch": "9"}, "max_stretch"),
+        ({"name": "Am", "limit": "0"}, "limit"),
+    ],
+)
+def test_voicings_invalid(
+    api_client: APIClient, params: dict[str, str], field: str
+) -> None:
+    response = api_client.get(VOICINGS_URL, params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert field in response.json()
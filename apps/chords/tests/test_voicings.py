@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+
+from apps.chords.theory import identify_chord, parse_chord_name
+from apps.chords.voicings import VoicingConstraints, _generate, generate_voicings
+
+
+def _frets(shape: str) -> list[int]:
+    return [-1 if char == "x" else int(char, 36) for char in shape]
+
+
+def test_open_voicing_first() -> None:
+    voicing = generate_voicings("Am")[0]
+
+    assert voicing == {
+        "shape": "x02210",
+        "start_fret": 1,
+        "has_barre": False,
+        "positions": [
+            {"string_number": 1, "fret": 0, "finger": 0},
+            {"string_number": 2, "fret": 1, "finger": 1},
+            {"string_number": 3, "fret": 2, "finger": 3},
+            {"string_number": 4, "fret": 2, "finger": 2},
+            {"string_number": 5, "fret": 0, "finger": 0},
+            {"string_number": 6, "fret": -1, "finger": 0},
+        ],
+    }
+
+
+@pytest.mark.parametrize("name", ["Am", "G7", "Bb", "C#m7"])
+def test_voicings_are_the_chord_in_root_position(name: str) -> None:
+    voicings = generate_voicings(name)
+
+    assert voicings
+    for voicing in voicings:
+        best = identify_chord(_frets(voicing["shape"]))[0]["name"]
+        assert parse_chord_name(best) == parse_chord_name(name)
+
+
+def test_barre_voicing() -> None:
+    voicing = generate_voicings("F")[0]
+
+    assert voicing["shape"] == "133211"
+    assert voicing["has_barre"] is True
+    fingers = [p["finger"] for p in voicing["positions"]]
+    assert fingers == [1, 1, 2, 4, 3, 1]
+
+
+def test_without_barre() -> None:
+    voicings = generate_voicings("F", VoicingConstraints(allow_barre=False))
+
+    assert voicings
+    assert not any(voicing["has_barre"] for voicing in voicings)
+    assert "133211" not in [voicing["shape"] for voicing in voicings]
+
+
+@pytest.mark.parametrize(("name", "shape"), [("E5", "022xxx"), ("A5", "x022xx")])
+def test_voicings_with_muted_treble_strings(name: str, shape: str) -> None:
+    shapes = [voicing["shape"] for voicing in generate_voicings(name)]
+
+    assert shape in shapes
+
+
+def test_constraints_limit_the_neck() -> None:
+    constraints = VoicingConstraints(max_stretch=2, max_fret=5)
+
+    voicings = generate_voicings("C", constraints)
+
+    assert voicings
+    for voicing in voicings:
+        pressed = [fret for fret in _frets(voicing["shape"]) if fret > 0]
+        assert max(pressed) <= 5
+        assert max(pressed) - min(pressed) <= 2
+
+
+def test_voicings_are_memoized() -> None:
+    _generate.cache_clear()
+
+    first = generate_voicings("Dm7")
+    second = generate_voicings("Dm7")
+
+    assert second == first
+    assert second[0] is first[0]
+    assert _generate.cache_info().hits == 1
+
+
+def test_unknown_name() -> None:
+    with pytest.raises(ValueError, match="Unknown root note"):
+        generate_voicings("H7")
@@ -0,0 +1,247 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Reverse chord identification: from frets to chord names.
+
+Every chord quality is a set of intervals above the root. The module builds
+a lookup table from pitch-class sets (12-bit masks) to the chords that
+consist of exactly those pitch classes, once at import time. Identifying a
+shape then costs six additions, a table lookup and a cached ranking by the
+bass note, with no interval analysis per request.
+"""
+
+import functools
+from collections.abc import Iterable, Sequence
+from typing import Final, NamedTuple, TypedDict
+
+from .constants import MAX_STRING_NUMBER
+
+NOTE_NAMES: Final[tuple[str, ...]] = (
+    "C",
+    "C#",
+    "D",
+    "D#",
+    "E",
+    "F",
+    "F#",
+    "G",
+    "G#",
+    "A",
+    "A#",
+    "B",
+)
+"""Names of the pitch classes, `C` is 0."""
+
+STANDARD_TUNING: Final[tuple[int, ...]] = (40, 45, 50, 55, 59, 64)
+"""MIDI notes of the open strings, from the sixth (low E) to the first."""
+
+PERFECT_FIFTH: Final[int] = 7
+"""Interval of the perfect fifth in semitones, the one most often omitted."""
+
+MIN_NOTES_TO_OMIT_FIFTH: Final[int] = 4
+"""Chords with at least this many notes are also matched without the fifth."""
+
+
+class ChordQuality(NamedTuple):
+    """Chord quality as a set of intervals above the root."""
+
+    suffix: str
+    name: str
+    intervals: tuple[int, ...]
+
+
+CHORD_QUALITIES: Final[tuple[ChordQuality, ...]] = (
+    ChordQuality("", "major", (0, 4, 7)),
+    ChordQuality("m", "minor", (0, 3, 7)),
+    ChordQuality("7", "dominant seventh", (0, 4, 7, 10)),
+    ChordQuality("m7", "minor seventh", (0, 3, 7, 10)),
+    ChordQuality("maj7", "major seventh", (0, 4, 7, 11)),
+    ChordQuality("5", "power chord", (0, 7)),
+    ChordQuality("sus4", "suspended fourth", (0, 5, 7)),
+    ChordQuality("sus2", "suspended second", (0, 2, 7)),
+    ChordQuality("6", "major sixth", (0, 4, 7, 9)),
+    ChordQuality("m6", "minor sixth", (0, 3, 7, 9)),
+    ChordQuality("add9", "added ninth", (0, 2, 4, 7)),
+    ChordQuality("madd9", "minor added ninth", (0, 2, 3, 7)),
+    ChordQuality("9", "dominant ninth", (0, 2, 4, 7, 10)),
+    ChordQuality("m9", "minor ninth", (0, 2, 3, 7, 10)),
+    ChordQuality("maj9", "major ninth", (0, 2, 4, 7, 11)),
+    ChordQuality("7sus4", "dominant seventh suspended fourth", (0, 5, 7, 10)),
+    ChordQuality("dim", "diminished", (0, 3, 6)),
+    ChordQuality("m7b5", "half-diminished seventh", (0, 3, 6, 10)),
+    ChordQuality("dim7", "diminished seventh", (0, 3, 6, 9)),
+    ChordQuality("aug", "augmented", (0, 4, 8)),
+    ChordQuality("mmaj7", "minor major seventh", (0, 3, 7, 11)),
+)
+"""Known chord qualities, the most common first (earlier ones rank higher)."""
+
+
+class ChordMatchDict(TypedDict):
+    """Describe one chord a shape was identified as."""
+
+    name: str
+    root: str
+    quality: str
+    bass: str
+
+
+class _Candidate(NamedTuple):
+    """A chord that consists of the pitch classes of a lookup table key."""
+
+    root: int
+    quality: int
+    omits_fifth: bool
+
+
+_NATURAL_NOTES: Final[frozenset[str]] = frozenset("CDEFGAB")
+_ACCIDENTALS: Final[dict[str, int]] = {"#": 1, "b": -1}
+_QUALITIES_BY_SUFFIX: Final[dict[str, ChordQuality]] = {
+    quality.suffix: quality for quality in CHORD_QUALITIES
+}
+
+
+def _build_lookup_table() -> dict[int, tuple[_Candidate, ...]]:
+    """Map every pitch-class set of a known chord to its candidates.
+
+    Chords with `MIN_NOTES_TO_OMIT_FIFTH` or more notes are also registered
+    without the perfect fifth, since guitar voicings often omit it.
+
+    Returns:
+        dict[int, tuple[_Candidate, ...]]: Candidates by pitch-class mask.
+    """
+    table: dict[int, list[_Candidate]] = {}
+    for quality_index, quality in enumerate(CHORD_QUALITIES):
+        variants = [(quality.intervals, False)]
+        has_fifth = PERFECT_FIFTH in quality.intervals
+        if has_fifth and len(quality.intervals) >= MIN_NOTES_TO_OMIT_FIFTH:
+            without_fifth = tuple(i for i in quality.intervals if i != PERFECT_FIFTH)
+            variants.append((without_fifth, True))
+        for root in range(len(NOTE_NAMES)):
+            for intervals, omits_fifth in variants:
+                mask = _to_mask((root + interval) % 12 for interval in intervals)
+                table.setdefault(mask, []).append(
+                    _Candidate(root, quality_index, omits_fifth)
+                )
+    return {mask: tuple(candidates) for mask, candidates in table.items()}
+
+
+def _to_mask(pitch_classes: Iterable[int]) -> int:
+    """Build a 12-bit mask of pitch classes."""
+    mask = 0
+    for pitch_class in pitch_classes:
+        mask |= 1 << pitch_class
+    return mask
+
+
+_LOOKUP_TABLE: Final[dict[int, tuple[_Candidate, ...]]] = _build_lookup_table()
+
+
+def parse_chord_name(name: str) -> tuple[int, ChordQuality]:
+    """Parse a chord name like `C#m7` or `Bbmaj7`.
+
+    Args:
+        name (str): Root note, with an optional `#` or `b`, followed by
+            the suffix of a quality in `CHORD_QUALITIES`.
+
+    Returns:
+        tuple[int, ChordQuality]: Pitch class of the root and the quality.
+
+    Raises:
+        ValueError: If the root or the suffix is unknown.
+    """
+    name = name.strip()
+    root_length = 2 if name[1:2] in {"#", "b"} else 1
+    root, suffix = name[:root_length], name[root_length:]
+    if root[:1] not in _NATURAL_NOTES:
+        raise ValueError(f"Unknown root note in {name!r}.")
+    pitch_class = NOTE_NAMES.index(root[0]) + _ACCIDENTALS.get(root[1:], 0)
+    quality = _QUALITIES_BY_SUFFIX.get(suffix)
+    if quality is None:
+        raise ValueError(f"Unknown chord quality {suffix!r}.")
+    return pitch_class % 12, quality
+
+
+def identify_chord(frets: Sequence[int], semitones: int = 0) -> list[ChordMatchDict]:
+    """Identify the chords a shape can be named as.
+
+    Transposing a shape moves every note by the same interval, so the
+    names of a transposed shape are found by rotating the pitch-class mask
+    and the bass, without moving the frets.
+
+    Args:
+        frets (Sequence[int]): Six frets from the sixth string to the first,
+            -1 for a muted string and 0 for an open one.
+        semitones (int): Name the shape as if it sounded this many
+            semitones higher (lower if negative).
+
+    Returns:
+        list[ChordMatchDict]: Chord names, the most likely first. Empty if
+            the shape does not form a known chord. The dicts are shared
+            between calls and must not be changed.
+
+    Raises:
+        ValueError: If there are not exactly six frets.
+    """
+    if len(frets) != MAX_STRING_NUMBER:
+        raise ValueError(f"Expected {MAX_STRING_NUMBER} frets, got {len(frets)}.")
+    mask = 0
+    bass: int | None = None
+    for open_note, fret in zip(STANDARD_TUNING, frets, strict=True):
+        if fret < 0:
+            continue
+        note = open_note + fret
+        mask |= 1 << (note % 12)
+        if bass is None or note < bass:
+            bass = note
+    if bass is None:
+        return []
+    shift = semitones % 12
+    mask = ((mask << shift) | (mask >> (12 - shift))) & 0xFFF
+    return list(_rank_candidates(mask, (bass + shift) % 12))
+
+
+def identify_chords(shapes: Iterable[Sequence[int]]) -> list[list[ChordMatchDict]]:
+    """Identify several shapes at once.
+
+    Args:
+        shapes (Iterable[Sequence[int]]): Shapes in the `identify_chord`
+            format.
+
+    Returns:
+        list[list[ChordMatchDict]]: Matches of every shape, in order.
+    """
+    return [identify_chord(frets) for frets in shapes]
+
+
+@functools.cache
+def _rank_candidates(mask: int, bass: int) -> tuple[ChordMatchDict, ...]:
+    """Rank the candidates of a pitch-class set for a bass note.
+
+    Root position chords rank above inversions, complete chords above the
+    ones without the fifth, and common qualities above rare ones.
+
+    Args:
+        mask (int): Pitch-class mask of the shape.
+        bass (int): Pitch class of the lowest note.
+
+    Returns:
+        tuple[ChordMatchDict, ...]: Ranked matches.
+    """
+    candidates = sorted(
+        _LOOKUP_TABLE.get(mask, ()),
+        key=lambda c: (c.root != bass, c.omits_fifth, c.quality),
+    )
+    matches: list[ChordMatchDict] = []
+    for candidate in candidates:
+        quality = CHORD_QUALITIES[candidate.quality]
+        name = NOTE_NAMES[candidate.root] + quality.suffix
+        if candidate.root != bass:
+            name = f"{name}/{NOTE_NAMES[bass]}"
+        matches.append({
+            "name": name,
+            "root": NOTE_NAMES[candidate.root],
+            "quality": quality.name,
+            "bass": NOTE_NAMES[bass],
+        })
+    return tuple(matches)
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Transposition of chord shapes by semitones and with a capo.
+
+A shape is moved along the neck by shifting all of its played strings by
+the same number of frets. With a capo on fret `capo`, the frets of the
+result are counted from the capo, so a shape shifted by `semitones - capo`
+frets sounds `semitones` higher. Shifts differ by octaves: the lowest one
+that keeps the shape on the neck is used.
+
+The names of a transposed shape do not depend on the shift chosen, they
+are those of the original shape rotated by `semitones` (see
+`identify_chord`). A song repeats few shapes many times, so every distinct
+shape of a batch is transposed once.
+"""
+
+from collections.abc import Sequence
+from typing import TypedDict
+
+from .constants import MAX_FRET
+from .diagrams import MIN_FRET_ROWS
+from .theory import ChordMatchDict, identify_chord
+
+
+class TransposedShapeDict(TypedDict):
+    """Describe a transposed shape.
+
+    `frets` and `start_fret` are None if the shape does not fit between
+    the capo and `MAX_FRET` in any octave.
+    """
+
+    frets: list[int] | None
+    start_fret: int | None
+    matches: list[ChordMatchDict]
+
+
+def transpose_shapes(
+    shapes: Sequence[Sequence[int]], *, semitones: int, capo: int = 0
+) -> list[TransposedShapeDict]:
+    """Transpose a batch of shapes.
+
+    Args:
+        shapes (Sequence[Sequence[int]]): Shapes in the `identify_chord`
+            format.
+        semitones (int): Interval to transpose by, in semitones.
+        capo (int): Fret of the capo, 0 for none.
+
+    Returns:
+        list[TransposedShapeDict]: Transposed shapes, in order. Equal
+            shapes share one dict, which must not be changed.
+    """
+    shift = (semitones - capo) % 12
+    transposed: dict[tuple[int, ...], TransposedShapeDict] = {}
+    results = []
+    for frets in shapes:
+        key = tuple(frets)
+        result = transposed.get(key)
+        if result is None:
+            result = _transpose_shape(key, shift, semitones, MAX_FRET - capo)
+            transposed[key] = result
+        results.append(result)
+    return results
+
+
+def get_start_fret(frets: Sequence[int]) -> int:
+    """Get the first fret a diagram of a shape should show.
+
+    Args:
+        frets (Sequence[int]): Frets of the shape.
+
+    Returns:
+        int: 1 if the shape fits in the diagram from the nut, otherwise
+            the lowest pressed fret.
+    """
+    pressed = [fret for fret in frets if fret > 0]
+    if not pressed or max(pressed) <= MIN_FRET_ROWS:
+        return 1
+    return min(pressed)
+
+
+def _transpose_shape(
+    frets: tuple[int, ...], shift: int, semitones: int, max_fret: int
+) -> TransposedShapeDict:
+    """Transpose one shape by the lowest octave of a shift that fits.
+
+    Args:
+        frets (tuple[int, ...]): Frets of the shape.
+        shift (int): Shift in frets, from 0 to 11.
+        semitones (int): Interval of the transposition, for the names.
+        max_fret (int): Highest fret the result may use.
+
+    Returns:
+        TransposedShapeDict: The transposed shape.
+    """
+    matches = identify_chord(frets, semitones)
+    played = [fret for fret in frets if fret >= 0]
+    lowest, highest = min(played, default=0), max(played, default=0)
+    for octave_shift in (shift - 12, shift):
+        if lowest + octave_shift >= 0 and highest + octave_shift <= max_fret:
+            moved = [fret + octave_shift if fret >= 0 else fret for fret in frets]
+            return {
+                "frets": moved,
+                "start_fret": get_start_fret(moved),
+                "matches": matches,
+            }
+    return {"frets": None, "start_fret": None, "matches": matches}
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Trigram similarity of strings, the way PostgreSQL `pg_trgm` computes it.
+
+On PostgreSQL the chord search runs in the database with the `pg_trgm`
+GIN indexes. Other databases, like the SQLite of development, have no
+trigram support, so the search falls back to these functions, which give
+the same scores: the text is lowercased and split into words of letters
+and digits, every word is padded with two spaces in front and one behind,
+and the similarity of two texts is the share of their trigrams they have
+in common.
+"""
+
+import re
+from typing import Final
+
+TRIGRAM_SIMILARITY_THRESHOLD: Final[float] = 0.3
+"""Lowest similarity of a match, the `pg_trgm.similarity_threshold` default."""
+
+_WORD_RE: Final[re.Pattern[str]] = re.compile(r"[^\W_]+")
+"""A word of letters and digits, like the words of `pg_trgm`."""
+
+
+def get_trigrams(text: str) -> frozenset[str]:
+    """Get the set of trigrams of a text.
+
+    Args:
+        text (str): Any text.
+
+    Returns:
+        frozenset[str]: Trigrams of the padded lowercase words of the text.
+    """
+    trigrams: set[str] = set()
+    for word in _WORD_RE.findall(text.lower()):
+        padded = f"  {word} "
+        trigrams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(trigrams)
+
+
+def trigram_similarity(first: frozenset[str], second: frozenset[str]) -> float:
+    """Get the similarity of two texts from their trigrams.
+
+    Args:
+        first (frozenset[str]): Trigrams of the first text.
+        second (frozenset[str]): Trigrams of the second text.
+
+    Returns:
+        float: From 0 for no common trigrams to 1 for the same trigrams.
+    """
+    if not first or not second:
+        return 0.0
+    common = len(first & second)
+    return common / (len(first) + len(second) - common)
@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Generator of playable six-string voicings of a chord.
+
+The search goes from the sixth string to the first and tries, on every
+string, only the frets that sound a tone of the chord, taken from a table
+of the pitch classes of the fretboard built at import time. Branches are
+cut as soon as they break a rule of a playable voicing:
+
+- the lowest note is the root, no higher string sounds under it;
+- the played strings are adjacent, muted strings are only at the edges;
+- pressed frets fit in `max_stretch` frets and stay under `max_fret`;
+- the remaining strings can still add the missing tones.
+
+A complete voicing has every tone of the chord (the fifth may be left out
+of chords with four or more tones, like in `theory`), at least
+`MIN_VOICING_STRINGS` played strings and a fingering of four fingers, the
+first one possibly as a barre. Results are memoized per chord and
+constraints.
+"""
+
+import functools
+from typing import Final, NamedTuple, TypedDict
+
+from .constants import MAX_FRET, MAX_STRING_NUMBER
+from .packing import PackedPositionDict, encode_fret
+from .theory import (
+    MIN_NOTES_TO_OMIT_FIFTH,
+    PERFECT_FIFTH,
+    STANDARD_TUNING,
+    parse_chord_name,
+)
+from .transposition import get_start_fret
+
+DEFAULT_MAX_STRETCH: Final[int] = 3
+"""Stretch between the lowest and highest pressed frets most hands manage."""
+
+MIN_VOICING_STRINGS: Final[int] = 3
+"""Minimum number of played strings in a voicing."""
+
+FINGERS: Final[int] = 4
+"""Fingers of the fretting hand."""
+
+_FRETS_BY_PITCH_CLASS: Final[tuple[tuple[tuple[int, ...], ...], ...]] = tuple(
+    tuple(
+        tuple(fret for fret in range(MAX_FRET + 1) if (open_note + fret) % 12 == pc)
+        for pc in range(12)
+    )
+    for open_note in STANDARD_TUNING
+)
+"""Frets of every pitch class on every string, from the sixth string."""
+
+
+class VoicingConstraints(NamedTuple):
+    """Limits of the generated voicings.
+
+    Attributes:
+        max_stretch (int): Widest distance between pressed frets.
+        max_fret (int): Highest fret, at most `MAX_FRET`.
+        allow_barre (bool): Allow the first finger to press several
+            strings on the lowest fret.
+    """
+
+    max_stretch: int = DEFAULT_MAX_STRETCH
+    max_fret: int = MAX_FRET
+    allow_barre: bool = True
+
+
+class VoicingDict(TypedDict):
+    """Describe a generated voicing, ready for `ChordService.create_chord`.
+
+    `positions` are in the `ChordPositionSerializer` format, ordered by
+    string number.
+    """
+
+    shape: str
+    start_fret: int
+    has_barre: bool
+    positions: list[PackedPositionDict]
+
+
+def generate_voicings(
+    name: str, constraints: VoicingConstraints | None = None
+) -> list[VoicingDict]:
+    """Generate the playable voicings of a chord.
+
+    Args:
+        name (str): Name of the chord, see `parse_chord_name`.
+        constraints (VoicingConstraints | None): Limits of the voicings,
+            the defaults if None.
+
+    Returns:
+        list[VoicingDict]: Voicings, the lowest on the neck and the fullest
+            first. The dicts are shared between calls and must not be
+            changed.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    root, quality = parse_chord_name(name)
+    return list(_generate(root, quality.intervals, constraints or VoicingConstraints()))
+
+
+@functools.lru_cache(maxsize=1024)
+def _generate(
+    root: int, intervals: tuple[int, ...], constraints: VoicingConstraints
+) -> tuple[VoicingDict, ...]:
+    """Search the voicings of a chord, memoized per chord and constraints."""
+    tones = frozenset((root + interval) % 12 for interval in intervals)
+    optional: frozenset[int] = frozenset()
+    if PERFECT_FIFTH in intervals and len(intervals) >= MIN_NOTES_TO_OMIT_FIFTH:
+        optional = frozenset({(root + PERFECT_FIFTH) % 12})
+    required = tones - optional
+    candidates = [
+        sorted(
+            fret
+            for pc in tones
+            for fret in frets_by_pc[pc]
+            if fret <= constraints.max_fret
+        )
+        for frets_by_pc in _FRETS_BY_PITCH_CLASS
+    ]
+
+    found: list[tuple[tuple[int, ...], list[int], bool]] = []
+
+    def search(frets: list[int], sounded: frozenset[int], bass: int) -> None:
+        string = len(frets)
+        if string == MAX_STRING_NUMBER:
+            played = sum(fret >= 0 for fret in frets)
+            if played >= MIN_VOICING_STRINGS and required <= sounded:
+                fingering = _assign_fingers(frets, constraints.allow_barre)
+                if fingering is not None:
+                    found.append((tuple(frets), fingering[0], fingering[1]))
+            return
+        remaining = MAX_STRING_NUMBER - string
+        if len(required - sounded) > remaining:
+            return
+        started = any(fret >= 0 for fret in frets)
+        if started and frets[-1] < 0:
+            # The played strings ended, the rest are muted too
+            if required <= sounded:
+                search([*frets, -1], sounded, bass)
+            return
+        # Muted before the bass string, or the end of the played strings
+        search([*frets, -1], sounded, bass)
+        pressed = [fret for fret in frets if fret > 0]
+        for fret in candidates[string]:
+            note = STANDARD_TUNING[string] + fret
+            pc = note % 12
+            if (not started and pc != root) or (started and note < bass):
+                continue
+            if fret > 0 and pressed:
+                low, high = min(*pressed, fret), max(*pressed, fret)
+                if high - low > constraints.max_stretch:
+                    continue
+            search([*frets, fret], sounded | {pc}, bass if started else note)
+
+    search([], frozenset(), 0)
+    found.sort(key=lambda v: (max(v[0]), -sum(f >= 0 for f in v[0]), v[2], v[0]))
+    return tuple(_to_voicing(frets, fingers, barre) for frets, fingers, barre in found)
+
+
+def _assign_fingers(
+    frets: list[int], allow_barre: bool
+) -> tuple[list[int], bool] | None:
+    """Assign fingers to the pressed frets, lowest fret and string first.
+
+    If more than four frets are pressed, the first finger presses all the
+    strings on the lowest fret as a barre, which needs every string under
+    it pressed.
+
+    Returns:
+        tuple[list[int], bool] | None: Finger of every string (0 if not
+            pressed) and whether it is a barre, None if it is not playable.
+    """
+    pressed = sorted((fret, string) for string, fret in enumerate(frets) if fret > 0)
+    fingers = [0] * len(frets)
+    if len(pressed) <= FINGERS:
+        for finger, (_, string) in enumerate(pressed, start=1):
+            fingers[string] = finger
+        return fingers, False
+    if not allow_barre:
+        return None
+
+    lowest = pressed[0][0]
+    barre = [string for fret, string in pressed if fret == lowest]
+    others = [string for fret, string in pressed if fret != lowest]
+    covered = range(min(barre), max(barre) + 1)
+    if len(barre) == 1 or len(others) >= FINGERS:
+        return None
+    if any(frets[string] < lowest for string in covered):
+        return None
+    for string in barre:
+        fingers[string] = 1
+    for finger, string in enumerate(others, start=2):
+        fingers[string] = finger
+    return fingers, True
+
+
+def _to_voicing(frets: tuple[int, ...], fingers: list[int], barre: bool) -> VoicingDict:
+    """Build the output of a voicing from its frets, sixth string first."""
+    return {
+        "shape": "".join(encode_fret(fret) for fret in frets),
+        "start_fret": get_start_fret(frets),
+        "has_barre": barre,
+        "positions": [
+            {
+                "string_number": MAX_STRING_NUMBER - string,
+                "fret": frets[string],
+                "finger": fingers[string],
+            }
+            for string in reversed(range(MAX_STRING_NUMBER))
+        ],
+    }
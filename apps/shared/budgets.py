@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Registry of per-endpoint performance budgets.
+
+Every route of the project declares the maximum number of SQL queries and
+the maximum response size of one request. Apps register their budgets in
+an `api/budgets.py` module, which is discovered like `admin.py`. The
+`apps.shared.pytest_budgets` plugin runs the requests against a seeded
+catalog and fails the test suite when a budget is exceeded.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Final, NamedTuple
+
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils.module_loading import autodiscover_modules
+
+BUDGET_EXEMPT_NAMESPACES: Final[frozenset[str]] = frozenset({"admin"})
+"""URL namespaces that are not covered by the budgets."""
+
+
+class EndpointBudget(NamedTuple):
+    """Budget of one request to a route.
+
+    Attributes:
+        route (str): URL name of the route, e.g. `chord-list`.
+        method (str): HTTP method in lower case.
+        max_queries (int): Maximum number of SQL queries.
+        max_bytes (int): Maximum response size regardless of the catalog.
+        bytes_per_item (int): Allowed response bytes per catalog item, for
+            responses that grow with the catalog.
+        url_kwargs (tuple[str, ...]): Names of the URL arguments, provided
+            by the test that seeds the catalog.
+        query (str): Query string without the leading `?`.
+        body (str): Request body.
+        content_type (str): Content type of the body.
+        staff (bool): Send the request as a staff user.
+        status (int): Expected response status.
+    """
+
+    route: str
+    method: str
+    max_queries: int
+    max_bytes: int
+    bytes_per_item: int = 0
+    url_kwargs: tuple[str, ...] = ()
+    query: str = ""
+    body: str = ""
+    content_type: str = "application/json"
+    staff: bool = False
+    status: int = 200
+
+    @property
+    def label(self) -> str:
+        """Readable name of the budget, e.g. `GET chord-list?page_size=50`."""
+        query = f"?{self.query}" if self.query else ""
+        return f"{self.method.upper()} {self.route}{query}"
+
+    def get_max_bytes(self, items: int) -> int:
+        """Get the response size limit for a catalog size.
+
+        Args:
+            items (int): Number of items in the catalog.
+
+        Returns:
+            int: Maximum response size in bytes.
+        """
+        return self.max_bytes + self.bytes_per_item * items
+
+
+_budgets: dict[str, EndpointBudget] = {}
+
+
+def register_budgets(*budgets: EndpointBudget) -> None:
+    """Add budgets to the registry.
+
+    Args:
+        *budgets (EndpointBudget): Budgets of the routes of an app.
+
+    Raises:
+        ValueError: If a budget with the same label is already registered.
+    """
+    for budget in budgets:
+        if budget.label in _budgets and _budgets[budget.label] != budget:
+            raise ValueError(f"Budget {budget.label} is already registered.")
+        _budgets[budget.label] = budget
+
+
+def get_budgets() -> list[EndpointBudget]:
+    """Get the registered budgets, discovering the `api.budgets` modules.
+
+    Returns:
+        list[EndpointBudget]: Budgets ordered by label.
+    """
+    autodiscover_modules("api.budgets")
+    return [budget for _, budget in sorted(_budgets.items())]
+
+
+def get_unbudgeted_routes(urlconf: str | None = None) -> list[str]:
+    """Get the named routes that have no budget.
+
+    Args:
+        urlconf (str | None): The URL configuration, the project one by
+            default.
+
+    Returns:
+        list[str]: Sorted URL names without any registered budget.
+    """
+    budgeted = {budget.route for budget in get_budgets()}
+    routes = set(_iter_route_names(get_resolver(urlconf).url_patterns))
+    return sorted(routes - budgeted)
+
+
+def _iter_route_names(
+    patterns: Iterable[URLPattern | URLResolver], namespace: str = ""
+) -> Iterator[str]:
+    """Yield the names of the routes, with their namespaces."""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace in BUDGET_EXEMPT_NAMESPACES:
+                continue
+            inner = namespace
+            if pattern.namespace:
+                inner = f"{namespace}{pattern.namespace}:"
+            yield from _iter_route_names(pattern.url_patterns, inner)
+        elif pattern.name:
+            yield f"{namespace}{pattern.name}"
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Helpers for conditional HTTP requests (ETag and Last-Modified)."""
+
+from datetime import datetime
+
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+def get_precondition_response(
+    request: Request,
+    *,
+    etag: str,
+    last_modified: datetime,
+) -> Response | None:
+    """Check the request preconditions against the current validators.
+
+    Should be called before loading the resource, so a matching
+    `If-None-Match` or `If-Modified-Since` skips all the work.
+
+    Args:
+        request (Request): The incoming request.
+        etag (str): Current entity tag of the resource (quoted or not).
+        last_modified (datetime): Time of the last change of the resource.
+
+    Returns:
+        Response | None: An empty 304 (or 412) response with the validators
+            set, or None if the resource must be sent in full.
+    """
+    status = _get_precondition_status(
+        request._request, etag=etag, last_modified=last_modified
+    )
+    if status is None:
+        return None
+    response = Response(status=status)
+    set_conditional_headers(response, etag=etag, last_modified=last_modified)
+    return response
+
+
+def get_http_precondition_response(
+    request: HttpRequest,
+    *,
+    etag: str,
+    last_modified: datetime,
+) -> HttpResponse | None:
+    """Check the preconditions of a plain Django request.
+
+    The same as `get_precondition_response`, for views outside DRF (e.g.
+    async views).
+
+    Args:
+        request (HttpRequest): The incoming request.
+        etag (str): Current entity tag of the resource (quoted or not).
+        last_modified (datetime): Time of the last change of the resource.
+
+    Returns:
+        HttpResponse | None: An empty 304 (or 412) response with the
+            validators set, or None if the resource must be sent in full.
+    """
+    status = _get_precondition_status(request, etag=etag, last_modified=last_modified)
+    if status is None:
+        return None
+    response = HttpResponse(status=status)
+    set_conditional_headers(response, etag=etag, last_modified=last_modified)
+    return response
+
+
+def _get_precondition_status(
+    request: HttpRequest,
+    *,
+    etag: str,
+    last_modified: datetime,
+) -> int | None:
+    """Get the status of a failed precondition, None if all of them pass."""
+    conditional = get_conditional_response(
+        request,
+        etag=quote_etag(etag),
+        last_modified=int(last_modified.timestamp()),
+    )
+    if conditional is None:
+        return None
+    return conditional.status_code
+
+
+def set_conditional_headers(
+    response: HttpResponseBase,
+    *,
+    etag: str,
+    last_modified: datetime,
+) -> None:
+    """Set the `ETag` and `Last-Modified` headers on a response.
+
+    Args:
+        response (HttpResponseBase): The outgoing response.
+        etag (str): Entity tag of the resource (quoted or not).
+        last_modified (datetime): Time of the last change of the resource.
+    """
+    response.headers["ETag"] = quote_etag(etag)
+    response.headers["Last-Modified"] = http_date(last_modified.timestamp())
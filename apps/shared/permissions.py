@@ -4,6 +4,7 @@
 
 """Custom permissions."""
 
+from django.http import HttpRequest
 from rest_framework.permissions import SAFE_METHODS, BasePermission
 from rest_framework.request import Request
 from rest_framework.views import APIView
@@ -25,3 +26,20 @@ class IsStaffOrReadOnly(BasePermission):
         if request.method in SAFE_METHODS:
             return True
         return bool(request.user and request.user.is_staff)
+
+    async def ahas_permission(self, request: HttpRequest) -> bool:  # noqa: PLR6301
+        """Check a plain Django request without blocking the event loop.
+
+        The async counterpart of `has_permission` for async views, which
+        run outside DRF. The user is only loaded for unsafe methods.
+
+        Args:
+            request: The incoming request
+
+        Returns:
+            bool: True if request is allowed, False otherwise
+        """
+        if request.method in SAFE_METHODS:
+            return True
+        user = await request.auser()
+        return bool(user and user.is_staff)
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Pytest plugin that enforces the endpoint budgets of `apps.shared.budgets`.
+
+Tests seed a catalog of `--budget-catalog-size` items and call the
+`check_budget` fixture for every budget of their app. A request that runs
+more queries or sends more bytes than its budget fails the test with the
+list of the executed queries.
+"""
+
+from collections.abc import Callable, Mapping
+from typing import Any, cast
+
+import pytest
+from django.db import connection
+from django.http import HttpResponse, HttpResponseBase, StreamingHttpResponse
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.shared.budgets import EndpointBudget
+
+DEFAULT_BUDGET_CATALOG_SIZE = 100
+
+type BudgetChecker = Callable[..., HttpResponseBase]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the catalog size option."""
+    parser.addoption(
+        "--budget-catalog-size",
+        type=int,
+        default=DEFAULT_BUDGET_CATALOG_SIZE,
+        help="Number of catalog items seeded for the endpoint budget tests.",
+    )
+
+
+@pytest.fixture
+def budget_catalog_size(request: pytest.FixtureRequest) -> int:
+    """Get the number of catalog items to seed for the budget tests."""
+    return int(request.config.getoption("--budget-catalog-size"))
+
+
+@pytest.fixture
+def check_budget() -> BudgetChecker:
+    """Fixture providing `run_within_budget`."""
+    return run_within_budget
+
+
+def run_within_budget(
+    client: APIClient,
+    budget: EndpointBudget,
+    *,
+    items: int,
+    url_kwargs: Mapping[str, Any] | None = None,
+) -> HttpResponseBase:
+    """Send the request of a budget and check it stays within the budget.
+
+    Streaming responses are read completely, so their queries are counted.
+
+    Args:
+        client (APIClient): Client, authenticated if the budget needs it.
+        budget (EndpointBudget): The budget.
+        items (int): Number of items in the seeded catalog.
+        url_kwargs (Mapping[str, Any] | None): Values of the URL arguments.
+
+    Returns:
+        HttpResponseBase: The response.
+    """
+    kwargs = {name: (url_kwargs or {})[name] for name in budget.url_kwargs}
+    url = reverse(budget.route, kwargs=kwargs)
+    if budget.query:
+        url = f"{url}?{budget.query}"
+
+    with CaptureQueriesContext(connection) as context:
+        # Streaming views return a StreamingHttpResponse, which the test
+        # client stubs do not cover
+        response = cast(
+            HttpResponseBase,
+            client.generic(
+                budget.method.upper(),
+                url,
+                data=budget.body,
+                content_type=budget.content_type,
+            ),
+        )
+        if isinstance(response, StreamingHttpResponse):
+            content = response.getvalue()
+        else:
+            content = cast(HttpResponse, response).content
+
+    queries = [query["sql"] for query in context.captured_queries]
+    max_bytes = budget.get_max_bytes(items)
+    assert response.status_code == budget.status, (
+        f"{budget.label}: status {response.status_code}, expected {budget.status}"
+    )
+    assert len(queries) <= budget.max_queries, (
+        f"{budget.label}: {len(queries)} queries, budget {budget.max_queries}:\n"
+        + "\n".join(queries)
+    )
+    assert len(content) <= max_bytes, (
+        f"{budget.label}: {len(content)} bytes, budget {max_bytes}"
+    )
+    return response
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from django.http import HttpRequest, HttpResponse
+from django.urls import include, path
+
+from apps.shared.budgets import (
+    EndpointBudget,
+    get_budgets,
+    get_unbudgeted_routes,
+    register_budgets,
+)
+
+
+def _view(request: HttpRequest) -> HttpResponse:
+    """Stand-in view of the test routes."""
+    return HttpResponse()
+
+
+urlpatterns = [
+    path("admin-like/", include(([path("", _view, name="index")], "admin"))),
+    path("api/", include(([path("x/", _view, name="chord-list")], "v1"))),
+    path("unbudgeted/", _view, name="unbudgeted-route"),
+    path("anonymous/", _view),
+]
+
+
+def test_budget_label_and_size_limit() -> None:
+    budget = EndpointBudget(
+        "chord-list", "get", max_queries=1, max_bytes=10, bytes_per_item=3, query="a=1"
+    )
+
+    assert budget.label == "GET chord-list?a=1"
+    assert budget.get_max_bytes(5) == 25
+
+
+def test_chord_budgets_are_discovered() -> None:
+    routes = {budget.route for budget in get_budgets()}
+
+    assert {"chord-list", "chord-detail", "api-root"} <= routes
+
+
+def test_register_rejects_conflicting_budget() -> None:
+    budget = get_budgets()[0]
+    register_budgets(budget)
+
+    with pytest.raises(ValueError, match="already registered"):
+        register_budgets(budget._replace(max_queries=budget.max_queries + 1))
+
+
+def test_get_unbudgeted_routes() -> None:
+    assert get_unbudgeted_routes(__name__) == ["unbudgeted-route", "v1:chord-list"]
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for conditional request helpers."""
+
+from datetime import UTC, datetime
+
+from django.http import HttpResponse
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.shared.conditional import (
+    get_http_precondition_response,
+    get_precondition_response,
+    set_conditional_headers,
+)
+
+LAST_MODIFIED = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def test_precondition_response_none_without_conditions(
+    api_request_factory: APIRequestFactory,
+) -> None:
+    request = Request(api_request_factory.get("/"))
+
+    response = get_precondition_response(
+        request, etag="v1", last_modified=LAST_MODIFIED
+    )
+
+    assert response is None
+
+
+def test_precondition_response_not_modified_for_matching_etag(
+    api_request_factory: APIRequestFactory,
+) -> None:
+    request = Request(api_request_factory.get("/", HTTP_IF_NONE_MATCH='"v1"'))
+
+    response = get_precondition_response(
+        request, etag="v1", last_modified=LAST_MODIFIED
+    )
+
+    assert response is not None
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"v1"'
+
+
+def test_precondition_response_none_for_other_etag(
+    api_request_factory: APIRequestFactory,
+) -> None:
+    request = Request(api_request_factory.get("/", HTTP_IF_NONE_MATCH='"v0"'))
+
+    response = get_precondition_response(
+        request, etag="v1", last_modified=LAST_MODIFIED
+    )
+
+    assert response is None
+
+
+def test_precondition_response_not_modified_since(
+    api_request_factory: APIRequestFactory,
+) -> None:
+    request = Request(
+        api_request_factory.get(
+            "/", HTTP_IF_MODIFIED_SINCE="Thu, 01 Jan 2026 12:00:00 GMT"
+        )
+    )
+
+    response = get_precondition_response(
+        request, etag="v1", last_modified=LAST_MODIFIED
+    )
+
+    assert response is not None
+    assert response.status_code == 304
+
+
+def test_set_conditional_headers() -> None:
+    response = HttpResponse()
+
+    set_conditional_headers(response, etag='"v1"', last_modified=LAST_MODIFIED)
+
+    assert response.headers["ETag"] == '"v1"'
+    assert response.headers["Last-Modified"] == "Thu, 01 Jan 2026 12:00:00 GMT"
+
+
+def test_http_precondition_response_not_modified_for_matching_etag(
+    api_request_factory: APIRequestFactory,
+) -> None:
+    request = api_request_factory.get("/", HTTP_IF_NONE_MATCH='"v1"')
+
+    response = get_http_precondition_response(
+        request, etag="v1", last_modified=LAST_MODIFIED
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"v1"'
+
+
+def test_http_precondition_response_none_for_other_etag(
+    api_request_factory: APIRequestFactory,
+) -> None:
+    request = api_request_factory.get("/", HTTP_IF_NONE_MATCH='"v0"')
+
+    response = get_http_precondition_response(
+        request, etag="v1", last_modified=LAST_MODIFIED
+    )
+
+    assert response is None
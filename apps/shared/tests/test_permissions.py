@@ -4,9 +4,10 @@
 
 """Tests for custom permissions."""
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+from asgiref.sync import async_to_sync
 from django.contrib.auth.models import AnonymousUser
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
@@ -172,3 +173,42 @@ def test_permission_check_with_none_user(
     has_permission = permission.has_permission(drf_request, view)
 
     assert has_permission is False
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("method", "is_staff", "expected"),
+    [
+        ("GET", False, True),
+        ("HEAD", False, True),
+        ("POST", False, False),
+        ("DELETE", False, False),
+        ("POST", True, True),
+    ],
+)
+def test_async_permission(
+    api_request_factory: APIRequestFactory,
+    method: str,
+    is_staff: bool,
+    expected: bool,
+) -> None:
+    permission = IsStaffOrReadOnly()
+    request = api_request_factory.generic(method, "/")
+    request.auser = AsyncMock(return_value=Mock(is_staff=is_staff))
+
+    has_permission = async_to_sync(permission.ahas_permission)(request)
+
+    assert has_permission is expected
+
+
+@pytest.mark.django_db
+def test_async_permission_skips_user_for_safe_methods(
+    api_request_factory: APIRequestFactory,
+) -> None:
+    permission = IsStaffOrReadOnly()
+    request = api_request_factory.get("/")
+    request.auser = AsyncMock()
+
+    async_to_sync(permission.ahas_permission)(request)
+
+    request.auser.assert_not_awaited()
@@ -0,0 +1,8 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Performance benchmarks, run them as modules, e.g.
+
+`python -m benchmarks.chord_output`.
+"""
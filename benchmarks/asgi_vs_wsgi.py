@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Compare the chord read endpoints under WSGI and ASGI.
+
+Requests go through the Django handlers in process, without a server and
+the network, so the numbers show the cost of the handler and the view:
+
+- `wsgi/sync`: the WSGI handler and `ChordViewSet`, requests sent from a
+  pool of threads;
+- `asgi/sync`: the ASGI handler and `ChordViewSet`, which ASGI runs in a
+  worker thread, requests sent as concurrent tasks;
+- `asgi/async`: the ASGI handler and the async views of
+  `apps.chords.api.async_views`.
+
+Every mode runs at several concurrency levels against a throwaway test
+database with a seeded catalog.
+
+Usage:
+    python -m benchmarks.asgi_vs_wsgi [--catalog-size 1000]
+        [--requests 400] [--concurrency 1 8 32]
+"""
+
+import argparse
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Callable
+from functools import partial
+
+import django
+
+from benchmarks.layers import _seed_catalog
+
+CONCURRENCY = (1, 8, 32)
+MODES = ("wsgi/sync", "asgi/sync", "asgi/async")
+SYNC_URL = "/api/v1/data/chords/"
+ASYNC_URL = "/api/v1/data/async/chords/"
+HTTP_OK = 200
+
+
+def _run_threads(url: str, requests: int, concurrency: int) -> None:
+    """Send requests through the WSGI handler from a pool of threads.
+
+    Args:
+        url (str): URL to get.
+        requests (int): Total number of requests.
+        concurrency (int): Number of threads.
+
+    Raises:
+        AssertionError: If a response is not successful.
+    """
+    from django.db import connection  # noqa: PLC0415
+    from django.test import Client  # noqa: PLC0415
+
+    def worker(count: int) -> None:
+        client = Client()
+        try:
+            for _ in range(count):
+                response = client.get(url)
+                assert response.status_code == HTTP_OK, response.status_code
+        finally:
+            connection.close()
+
+    counts = [requests // concurrency] * concurrency
+    for i in range(requests % concurrency):
+        counts[i] += 1
+    threads = [threading.Thread(target=worker, args=(count,)) for count in counts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def _run_tasks(url: str, requests: int, concurrency: int) -> None:
+    """Send requests through the ASGI handler as concurrent tasks.
+
+    Args:
+        url (str): URL to get.
+        requests (int): Total number of requests.
+        concurrency (int): Maximum number of requests in flight.
+
+    Raises:
+        AssertionError: If a response is not successful.
+    """
+    from django.test import AsyncClient  # noqa: PLC0415
+
+    async def main() -> None:
+        client = AsyncClient()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send() -> None:
+            async with semaphore:
+                response = await client.get(url)
+            assert response.status_code == HTTP_OK, response.status_code
+
+        await asyncio.gather(*(send() for _ in range(requests)))
+
+    asyncio.run(main())
+
+
+def _throughput(send: Callable[[], None], requests: int, repeat: int) -> float:
+    """Get the best throughput of several runs.
+
+    Args:
+        send (Callable[[], None]): Function sending all the requests.
+        requests (int): Number of requests sent by one call.
+        repeat (int): Number of runs.
+
+    Returns:
+        float: Requests per second.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        send()
+        best = min(best, time.perf_counter() - start)
+    return requests / best
+
+
+def run(
+    catalog_size: int, requests: int, concurrency: tuple[int, ...], repeat: int
+) -> None:
+    """Run the benchmark in a test database and print a table of results.
+
+    Args:
+        catalog_size (int): Number of chords in the catalog.
+        requests (int): Requests per run.
+        concurrency (tuple[int, ...]): Concurrency levels.
+        repeat (int): Number of runs, the best one is reported.
+    """
+    from django.db import connection  # noqa: PLC0415
+    from django.test.utils import setup_test_environment  # noqa: PLC0415
+
+    from apps.chords.models import Chord  # noqa: PLC0415
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        _seed_catalog(catalog_size, 0)
+        chord_id = Chord.objects.values_list("pk", flat=True).first()
+        endpoints = {
+            "list": (SYNC_URL, ASYNC_URL),
+            "detail": (f"{SYNC_URL}{chord_id}/", f"{ASYNC_URL}{chord_id}/"),
+        }
+        print(f"{'endpoint':<8} {'mode':<11} {'concurrency':>11} {'req/s':>10}")
+        for endpoint, (sync_url, async_url) in endpoints.items():
+            for level in concurrency:
+                senders: dict[str, Callable[[], None]] = {
+                    "wsgi/sync": partial(_run_threads, sync_url, requests, level),
+                    "asgi/sync": partial(_run_tasks, sync_url, requests, level),
+                    "asgi/async": partial(_run_tasks, async_url, requests, level),
+                }
+                for mode in MODES:
+                    rate = _throughput(senders[mode], requests, repeat)
+                    print(f"{endpoint:<8} {mode:<11} {level:>11} {rate:>10.0f}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def main() -> None:
+    """Parse the command line and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--catalog-size", type=int, default=1_000)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(CONCURRENCY))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+    run(args.catalog_size, args.requests, tuple(args.concurrency), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Compare ChordOutputSerializer with the pydantic fast output path.
+
+Both paths render the same chord list to JSON bytes: the DRF one from Chord
+instances, the fast one from `.values()` rows. The data is built in memory,
+so only the serialization is measured, not the database.
+
+Usage:
+    python -m benchmarks.chord_output [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+import django
+
+SIZES = (1_000, 10_000, 100_000)
+PACKED_AM = "100211322423500600"
+
+
+def _best_time(func: Callable[[], bytes], repeat: int) -> tuple[float, bytes]:
+    """Run a function several times.
+
+    Args:
+        func (Callable[[], bytes]): The function to measure.
+        repeat (int): Number of runs.
+
+    Returns:
+        tuple[float, bytes]: The best time in seconds and the last result.
+    """
+    best = float("inf")
+    result = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(sizes: tuple[int, ...], repeat: int) -> None:
+    """Run the benchmark and print a table of results.
+
+    Args:
+        sizes (tuple[int, ...]): Numbers of chords to serialize.
+        repeat (int): Number of runs per size, the best one is reported.
+
+    Raises:
+        AssertionError: If the two paths produce different bytes.
+    """
+    from rest_framework.renderers import JSONRenderer  # noqa: PLC0415
+
+    from apps.chords.api.fast_output import (  # noqa: PLC0415
+        build_chord_output,
+        dump_chord_list,
+    )
+    from apps.chords.api.serializers import ChordOutputSerializer  # noqa: PLC0415
+    from apps.chords.models import Chord  # noqa: PLC0415
+
+    print(f"{'chords':>8} {'drf, ms':>10} {'fast, ms':>10} {'speedup':>8}")
+    for size in sizes:
+        rows: list[dict[str, Any]] = [
+            {
+                "id": i,
+                "title": f"Am{i}",
+                "musical_title": "A minor",
+                "order_in_note": i % 10 + 1,
+                "start_fret": 1,
+                "has_barre": bool(i % 2),
+                "packed_positions": PACKED_AM,
+            }
+            for i in range(1, size + 1)
+        ]
+        chords = [Chord(**row) for row in rows]
+
+        drf_time, drf_content = _best_time(
+            lambda: JSONRenderer().render(
+                ChordOutputSerializer(chords, many=True).data  # noqa: B023
+            ),
+            repeat,
+        )
+        fast_time, fast_content = _best_time(
+            lambda: dump_chord_list(build_chord_output(rows)),  # noqa: B023
+            repeat,
+        )
+        if drf_content != fast_content:
+            raise AssertionError(f"Outputs differ for {size} chords")
+        print(
+            f"{size:>8} {drf_time * 1000:>10.1f} {fast_time * 1000:>10.1f} "
+            f"{drf_time / fast_time:>7.1f}x"
+        )
+
+
+def main() -> None:
+    """Parse the command line and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+    run(tuple(args.sizes), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Micro-benchmarks of the service, selector and serializer layers.
+
+Every benchmark is timed at several catalog sizes against a throwaway test
+database, so the numbers show how the cost of each layer grows with the
+catalog. Writes run in rolled back transactions and do not change the
+catalog between runs. The results are saved as JSON and compared with the
+stored baseline; the command fails if any benchmark is slower than the
+baseline by more than the threshold.
+
+Baselines depend on the machine: refresh the stored one with
+`--save-baseline` on the machine the comparison runs on.
+
+Usage:
+    python -m benchmarks.layers [--sizes 100 1000 10000] [--output FILE]
+        [--baseline FILE] [--threshold 0.25] [--save-baseline]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import django
+
+from benchmarks.results import (
+    DEFAULT_THRESHOLD,
+    compare_results,
+    format_comparisons,
+    load_results,
+    new_results,
+    save_results,
+)
+
+if TYPE_CHECKING:
+    from apps.chords.packing import PackedPositionDict
+
+SIZES = (100, 1_000, 10_000)
+BASELINE_PATH = Path(__file__).parent / "baselines" / "layers.json"
+SINGLE_ROW_NUMBER = 20
+"""Calls per timing of the benchmarks that touch a single chord."""
+
+AM_POSITIONS: tuple["PackedPositionDict", ...] = (
+    {"string_number": 1, "fret": 0, "finger": 0},
+    {"string_number": 2, "fret": 1, "finger": 1},
+    {"string_number": 3, "fret": 2, "finger": 3},
+    {"string_number": 4, "fret": 2, "finger": 2},
+    {"string_number": 5, "fret": 0, "finger": 0},
+    {"string_number": 6, "fret": -1, "finger": 0},
+)
+
+
+def _best_time(func: Callable[[], Any], repeat: int, number: int = 1) -> float:
+    """Time a function.
+
+    Args:
+        func (Callable[[], Any]): The function to measure.
+        repeat (int): Number of timings, the best one is reported.
+        number (int): Calls per timing.
+
+    Returns:
+        float: The best time of one call in seconds.
+    """
+    return min(timeit.Timer(func).repeat(repeat=repeat, number=number)) / number
+
+
+def _seed_catalog(count: int, start: int) -> None:
+    """Add chords with packed and row positions to the catalog.
+
+    Args:
+        count (int): Number of chords to add.
+        start (int): Number of the first chord, for unique titles.
+    """
+    from apps.chords.models import Chord, ChordPosition  # noqa: PLC0415
+    from apps.chords.packing import pack_positions  # noqa: PLC0415
+    from apps.chords.shapes import shape_from_packed  # noqa: PLC0415
+
+    packed = pack_positions(AM_POSITIONS)
+    chords = Chord.objects.bulk_create(
+        Chord(
+            title=f"Am{i // 10}",
+            musical_title="A minor",
+            order_in_note=i % 10 + 1,
+            packed_positions=packed,
+            shape=shape_from_packed(packed),
+        )
+        for i in range(start, start + count)
+    )
+    ChordPosition.objects.bulk_create(
+        ChordPosition(chord=chord, **position)
+        for chord in chords
+        for position in AM_POSITIONS
+    )
+
+
+def _rolled_back(func: Callable[[], Any]) -> Callable[[], None]:
+    """Wrap a function to run it in a transaction that is rolled back."""
+    from django.db import transaction  # noqa: PLC0415
+
+    def wrapper() -> None:
+        with transaction.atomic():
+            func()
+            transaction.set_rollback(True)
+
+    return wrapper
+
+
+def _measure(size: int, repeat: int) -> dict[str, float]:
+    """Time every benchmark against the current catalog.
+
+    Args:
+        size (int): Number of chords in the catalog.
+        repeat (int): Number of timings per benchmark.
+
+    Returns:
+        dict[str, float]: Seconds per call by benchmark name.
+    """
+    from apps.chords.api.serializers import ChordOutputSerializer  # noqa: PLC0415
+    from apps.chords.selectors import (  # noqa: PLC0415
+        get_all_chords,
+        get_full_chord_by_id,
+    )
+    from apps.chords.services import ChordService  # noqa: PLC0415
+    from apps.schemes.api.serializers import ImageSchemeSerializer  # noqa: PLC0415
+    from apps.schemes.models import ImageScheme  # noqa: PLC0415
+
+    chords = list(get_all_chords())
+    chord = chords[size // 2]
+    schemes = [
+        ImageScheme(
+            pk=i,
+            code=f"scheme-{i}",
+            inscription="Бой шестёрка",
+            image=f"lesson_schemes/scheme-{i}.png",
+            height=120,
+            width=480,
+        )
+        for i in range(1, size + 1)
+    ]
+    benchmarks: dict[str, tuple[Callable[[], Any], int]] = {
+        "service.create_chord": (
+            _rolled_back(
+                lambda: ChordService.create_chord(
+                    positions=list(AM_POSITIONS),
+                    chord_fields={
+                        "title": "Bench",
+                        "musical_title": "Bench",
+                        "order_in_note": 1,
+                        "start_fret": 1,
+                        "has_barre": False,
+                    },
+                )
+            ),
+            SINGLE_ROW_NUMBER,
+        ),
+        "service.update_chord": (
+            _rolled_back(
+                lambda: ChordService.update_chord(
+                    chord=chord,
+                    data={"title": "Bench", "positions": list(AM_POSITIONS)},
+                )
+            ),
+            SINGLE_ROW_NUMBER,
+        ),
+        "selector.get_all_chords": (lambda: list(get_all_chords()), 1),
+        "selector.get_full_chord_by_id": (
+            lambda: get_full_chord_by_id(chord_id=chord.pk),
+            SINGLE_ROW_NUMBER,
+        ),
+        "serializer.ChordOutputSerializer": (
+            lambda: ChordOutputSerializer(chords, many=True).data,
+            1,
+        ),
+        "serializer.ImageSchemeSerializer": (
+            lambda: ImageSchemeSerializer(schemes, many=True).data,
+            1,
+        ),
+    }
+    return {
+        name: _best_time(func, repeat, number)
+        for name, (func, number) in benchmarks.items()
+    }
+
+
+def run(sizes: tuple[int, ...], repeat: int) -> dict[str, dict[str, float]]:
+    """Run all benchmarks at all catalog sizes in a test database.
+
+    Args:
+        sizes (tuple[int, ...]): Catalog sizes, the catalog grows between
+            them.
+        repeat (int): Number of timings per benchmark.
+
+    Returns:
+        dict[str, dict[str, float]]: Seconds per call by benchmark and size.
+    """
+    from django.db import connection  # noqa: PLC0415
+
+    timings: dict[str, dict[str, float]] = {}
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        seeded = 0
+        for size in sorted(sizes):
+            _seed_catalog(size - seeded, seeded)
+            seeded = size
+            for name, seconds in _measure(size, repeat).items():
+                timings.setdefault(name, {})[str(size)] = seconds
+                print(f"{name:<36} {size:>7} {seconds * 1000:>10.3f} ms")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+    return timings
+
+
+def main() -> int:
+    """Parse the command line, run the benchmarks and compare the results.
+
+    Returns:
+        int: Exit status, 1 if there are regressions.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="File to save the results to.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing.",
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+    results = new_results(run(tuple(args.sizes), args.repeat))
+    if args.output:
+        save_results(args.output, results)
+    if args.save_baseline:
+        save_results(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, nothing to compare with")
+        return 0
+
+    comparisons = compare_results(results, load_results(args.baseline))
+    print()
+    print(format_comparisons(comparisons, args.threshold))
+    regressions = [c for c in comparisons if c.is_regression(args.threshold)]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
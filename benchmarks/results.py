@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""JSON results of benchmarks and their comparison with a baseline.
+
+A results file maps benchmark names to the best time in seconds per
+catalog size, next to a description of the environment it was measured in:
+
+    {
+        "environment": {"python": "3.12.1", ...},
+        "timings": {"selector.get_all_chords": {"100": 0.0012, ...}, ...}
+    }
+"""
+
+import json
+import platform
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import NamedTuple, TypedDict
+
+import django
+
+DEFAULT_THRESHOLD = 0.25
+"""Slowdown (as a fraction of the baseline) reported as a regression."""
+
+
+class BenchmarkResultsDict(TypedDict):
+    """Describe a results file."""
+
+    environment: dict[str, str]
+    timings: dict[str, dict[str, float]]
+
+
+class Comparison(NamedTuple):
+    """Timing of one benchmark at one size against the baseline."""
+
+    name: str
+    size: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current time relative to the baseline one."""
+        return self.current / self.baseline
+
+    def is_regression(self, threshold: float) -> bool:
+        """Check if the benchmark got slower than the threshold allows.
+
+        Args:
+            threshold (float): Allowed slowdown, e.g. 0.25 for 25%.
+
+        Returns:
+            bool: True if the current time exceeds the allowed one.
+        """
+        return self.ratio > 1 + threshold
+
+
+def new_results(timings: dict[str, dict[str, float]]) -> BenchmarkResultsDict:
+    """Wrap timings with the description of the current environment.
+
+    Args:
+        timings (dict[str, dict[str, float]]): Seconds by benchmark and size.
+
+    Returns:
+        BenchmarkResultsDict: The results.
+    """
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "measured_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        },
+        "timings": timings,
+    }
+
+
+def save_results(path: Path, results: BenchmarkResultsDict) -> None:
+    """Write results to a JSON file, creating its directory.
+
+    Args:
+        path (Path): The file.
+        results (BenchmarkResultsDict): The results.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+def load_results(path: Path) -> BenchmarkResultsDict:
+    """Read results from a JSON file.
+
+    Args:
+        path (Path): The file.
+
+    Returns:
+        BenchmarkResultsDict: The results.
+    """
+    results: BenchmarkResultsDict = json.loads(path.read_text(encoding="utf-8"))
+    return results
+
+
+def compare_results(
+    current: BenchmarkResultsDict, baseline: BenchmarkResultsDict
+) -> list[Comparison]:
+    """Pair the timings present in both results.
+
+    Args:
+        current (BenchmarkResultsDict): The new results.
+        baseline (BenchmarkResultsDict): The stored baseline.
+
+    Returns:
+        list[Comparison]: Comparisons ordered by benchmark name and size.
+    """
+    comparisons = []
+    for name, sizes in sorted(current["timings"].items()):
+        baseline_sizes = baseline["timings"].get(name, {})
+        for size, seconds in sorted(sizes.items(), key=lambda item: int(item[0])):
+            if baseline_sizes.get(size):
+                comparisons.append(
+                    Comparison(name, size, baseline_sizes[size], seconds)
+                )
+    return comparisons
+
+
+def format_comparisons(comparisons: list[Comparison], threshold: float) -> str:
+    """Format comparisons as a table, marking regressions.
+
+    Args:
+        comparisons (list[Comparison]): The comparisons.
+        threshold (float): Allowed slowdown.
+
+    Returns:
+        str: The table.
+    """
+    lines = [f"{'benchmark':<36} {'size':>7} {'base, ms':>10} {'now, ms':>10} ratio"]
+    for c in comparisons:
+        mark = "  REGRESSION" if c.is_regression(threshold) else ""
+        lines.append(
+            f"{c.name:<36} {c.size:>7} {c.baseline * 1000:>10.3f} "
+            f"{c.current * 1000:>10.3f} {c.ratio:>5.2f}{mark}"
+        )
+    return "\n".join(lines)
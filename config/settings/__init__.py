@@ -23,6 +23,12 @@ ALLOWED_HOSTS = settings.ALLOWED_HOSTS or (["*"] if DEBUG else [])
 TEMPLATES = settings.TEMPLATES
 
 DATABASES = {"default": dj_database_url.parse(settings.DATABASE_URL, conn_max_age=600)}
+CACHES = {
+    "default": {
+        "BACKEND": settings.CACHE_BACKEND,
+        "LOCATION": settings.CACHE_LOCATION,
+    }
+}
 
 INSTALLED_APPS = [
     "django.contrib.admin",
@@ -31,6 +37,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "apps.accounts",
     "apps.chords",
@@ -58,6 +65,9 @@ STATIC_ROOT = Path(settings.BASE_DIR) / "staticfiles"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = Path(settings.BASE_DIR) / "media"
 
+CHORD_DIAGRAM_ROOT = MEDIA_ROOT / "chord_diagrams"
+CHORD_DIAGRAM_WORKERS = settings.CHORD_DIAGRAM_WORKERS
+
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
 USE_I18N = True
@@ -39,6 +39,11 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     ALLOWED_HOSTS: list[str] = []
 
+    CACHE_BACKEND: str = "django.core.cache.backends.locmem.LocMemCache"
+    CACHE_LOCATION: str = ""
+
+    CHORD_DIAGRAM_WORKERS: int = 2
+
     TEMPLATES: list[_TemplateBackend] = [
         {
             "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -12,6 +12,8 @@ from rest_framework.test import APIRequestFactory
 from apps.accounts.models.user import User
 from apps.accounts.tests.factories.user import UserFactory
 
+pytest_plugins = ("apps.shared.pytest_budgets",)
+
 ########################
 # Global Django instances
 ########################